@@ -1,3 +1,6 @@
+import os
+from datetime import timedelta
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
@@ -41,7 +44,13 @@ def get_idempotency_service(
     idempotency_repo: IdempotencyRepository = Depends(get_idempotency_repository),
 ) -> IdempotencyService:
     """IdempotencyService 의존성 주입"""
-    return IdempotencyService(db=db, idempotency_repo=idempotency_repo)
+    # IDEMPOTENCY_TTL_SECONDS로 기본 보관 기간 조정 (미설정 시 서비스 기본값 24시간)
+    ttl_seconds = os.getenv("IDEMPOTENCY_TTL_SECONDS")
+    return IdempotencyService(
+        db=db,
+        idempotency_repo=idempotency_repo,
+        default_ttl=timedelta(seconds=int(ttl_seconds)) if ttl_seconds else None
+    )
 
 
 def get_membership_service(
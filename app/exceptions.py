@@ -99,6 +99,7 @@ def translate_message(message: str) -> str:
         "can only be performed for IN_PROGRESS events": "진행 중인 이벤트에만 수행할 수 있습니다",
         "not found for this event": "이 이벤트에서 찾을 수 없습니다",
         "Duplicate proposal": "중복된 제안",
+        "Proposal target unavailable": "제안 대상이 없거나 삭제되었습니다",
         "Assumption is deleted": "전제가 삭제되었습니다",
         "Invalid proposal_content": "잘못된 제안 내용",
         "Missing proposal_content": "제안 내용이 없습니다",
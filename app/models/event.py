@@ -3,7 +3,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from sqlalchemy import (
     String, Boolean, Integer, DateTime, ForeignKey, Text, CheckConstraint,
-    UniqueConstraint, Index, func
+    UniqueConstraint, Index, func, text
 )
 from sqlalchemy.dialects.postgresql import UUID, ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -80,6 +80,10 @@ class Event(Base):
         nullable=False
     )
     max_membership: Mapped[int] = mapped_column(Integer, nullable=False)
+    # ACCEPTED 멤버십 수 (event_memberships 트리거가 갱신하는 비정규화 컬럼)
+    accepted_member_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
     
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
@@ -123,6 +127,12 @@ class EventMembership(Base):
         UniqueConstraint("user_id", "event_id", name="uq_event_memberships_user_event"),
         Index("idx_event_memberships_event_id", "event_id"),
         Index("idx_event_memberships_user_id", "user_id"),
+        # ACCEPTED 멤버 수 집계용 부분 인덱스 (참가자 수 COUNT를 index-only scan으로 처리)
+        Index(
+            "idx_event_memberships_event_accepted",
+            "event_id",
+            postgresql_where=text("membership_status = 'ACCEPTED'")
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -2,12 +2,13 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 from sqlalchemy import (
-    String, DateTime, Integer, Text, Index, func
+    String, DateTime, Integer, Text, Index, func, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db import Base
+from app.utils.uuid7 import uuid7
 
 
 class OutboxStatusType(PyEnum):
@@ -19,18 +20,25 @@ class OutboxStatusType(PyEnum):
 class OutboxEvent(Base):
     __tablename__ = "outbox_events"
     __table_args__ = (
-        Index("idx_outbox_status_next_retry", "status", "next_retry_at"),  # 필수 인덱스
+        # 워커 선점용: PENDING 행만 인덱싱 (DONE/FAILED 행은 쌓여도 인덱스에 포함되지 않음)
+        Index(
+            "idx_outbox_pending_created_at",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'")
+        ),
         Index("idx_outbox_event_type", "event_type"),  # 선택: 모니터링용
         Index("idx_outbox_target_event_id", "target_event_id", "id"),  # SSE용 복합 인덱스
     )
 
+    # UUIDv7(시간순): PK 인덱스에 순차 삽입되고, 같은 트랜잭션(created_at 동일) 이벤트도 id로 생성 순서 유지
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     event_type: Mapped[str] = mapped_column(String(100), nullable=False)  # "proposal.approved.v1"
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # 조회는 idx_outbox_target_event_id(target_event_id, id)의 선두 컬럼으로 처리 (단일 컬럼 인덱스 없음)
     target_event_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), nullable=False, index=True
+        UUID(as_uuid=True), nullable=False
     )
     
     status: Mapped[OutboxStatusType] = mapped_column(
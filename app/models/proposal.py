@@ -4,7 +4,7 @@ from enum import Enum as PyEnum
 from sqlalchemy import (
     Text, DateTime, ForeignKey, CheckConstraint,
     # UniqueConstraint, 
-    Index, func
+    Index, func, text
 )
 from sqlalchemy.dialects.postgresql import UUID, ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -68,6 +68,14 @@ class AssumptionProposal(Base, ProposalBase):
         ),
         Index("idx_assumption_proposals_event_id", "event_id"),
         Index("idx_assumption_proposals_assumption_id", "assumption_id"),
+        # 사용자별 PENDING 제안 중복 방지 (PENDING 행만 인덱싱, 생성 시 ON CONFLICT 중재 인덱스)
+        Index(
+            "uq_assumption_proposals_pending_user",
+            "created_by", "event_id", "assumption_id",
+            unique=True,
+            postgresql_where=text("proposal_status = 'PENDING'"),
+            postgresql_nulls_not_distinct=True,  # CREATION 제안(대상 id NULL)도 중복으로 취급
+        ),
     )
 
     event_id: Mapped[uuid.UUID] = mapped_column(
@@ -114,6 +122,14 @@ class CriteriaProposal(Base, ProposalBase):
         ),
         Index("idx_criteria_proposals_event_id", "event_id"),
         Index("idx_criteria_proposals_criteria_id", "criteria_id"),
+        # 사용자별 PENDING 제안 중복 방지 (PENDING 행만 인덱싱, 생성 시 ON CONFLICT 중재 인덱스)
+        Index(
+            "uq_criteria_proposals_pending_user",
+            "created_by", "event_id", "criteria_id",
+            unique=True,
+            postgresql_where=text("proposal_status = 'PENDING'"),
+            postgresql_nulls_not_distinct=True,  # CREATION 제안(대상 id NULL)도 중복으로 취급
+        ),
     )
 
     event_id: Mapped[uuid.UUID] = mapped_column(
@@ -151,6 +167,13 @@ class ConclusionProposal(Base, ProposalBase):
     __table_args__ = (
         # UniqueConstraint("criterion_id", "created_by", name="uq_conclusion_proposals_criterion_user"),
         Index("idx_conclusion_proposals_criterion_id", "criterion_id"),
+        # 사용자별 PENDING 제안 중복 방지 (PENDING 행만 인덱싱, 생성 시 ON CONFLICT 중재 인덱스)
+        Index(
+            "uq_conclusion_proposals_pending_user",
+            "created_by", "criterion_id",
+            unique=True,
+            postgresql_where=text("proposal_status = 'PENDING'"),
+        ),
     )
 
     criterion_id: Mapped[uuid.UUID] = mapped_column(
@@ -1,4 +1,6 @@
 from typing import List
+from datetime import datetime, timezone
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from uuid import UUID
@@ -12,27 +14,67 @@ class AssumptionRepository:
     def create_assumptions(self, assumptions: List[Assumption]) -> List[Assumption]:
         """전제들을 생성"""
         self.db.add_all(assumptions)
-        self.db.flush()  # ID를 얻기 위해 flush만 수행 (commit은 Service에서)
-        for assumption in assumptions:
-            self.db.refresh(assumption)
+        # 한 번의 multi-row INSERT ... RETURNING으로 저장 (commit은 Service에서)
+        # server_default 컬럼(created_at, is_deleted 등)도 RETURNING으로 채워지므로 행별 refresh 불필요
+        self.db.flush()
         return assumptions
 
     def get_by_id(self, assumption_id: UUID) -> Assumption | None:
-        """전제 ID로 조회"""
-        from sqlalchemy import select
-        stmt = select(Assumption).where(Assumption.id == assumption_id)
-        result = self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        """
+        전제 ID로 조회
+        - 세션 identity map을 먼저 확인하므로 같은 요청에서 이미 로드된 전제는 SELECT 없이 반환
+        """
+        return self.db.get(Assumption, assumption_id)
 
     def update_assumption(self, assumption: Assumption, updated_by: UUID) -> Assumption:
         """전제 업데이트"""
-        from datetime import datetime, timezone
         assumption.updated_at = datetime.now(timezone.utc)
         assumption.updated_by = updated_by
         self.db.flush()  # commit은 Service에서 수행
         self.db.refresh(assumption)
         return assumption
 
+    def modify_content(
+        self, assumption_id: UUID, new_content: str, updated_by: UUID
+    ) -> UUID | None:
+        """
+        전제 내용 수정 (단일 UPDATE, 사전 조회 없음)
+        - 기존 content를 original_content로 보존하고 is_modified=True
+        - 대상이 없거나 이미 삭제됐으면 None 반환
+        """
+        stmt = (
+            update(Assumption)
+            .where(Assumption.id == assumption_id, Assumption.is_deleted.is_(False))
+            .values(
+                original_content=Assumption.content,
+                content=new_content,
+                is_modified=True,
+                updated_at=datetime.now(timezone.utc),
+                updated_by=updated_by
+            )
+            .returning(Assumption.id)
+        )
+        result = self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    def soft_delete(self, assumption_id: UUID, updated_by: UUID) -> UUID | None:
+        """
+        전제 소프트 삭제 (단일 UPDATE, 사전 조회 없음)
+        - 대상이 없거나 이미 삭제됐으면 None 반환
+        """
+        stmt = (
+            update(Assumption)
+            .where(Assumption.id == assumption_id, Assumption.is_deleted.is_(False))
+            .values(
+                is_deleted=True,
+                updated_at=datetime.now(timezone.utc),
+                updated_by=updated_by
+            )
+            .returning(Assumption.id)
+        )
+        result = self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     def delete_assumption(self, assumption: Assumption) -> None:
         """전제 삭제"""
         self.db.delete(assumption)
@@ -1,4 +1,5 @@
 from typing import List
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func
 from uuid import UUID
@@ -44,7 +45,6 @@ class CommentRepository:
 
     def update_comment(self, comment: Comment) -> Comment:
         """코멘트 수정"""
-        from datetime import datetime, timezone
         comment.updated_at = datetime.now(timezone.utc)
         self.db.flush()  # commit은 Service에서 수행
         self.db.refresh(comment)
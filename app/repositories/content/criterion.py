@@ -1,4 +1,6 @@
 from typing import List
+from datetime import datetime, timezone
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.models.content import Criterion
@@ -11,22 +13,61 @@ class CriterionRepository:
     def create_criteria(self, criteria: List[Criterion]) -> List[Criterion]:
         """기준들을 생성"""
         self.db.add_all(criteria)
-        self.db.flush()  # ID를 얻기 위해 flush만 수행 (commit은 Service에서)
-        for criterion in criteria:
-            self.db.refresh(criterion)
+        # 한 번의 multi-row INSERT ... RETURNING으로 저장 (commit은 Service에서)
+        # server_default 컬럼(created_at, is_deleted 등)도 RETURNING으로 채워지므로 행별 refresh 불필요
+        self.db.flush()
         return criteria
 
     def get_by_id(self, criterion_id: UUID) -> Criterion | None:
-        """기준 ID로 조회"""
-        from sqlalchemy import select
-        from uuid import UUID
-        stmt = select(Criterion).where(Criterion.id == criterion_id)
+        """
+        기준 ID로 조회
+        - 세션 identity map을 먼저 확인하므로 같은 요청에서 이미 로드된 기준은 SELECT 없이 반환
+        """
+        return self.db.get(Criterion, criterion_id)
+
+    def modify_content(
+        self, criterion_id: UUID, new_content: str, updated_by: UUID
+    ) -> UUID | None:
+        """
+        기준 내용 수정 (단일 UPDATE, 사전 조회 없음)
+        - 기존 content를 original_content로 보존하고 is_modified=True
+        - 대상이 없거나 이미 삭제됐으면 None 반환
+        """
+        stmt = (
+            update(Criterion)
+            .where(Criterion.id == criterion_id, Criterion.is_deleted.is_(False))
+            .values(
+                original_content=Criterion.content,
+                content=new_content,
+                is_modified=True,
+                updated_at=datetime.now(timezone.utc),
+                updated_by=updated_by
+            )
+            .returning(Criterion.id)
+        )
+        result = self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    def soft_delete(self, criterion_id: UUID, updated_by: UUID) -> UUID | None:
+        """
+        기준 소프트 삭제 (단일 UPDATE, 사전 조회 없음)
+        - 대상이 없거나 이미 삭제됐으면 None 반환
+        """
+        stmt = (
+            update(Criterion)
+            .where(Criterion.id == criterion_id, Criterion.is_deleted.is_(False))
+            .values(
+                is_deleted=True,
+                updated_at=datetime.now(timezone.utc),
+                updated_by=updated_by
+            )
+            .returning(Criterion.id)
+        )
         result = self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     def update_criterion(self, criterion: Criterion, updated_by: UUID) -> Criterion:
         """기준 업데이트"""
-        from datetime import datetime, timezone
         criterion.updated_at = datetime.now(timezone.utc)
         criterion.updated_by = updated_by
         self.db.flush()  # commit은 Service에서 수행
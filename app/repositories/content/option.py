@@ -1,4 +1,6 @@
 from typing import List
+from datetime import datetime, timezone
+from sqlalchemy import select
 from uuid import UUID
 from sqlalchemy.orm import Session
 
@@ -12,21 +14,19 @@ class OptionRepository:
     def create_options(self, options: List[Option]) -> List[Option]:
         """선택지들을 생성"""
         self.db.add_all(options)
-        self.db.flush()  # ID를 얻기 위해 flush만 수행 (commit은 Service에서)
-        for option in options:
-            self.db.refresh(option)
+        # multi-row INSERT로 일괄 저장 (commit은 Service에서)
+        # 유일한 server_default인 created_at은 RETURNING으로 받아오므로 refresh하지 않음
+        self.db.flush()
         return options
 
     def get_by_id(self, option_id: UUID) -> Option | None:
         """선택지 ID로 조회"""
-        from sqlalchemy import select
         stmt = select(Option).where(Option.id == option_id)
         result = self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     def update_option(self, option: Option) -> Option:
         """선택지 업데이트"""
-        from datetime import datetime, timezone
         option.updated_at = datetime.now(timezone.utc)
         self.db.flush()  # commit은 Service에서 수행
         self.db.refresh(option)
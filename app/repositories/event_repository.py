@@ -1,4 +1,5 @@
 from typing import List, Dict
+from datetime import datetime, timezone
 from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import select, func
@@ -138,7 +139,6 @@ class EventRepository:
 
     def update_event(self, event: Event) -> Event:
         """이벤트 업데이트"""
-        from datetime import datetime, timezone
         event.updated_at = datetime.now(timezone.utc)
         self.db.flush()  # commit은 Service에서 수행
         self.db.refresh(event)
@@ -1,5 +1,5 @@
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import select
@@ -28,7 +28,6 @@ class IdempotencyRepository:
         - UNIQUE 충돌 시 rollback 후 None 반환
         - 성공 시 IN_PROGRESS 상태의 레코드 생성 및 반환
         """
-        from datetime import timezone
         expires_at = datetime.now(timezone.utc) + ttl
         
         record = IdempotencyRecord(
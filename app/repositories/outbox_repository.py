@@ -1,4 +1,4 @@
-from sqlalchemy import select, update
+from sqlalchemy import select, update, insert
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
@@ -6,11 +6,14 @@ import os
 import socket
 
 from app.models.outbox import OutboxEvent, OutboxStatusType
+from app.utils.uuid7 import uuid7
 
 
 class OutboxRepository:
     def __init__(self, db: Session):
         self.db = db
+        # 트랜잭션 범위 지연 버퍼 (buffer_event로 쌓고 commit 직전 flush_buffered_events로 일괄 INSERT)
+        self._pending: list[dict] = []
     
     def create_outbox_event(
         self,
@@ -35,6 +38,45 @@ class OutboxRepository:
         self.db.flush()
         return event
     
+    def buffer_event(
+        self,
+        event_type: str,
+        payload: dict,
+        target_event_id: UUID,
+        next_retry_at: datetime | None = None
+    ) -> None:
+        """
+        outbox 이벤트를 버퍼에 추가 (INSERT는 flush_buffered_events에서 일괄 수행)
+        - transaction(db, outbox_repo)가 commit 직전에 flush하므로 같은 트랜잭션에 기록됨
+        """
+        if next_retry_at is None:
+            next_retry_at = datetime.now(timezone.utc)
+        
+        self._pending.append({
+            "id": uuid7(),  # 버퍼 순서 = id 순서 (SSE 커서 정렬 유지)
+            "event_type": event_type,
+            "payload": payload,
+            "target_event_id": target_event_id,
+            "status": OutboxStatusType.PENDING,
+            "attempts": 0,
+            "next_retry_at": next_retry_at,
+        })
+    
+    def flush_buffered_events(self) -> None:
+        """
+        버퍼에 쌓인 outbox 이벤트를 일괄 INSERT로 저장
+        - executemany 형태로 넘겨 행 수와 무관하게 컴파일된 INSERT를 재사용
+          (insertmanyvalues가 단일 multi-row INSERT 왕복으로 묶음)
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self.db.execute(insert(OutboxEvent), pending)
+    
+    def clear_buffered_events(self) -> None:
+        """버퍼 비우기 (rollback 시 사용)"""
+        self._pending = []
+    
     def claim_pending_events(
         self,
         batch_size: int,
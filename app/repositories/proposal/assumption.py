@@ -2,12 +2,14 @@ from datetime import datetime
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import select, func as sql_func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, lambda_stmt, insert, update, exists, func as sql_func
+from sqlalchemy.orm import Session, joinedload, aliased
 
-from app.models.proposal import AssumptionProposal, ProposalStatusType
+from app.models.content import Assumption
+from app.models.event import Event, MembershipStatusType
+from app.models.proposal import AssumptionProposal, ProposalStatusType, ProposalCategoryType
 from app.models.vote import AssumptionProposalVote
-from app.repositories.proposal.generic import ProposalRepositoryGeneric
+from app.repositories.proposal.generic import ProposalRepositoryGeneric, votes_reach
 
 
 class AssumptionProposalRepository(ProposalRepositoryGeneric):
@@ -20,14 +22,13 @@ class AssumptionProposalRepository(ProposalRepositoryGeneric):
     ) -> List[AssumptionProposal]:
         """
         이벤트의 전제 제안 목록 조회
-        - votes와 creator를 조인하여 가져옴
+        - creator를 조인하여 가져옴 (투표 수는 count_votes_on_assumption_proposals로 일괄 집계, votes 컬렉션 로드 없음)
         - user_id가 제공되면 해당 사용자의 투표 여부도 포함
         """
         stmt = (
             select(AssumptionProposal)
             .where(AssumptionProposal.event_id == event_id)
             .options(
-                joinedload(AssumptionProposal.votes),
                 joinedload(AssumptionProposal.creator),
                 joinedload(AssumptionProposal.assumption)
             )
@@ -42,38 +43,45 @@ class AssumptionProposalRepository(ProposalRepositoryGeneric):
         """전제 제안 생성"""
         return self.create_proposal_generic(proposal)
 
-    def get_assumption_proposal_by_id(
-        self, proposal_id: UUID
-    ) -> AssumptionProposal | None:
-        """전제 제안 ID로 조회"""
-        return self.get_proposal_by_id_generic(
-            proposal_id,
+    def create_assumption_proposal_if_no_pending(self, **values) -> AssumptionProposal | None:
+        """전제 제안 생성 (같은 사용자의 PENDING 중복 제안이 있으면 None, 동시 요청에도 원자적)"""
+        return self.create_pending_proposal_if_absent_generic(
             AssumptionProposal,
-            relationships=['votes', 'creator', 'assumption']
+            [AssumptionProposal.created_by, AssumptionProposal.event_id, AssumptionProposal.assumption_id],
+            **values
+        )
+
+    def get_assumption_proposal_for_event(
+        self, proposal_id: UUID, event_id: UUID
+    ) -> AssumptionProposal | None:
+        """이벤트 소속 전제 제안 조회 (다른 이벤트 소속이면 None)"""
+        return self.get_proposal_for_event_generic(proposal_id, event_id, AssumptionProposal)
+
+    def get_assumption_proposal_with_event(
+        self, proposal_id: UUID, event_id: UUID
+    ) -> tuple[Event, AssumptionProposal] | None:
+        """전제 제안과 이벤트 동시 조회 (제안 행 잠금)"""
+        return self.get_proposal_with_event_generic(
+            proposal_id, event_id, AssumptionProposal
         )
 
-    def get_pending_assumption_proposal_by_user(
+    def get_event_with_assumption_create_preflight(
         self,
         event_id: UUID,
         assumption_id: UUID | None,
         user_id: UUID
-    ) -> AssumptionProposal | None:
+    ) -> tuple[Event, MembershipStatusType | None, bool] | None:
         """
-        사용자의 PENDING 상태 전제 제안 조회 (중복 체크용)
-        - assumption_id가 None이면 CREATION 제안
-        - assumption_id가 있으면 MODIFICATION/DELETION 제안
+        전제 제안 생성 사전 조회 (이벤트, 멤버십 상태, 중복 PENDING 제안 여부를 한 번에)
+        - 이벤트가 없으면 None 반환
         """
-        stmt = (
-            select(AssumptionProposal)
-            .where(
-                AssumptionProposal.event_id == event_id,
-                AssumptionProposal.assumption_id == assumption_id,
-                AssumptionProposal.created_by == user_id,
-                AssumptionProposal.proposal_status == ProposalStatusType.PENDING
-            )
+        duplicate_exists = exists().where(
+            AssumptionProposal.event_id == event_id,
+            AssumptionProposal.assumption_id == assumption_id,
+            AssumptionProposal.created_by == user_id,
+            AssumptionProposal.proposal_status == ProposalStatusType.PENDING
         )
-        result = self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return self.get_event_with_create_preflight_generic(event_id, user_id, duplicate_exists)
 
     def update_assumption_proposal(
         self, proposal: AssumptionProposal
@@ -81,6 +89,12 @@ class AssumptionProposalRepository(ProposalRepositoryGeneric):
         """전제 제안 업데이트"""
         return self.update_proposal_generic(proposal)
 
+    def mark_assumption_proposal_applied(
+        self, proposal: AssumptionProposal, applied_target_id: UUID | None = None
+    ) -> AssumptionProposal:
+        """전제 제안 적용 표시 (applied_at = DB now(), 적용 대상 id 함께 기록)"""
+        return self.mark_proposal_applied_generic(proposal, AssumptionProposal, applied_target_id)
+
     def approve_assumption_proposal_if_pending(
         self, proposal_id: UUID, accepted_at: datetime
     ) -> AssumptionProposal | None:
@@ -89,6 +103,87 @@ class AssumptionProposalRepository(ProposalRepositoryGeneric):
             proposal_id, accepted_at, AssumptionProposal
         )
 
+    def approve_and_apply_assumption_proposal_if_votes_reach(
+        self,
+        proposal: AssumptionProposal,
+        min_votes: int,
+        accepted_at: datetime,
+        new_assumption_id: UUID
+    ) -> AssumptionProposal | None:
+        """
+        투표 수 기반 조건부 승인 + 전제 적용을 단일 문장으로 수행
+        - approved CTE: PENDING이고 투표 수가 min_votes 이상이면 승인 (applied_at은 DB now(), applied_target_id 동시 기록)
+        - 적용 CTE: approved 행이 있을 때만 전제 생성/수정/소프트 삭제 (카테고리는 잠긴 proposal 기준)
+        - FK(applied_target_id)는 문장 종료 시 검사되므로 같은 문장에서 생성한 전제를 참조 가능
+        - 수정/삭제는 대상 전제가 살아 있을 때만 승인 (없거나 삭제됐으면 PENDING 유지)
+        - 조건 불충족 또는 이미 처리된 경우 None 반환 (전제 변경 없음)
+        """
+        is_creation = proposal.proposal_category == ProposalCategoryType.CREATION
+        conditions = [
+            AssumptionProposal.id == proposal.id,
+            AssumptionProposal.proposal_status == ProposalStatusType.PENDING,
+            votes_reach(AssumptionProposalVote.assumption_proposal_id, proposal.id, min_votes)
+        ]
+        if not is_creation:
+            # 수정/삭제 대상 전제가 없거나 이미 삭제됐으면 승인하지 않음 (적용 없이 ACCEPTED로 남지 않도록)
+            conditions.append(
+                exists().where(Assumption.id == proposal.assumption_id, Assumption.is_deleted.is_(False))
+            )
+        approved = (
+            update(AssumptionProposal)
+            .where(*conditions)
+            .values(
+                proposal_status=ProposalStatusType.ACCEPTED,
+                accepted_at=accepted_at,
+                applied_at=sql_func.now(),
+                applied_target_id=new_assumption_id if is_creation else proposal.assumption_id
+            )
+            .returning(*AssumptionProposal.__table__.c)
+            .cte("approved")
+        )
+
+        if is_creation:
+            apply_stmt = insert(Assumption).from_select(
+                ["id", "event_id", "content", "created_by"],
+                select(
+                    approved.c.applied_target_id,
+                    approved.c.event_id,
+                    approved.c.proposal_content,
+                    approved.c.created_by
+                )
+            )
+        elif proposal.proposal_category == ProposalCategoryType.MODIFICATION:
+            apply_stmt = (
+                update(Assumption)
+                .where(Assumption.id == approved.c.applied_target_id)
+                .values(
+                    original_content=Assumption.content,
+                    content=approved.c.proposal_content,
+                    is_modified=True,
+                    updated_at=approved.c.accepted_at,
+                    updated_by=approved.c.created_by
+                )
+            )
+        else:
+            apply_stmt = (
+                update(Assumption)
+                .where(Assumption.id == approved.c.applied_target_id)
+                .values(
+                    is_deleted=True,
+                    updated_at=approved.c.accepted_at,
+                    updated_by=approved.c.created_by
+                )
+            )
+
+        # 잠긴 proposal이 이미 세션에 있으므로 RETURNING 값으로 덮어씀
+        stmt = (
+            select(aliased(AssumptionProposal, approved))
+            .add_cte(apply_stmt.cte("applied"))
+            .execution_options(populate_existing=True)
+        )
+        result = self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     def reject_assumption_proposal_if_pending(
         self, proposal_id: UUID
     ) -> AssumptionProposal | None:
@@ -103,10 +198,11 @@ class AssumptionProposalRepository(ProposalRepositoryGeneric):
         user_id: UUID
     ) -> AssumptionProposalVote | None:
         """사용자가 특정 전제 제안에 투표했는지 확인"""
-        stmt = select(AssumptionProposalVote).where(
+        # 고정된 형태의 조회이므로 lambda_stmt로 Select 구성/캐시 키 생성 생략 (proposal_id, user_id는 바인드 파라미터)
+        stmt = lambda_stmt(lambda: select(AssumptionProposalVote).where(
             AssumptionProposalVote.assumption_proposal_id == proposal_id,
             AssumptionProposalVote.created_by == user_id
-        )
+        ))
         result = self.db.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -126,28 +222,44 @@ class AssumptionProposalRepository(ProposalRepositoryGeneric):
         votes = result.scalars().all()
         return {vote.assumption_proposal_id: vote for vote in votes}
 
+    def count_votes_on_assumption_proposals(
+        self, proposal_ids: List[UUID]
+    ) -> dict[UUID, int]:
+        """여러 전제 제안의 투표 수를 한 번에 집계 (투표가 없는 제안은 결과에 없음)"""
+        if not proposal_ids:
+            return {}
+        stmt = (
+            select(AssumptionProposalVote.assumption_proposal_id, sql_func.count())
+            .where(AssumptionProposalVote.assumption_proposal_id.in_(proposal_ids))
+            .group_by(AssumptionProposalVote.assumption_proposal_id)
+        )
+        result = self.db.execute(stmt)
+        return {proposal_id: count for proposal_id, count in result.all()}
+
     def create_assumption_proposal_vote(
-        self, vote: AssumptionProposalVote
-    ) -> AssumptionProposalVote:
-        """전제 제안 투표 생성"""
-        self.db.add(vote)
-        self.db.flush()
-        return vote
+        self, proposal_id: UUID, user_id: UUID
+    ) -> AssumptionProposalVote | None:
+        """전제 제안 투표 생성 (이미 투표했으면 None, 동시 요청에도 원자적)"""
+        return self.create_vote_if_absent_generic(
+            AssumptionProposalVote.assumption_proposal_id, proposal_id, user_id
+        )
 
     def delete_assumption_proposal_vote(
-        self, vote: AssumptionProposalVote
-    ) -> None:
-        """전제 제안 투표 삭제"""
-        self.db.delete(vote)
-        self.db.flush()
+        self, proposal_id: UUID, user_id: UUID
+    ) -> AssumptionProposalVote | None:
+        """전제 제안 투표 삭제 (투표하지 않았으면 None)"""
+        return self.delete_vote_if_exists_generic(
+            AssumptionProposalVote.assumption_proposal_id, proposal_id, user_id
+        )
 
     def count_assumption_proposal_votes(
         self, proposal_id: UUID
     ) -> int:
         """전제 제안 투표 수 조회"""
-        stmt = (
+        # 투표 생성/삭제마다 호출되므로 lambda_stmt로 Select 구성/캐시 키 생성 생략
+        stmt = lambda_stmt(lambda: (
             select(sql_func.count(AssumptionProposalVote.id))
             .where(AssumptionProposalVote.assumption_proposal_id == proposal_id)
-        )
+        ))
         result = self.db.execute(stmt)
         return result.scalar() or 0
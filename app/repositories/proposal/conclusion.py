@@ -2,12 +2,17 @@ from datetime import datetime
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import select, func as sql_func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, lambda_stmt, update, exists, func as sql_func
+from sqlalchemy.orm import Session, Load, joinedload, contains_eager, raiseload, aliased
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.models.event import Event, MembershipStatusType
 from app.models.proposal import ConclusionProposal, ProposalStatusType
 from app.models.vote import ConclusionProposalVote
-from app.repositories.proposal.generic import ProposalRepositoryGeneric
+from app.models.content import Criterion
+from app.repositories.proposal.generic import (
+    ProposalRepositoryGeneric, EVENT_VOTE_PATH_COLUMNS, votes_reach
+)
 
 
 class ConclusionProposalRepository(ProposalRepositoryGeneric):
@@ -20,13 +25,12 @@ class ConclusionProposalRepository(ProposalRepositoryGeneric):
     ) -> List[ConclusionProposal]:
         """
         특정 기준의 결론 제안 목록 조회
-        - votes와 creator를 조인하여 가져옴
+        - creator를 조인하여 가져옴 (투표 수는 count_votes_on_conclusion_proposals로 일괄 집계, votes 컬렉션 로드 없음)
         """
         stmt = (
             select(ConclusionProposal)
             .where(ConclusionProposal.criterion_id == criterion_id)
             .options(
-                joinedload(ConclusionProposal.votes),
                 joinedload(ConclusionProposal.creator)
             )
             .order_by(ConclusionProposal.created_at.desc())
@@ -40,34 +44,87 @@ class ConclusionProposalRepository(ProposalRepositoryGeneric):
         """결론 제안 생성"""
         return self.create_proposal_generic(proposal)
 
-    def get_conclusion_proposal_by_id(
-        self, proposal_id: UUID
-    ) -> ConclusionProposal | None:
-        """결론 제안 ID로 조회"""
-        return self.get_proposal_by_id_generic(
-            proposal_id,
-            ConclusionProposal,
-            relationships=['votes', 'creator', 'criterion']
+    def create_conclusion_proposal_if_no_pending(self, **values) -> ConclusionProposal | None:
+        """결론 제안 생성 (같은 사용자의 PENDING 중복 제안이 있으면 None, 동시 요청에도 원자적)"""
+        return self.create_pending_proposal_if_absent_generic(
+            ConclusionProposal, [ConclusionProposal.created_by, ConclusionProposal.criterion_id], **values
         )
 
-    def get_pending_conclusion_proposal_by_user(
-        self,
-        criterion_id: UUID,
-        user_id: UUID
+    def get_conclusion_proposal_for_event(
+        self, proposal_id: UUID, event_id: UUID
     ) -> ConclusionProposal | None:
         """
-        사용자의 PENDING 상태 결론 제안 조회 (중복 체크용)
+        이벤트 소속 결론 제안 조회 (관리자 상태 변경용)
+        - 결론 제안은 event_id가 없으므로 criterion을 조인해 소속을 WHERE 조건으로 검증
+        - 조인한 criterion은 contains_eager로 채워 적용 시 재조회 없음
         """
         stmt = (
             select(ConclusionProposal)
+            .join(Criterion, ConclusionProposal.criterion_id == Criterion.id)
             .where(
-                ConclusionProposal.criterion_id == criterion_id,
-                ConclusionProposal.created_by == user_id,
-                ConclusionProposal.proposal_status == ProposalStatusType.PENDING
+                ConclusionProposal.id == proposal_id,
+                Criterion.event_id == event_id
+            )
+            .options(
+                contains_eager(ConclusionProposal.criterion),
+                joinedload(ConclusionProposal.votes),
+                raiseload('*')
             )
         )
         result = self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
+
+    def get_conclusion_proposal_with_event(
+        self, proposal_id: UUID, event_id: UUID
+    ) -> tuple[Event, ConclusionProposal] | None:
+        """
+        결론 제안과 이벤트 동시 조회 (제안 행 잠금)
+        - 결론 제안은 event_id가 없으므로 criterion을 경유해 조인
+        """
+        stmt = (
+            select(Event, ConclusionProposal)
+            .join(Criterion, Criterion.event_id == Event.id)
+            .join(ConclusionProposal, ConclusionProposal.criterion_id == Criterion.id)
+            .where(
+                Event.id == event_id,
+                ConclusionProposal.id == proposal_id
+            )
+            # 투표 경로는 criterion 외 제안의 관계를 읽지 않으므로 지연 로드 대신 예외 (N+1 회귀 방지)
+            .options(
+                Load(Event).load_only(*EVENT_VOTE_PATH_COLUMNS),
+                contains_eager(ConclusionProposal.criterion),
+                Load(ConclusionProposal).raiseload('*')
+            )
+            .with_for_update(of=ConclusionProposal)
+        )
+        row = self.db.execute(stmt).first()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    def get_event_with_conclusion_create_preflight(
+        self,
+        event_id: UUID,
+        criterion_id: UUID,
+        user_id: UUID
+    ) -> tuple[Event, MembershipStatusType | None, bool, bool] | None:
+        """
+        결론 제안 생성 사전 조회 (이벤트, 멤버십 상태, 중복 PENDING 제안 여부, 기준 소속 여부를 한 번에)
+        - 마지막 값: 기준이 존재하고 해당 이벤트 소속인지 (별도 기준 조회 없음)
+        - 이벤트가 없으면 None 반환
+        """
+        duplicate_exists = exists().where(
+            ConclusionProposal.criterion_id == criterion_id,
+            ConclusionProposal.created_by == user_id,
+            ConclusionProposal.proposal_status == ProposalStatusType.PENDING
+        )
+        criterion_in_event = exists().where(
+            Criterion.id == criterion_id,
+            Criterion.event_id == event_id
+        )
+        return self.get_event_with_create_preflight_generic(
+            event_id, user_id, duplicate_exists, criterion_in_event
+        )
 
     def update_conclusion_proposal(
         self, proposal: ConclusionProposal
@@ -83,6 +140,85 @@ class ConclusionProposalRepository(ProposalRepositoryGeneric):
             proposal_id, accepted_at, ConclusionProposal
         )
 
+    def approve_and_apply_conclusion_proposal_if_votes_reach(
+        self, proposal_id: UUID, min_votes: int, accepted_at: datetime
+    ) -> ConclusionProposal | None:
+        """
+        투표 수 기반 조건부 승인 + 결론 적용을 단일 문장으로 수행
+        - approved CTE: PENDING이고 투표 수가 min_votes 이상이면 승인 (applied_at은 DB now()로 동시 기록)
+        - 적용 CTE: approved 행이 있을 때만 기준 결론 설정
+        - 조건 불충족 또는 이미 처리된 경우 None 반환 (기준 변경 없음)
+        """
+        approved = (
+            update(ConclusionProposal)
+            .where(
+                ConclusionProposal.id == proposal_id,
+                ConclusionProposal.proposal_status == ProposalStatusType.PENDING,
+                votes_reach(ConclusionProposalVote.conclusion_proposal_id, proposal_id, min_votes)
+            )
+            .values(
+                proposal_status=ProposalStatusType.ACCEPTED,
+                accepted_at=accepted_at,
+                applied_at=sql_func.now()
+            )
+            .returning(*ConclusionProposal.__table__.c)
+            .cte("approved")
+        )
+        apply_stmt = (
+            update(Criterion)
+            .where(Criterion.id == approved.c.criterion_id)
+            .values(
+                conclusion=approved.c.proposal_content,
+                updated_at=approved.c.accepted_at,
+                updated_by=approved.c.created_by
+            )
+        )
+
+        # 잠긴 proposal이 이미 세션에 있으므로 RETURNING 값으로 덮어씀
+        stmt = (
+            select(aliased(ConclusionProposal, approved))
+            .add_cte(apply_stmt.cte("applied"))
+            .execution_options(populate_existing=True)
+        )
+        result = self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    def apply_conclusion_proposal(
+        self, proposal: ConclusionProposal
+    ) -> ConclusionProposal:
+        """
+        승인된 결론 제안 적용 (적용 표시 + 기준 결론 설정을 단일 문장으로)
+        - applied CTE: applied_at = DB now() 기록
+        - 기준 UPDATE는 applied 행의 내용/작성자/시각으로 결론 설정
+        """
+        applied = (
+            update(ConclusionProposal)
+            .where(ConclusionProposal.id == proposal.id)
+            .values(applied_at=sql_func.now())
+            .returning(
+                ConclusionProposal.criterion_id,
+                ConclusionProposal.proposal_content,
+                ConclusionProposal.created_by,
+                ConclusionProposal.applied_at
+            )
+            .cte("applied")
+        )
+        stmt = (
+            update(Criterion)
+            .where(Criterion.id == applied.c.criterion_id)
+            .values(
+                conclusion=applied.c.proposal_content,
+                updated_at=applied.c.applied_at,
+                updated_by=applied.c.created_by
+            )
+            .returning(applied.c.applied_at)
+            # 반영은 아래에서 직접 하므로 세션 동기화(fetch) 생략
+            .execution_options(synchronize_session=False)
+        )
+        applied_at = self.db.execute(stmt).scalar_one()
+        set_committed_value(proposal, "applied_at", applied_at)
+        return proposal
+
     def reject_conclusion_proposal_if_pending(
         self, proposal_id: UUID
     ) -> ConclusionProposal | None:
@@ -97,10 +233,11 @@ class ConclusionProposalRepository(ProposalRepositoryGeneric):
         user_id: UUID
     ) -> ConclusionProposalVote | None:
         """사용자가 특정 결론 제안에 투표했는지 확인"""
-        stmt = select(ConclusionProposalVote).where(
+        # 고정된 형태의 조회이므로 lambda_stmt로 Select 구성/캐시 키 생성 생략 (proposal_id, user_id는 바인드 파라미터)
+        stmt = lambda_stmt(lambda: select(ConclusionProposalVote).where(
             ConclusionProposalVote.conclusion_proposal_id == proposal_id,
             ConclusionProposalVote.created_by == user_id
-        )
+        ))
         result = self.db.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -120,28 +257,44 @@ class ConclusionProposalRepository(ProposalRepositoryGeneric):
         votes = result.scalars().all()
         return {vote.conclusion_proposal_id: vote for vote in votes}
 
+    def count_votes_on_conclusion_proposals(
+        self, proposal_ids: List[UUID]
+    ) -> dict[UUID, int]:
+        """여러 결론 제안의 투표 수를 한 번에 집계 (투표가 없는 제안은 결과에 없음)"""
+        if not proposal_ids:
+            return {}
+        stmt = (
+            select(ConclusionProposalVote.conclusion_proposal_id, sql_func.count())
+            .where(ConclusionProposalVote.conclusion_proposal_id.in_(proposal_ids))
+            .group_by(ConclusionProposalVote.conclusion_proposal_id)
+        )
+        result = self.db.execute(stmt)
+        return {proposal_id: count for proposal_id, count in result.all()}
+
     def create_conclusion_proposal_vote(
-        self, vote: ConclusionProposalVote
-    ) -> ConclusionProposalVote:
-        """결론 제안 투표 생성"""
-        self.db.add(vote)
-        self.db.flush()
-        return vote
+        self, proposal_id: UUID, user_id: UUID
+    ) -> ConclusionProposalVote | None:
+        """결론 제안 투표 생성 (이미 투표했으면 None, 동시 요청에도 원자적)"""
+        return self.create_vote_if_absent_generic(
+            ConclusionProposalVote.conclusion_proposal_id, proposal_id, user_id
+        )
 
     def delete_conclusion_proposal_vote(
-        self, vote: ConclusionProposalVote
-    ) -> None:
-        """결론 제안 투표 삭제"""
-        self.db.delete(vote)
-        self.db.flush()
+        self, proposal_id: UUID, user_id: UUID
+    ) -> ConclusionProposalVote | None:
+        """결론 제안 투표 삭제 (투표하지 않았으면 None)"""
+        return self.delete_vote_if_exists_generic(
+            ConclusionProposalVote.conclusion_proposal_id, proposal_id, user_id
+        )
 
     def count_conclusion_proposal_votes(
         self, proposal_id: UUID
     ) -> int:
         """결론 제안 투표 수 조회"""
-        stmt = (
+        # 투표 생성/삭제마다 호출되므로 lambda_stmt로 Select 구성/캐시 키 생성 생략
+        stmt = lambda_stmt(lambda: (
             select(sql_func.count(ConclusionProposalVote.id))
             .where(ConclusionProposalVote.conclusion_proposal_id == proposal_id)
-        )
+        ))
         result = self.db.execute(stmt)
         return result.scalar() or 0
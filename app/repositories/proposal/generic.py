@@ -2,13 +2,49 @@ from datetime import datetime
 from typing import TypeVar, Type
 from uuid import UUID
 
-from sqlalchemy import select, update
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, update, delete, literal, text, func as sql_func, Exists, ColumnElement
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, Load, joinedload, raiseload, InstrumentedAttribute
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.models.event import Event, EventMembership, MembershipStatusType
 from app.models.proposal import ProposalBase, ProposalStatusType
 
 # TypeVar 정의
 ProposalType = TypeVar('ProposalType', bound=ProposalBase)
+VoteType = TypeVar('VoteType')
+
+# 투표 경로(검증, 자동 승인, Outbox target)에서 읽는 이벤트 컬럼 (decision_subject 등 본문 컬럼은 전송 생략)
+# 그 외 컬럼은 지연(deferred) 로드되므로 요청 캐시에서 재사용돼도 접근 시 조회되어 안전
+EVENT_VOTE_PATH_COLUMNS = (
+    Event.id,
+    Event.event_status,
+    Event.admin_id,
+    Event.assumption_is_auto_approved_by_votes,
+    Event.assumption_min_votes_required,
+    Event.criteria_is_auto_approved_by_votes,
+    Event.criteria_min_votes_required,
+    Event.conclusion_is_auto_approved_by_votes,
+    Event.conclusion_approval_threshold_percent,
+    Event.accepted_member_count,
+)
+
+
+
+def votes_reach(
+    vote_fk_column: InstrumentedAttribute, proposal_id: UUID, min_votes: int
+) -> ColumnElement[bool]:
+    """
+    제안의 투표 수가 min_votes 이상인지 판정하는 SQL 조건
+    - 투표 행을 min_votes개까지만 세고 멈춤 (LIMIT으로 상한을 둔 COUNT, 인덱스 스캔 조기 종료)
+    """
+    capped = (
+        select(literal(1))
+        .where(vote_fk_column == proposal_id)
+        .limit(min_votes)
+        .subquery()
+    )
+    return select(sql_func.count()).select_from(capped).scalar_subquery() >= min_votes
 
 
 class ProposalRepositoryGeneric:
@@ -25,20 +61,156 @@ class ProposalRepositoryGeneric:
         self.db.flush()
         return proposal
 
-    def get_proposal_by_id_generic(
+    def create_pending_proposal_if_absent_generic(
         self,
-        proposal_id: UUID,
         proposal_class: Type[ProposalType],
-        relationships: list[str] | None = None
+        conflict_columns: list[InstrumentedAttribute],
+        **values
     ) -> ProposalType | None:
-        """제너릭 제안 조회"""
-        stmt = select(proposal_class).where(proposal_class.id == proposal_id)
-        if relationships:
-            for rel in relationships:
-                stmt = stmt.options(joinedload(getattr(proposal_class, rel)))
+        """
+        제너릭 PENDING 제안 생성 (사용자별 PENDING 중복이면 생성하지 않음)
+        - INSERT ... ON CONFLICT DO NOTHING RETURNING 한 문장으로 중복 확인과 생성을 원자적으로 수행
+        - 중재 인덱스: 사용자별 PENDING 유니크 부분 인덱스 (uq_*_proposals_pending_user)
+        - 중복이면 None 반환
+        """
+        stmt = (
+            pg_insert(proposal_class)
+            .values(proposal_status=ProposalStatusType.PENDING, **values)
+            .on_conflict_do_nothing(
+                index_elements=conflict_columns,
+                # 부분 인덱스 추론은 술어가 인덱스 정의와 같아야 하므로 바인드 파라미터 대신 리터럴 사용
+                index_where=text("proposal_status = 'PENDING'")
+            )
+            .returning(proposal_class)
+        )
+        result = self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    def create_vote_if_absent_generic(
+        self,
+        vote_fk_column: InstrumentedAttribute,
+        proposal_id: UUID,
+        user_id: UUID
+    ) -> VoteType | None:
+        """
+        제너릭 투표 생성 (이미 투표했으면 생성하지 않음)
+        - INSERT ... ON CONFLICT DO NOTHING RETURNING 한 문장으로 중복 확인과 생성을 원자적으로 수행
+        - 중재 제약: (proposal_id, created_by) 유니크 제약
+        - 이미 투표한 경우 None 반환
+        """
+        vote_class = vote_fk_column.class_
+        stmt = (
+            pg_insert(vote_class)
+            .values({vote_fk_column.key: proposal_id, "created_by": user_id})
+            .on_conflict_do_nothing(index_elements=[vote_fk_column, vote_class.created_by])
+            .returning(vote_class)
+        )
+        result = self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    def delete_vote_if_exists_generic(
+        self,
+        vote_fk_column: InstrumentedAttribute,
+        proposal_id: UUID,
+        user_id: UUID
+    ) -> VoteType | None:
+        """
+        제너릭 투표 삭제 (사용자의 투표를 조회 없이 DELETE ... RETURNING으로 삭제)
+        - 투표하지 않은 경우 None 반환
+        """
+        vote_class = vote_fk_column.class_
+        stmt = (
+            delete(vote_class)
+            .where(vote_fk_column == proposal_id, vote_class.created_by == user_id)
+            .returning(vote_class)
+        )
+        result = self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    def get_proposal_for_event_generic(
+        self,
+        proposal_id: UUID,
+        event_id: UUID,
+        proposal_class: Type[ProposalType]
+    ) -> ProposalType | None:
+        """
+        제너릭 이벤트 소속 제안 조회 (관리자 상태 변경용)
+        - 소속 검증을 WHERE 조건으로 처리 (없거나 다른 이벤트 소속이면 None)
+        - 상태 변경 응답에 쓰는 votes만 함께 로드
+        """
+        stmt = (
+            select(proposal_class)
+            .where(
+                proposal_class.id == proposal_id,
+                proposal_class.event_id == event_id
+            )
+            # 응답에 쓰는 votes 외 관계 접근은 지연 로드 대신 예외 (N+1 회귀 방지)
+            .options(joinedload(proposal_class.votes), raiseload('*'))
+        )
         result = self.db.execute(stmt)
         return result.unique().scalar_one_or_none()
 
+    def get_proposal_with_event_generic(
+        self,
+        proposal_id: UUID,
+        event_id: UUID,
+        proposal_class: Type[ProposalType]
+    ) -> tuple[Event, ProposalType] | None:
+        """
+        제너릭 제안 + 이벤트 동시 조회 (투표 트랜잭션용)
+        - 이벤트와 제안을 한 번의 쿼리로 조회
+        - 제안 행은 FOR UPDATE로 잠궈 동시 투표 시 상태 검증과 변경을 직렬화
+        - 이벤트가 없거나 제안이 해당 이벤트 소속이 아니면 None 반환
+        """
+        stmt = (
+            select(Event, proposal_class)
+            .join(proposal_class, proposal_class.event_id == Event.id)
+            .where(
+                Event.id == event_id,
+                proposal_class.id == proposal_id
+            )
+            # 투표 경로는 제안의 관계를 읽지 않으므로 지연 로드 대신 예외 (N+1 회귀 방지)
+            .options(
+                Load(Event).load_only(*EVENT_VOTE_PATH_COLUMNS),
+                Load(proposal_class).raiseload('*')
+            )
+            .with_for_update(of=proposal_class)
+        )
+        row = self.db.execute(stmt).first()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    def get_event_with_create_preflight_generic(
+        self,
+        event_id: UUID,
+        user_id: UUID,
+        duplicate_exists: Exists,
+        *extra_columns: ColumnElement
+    ) -> tuple | None:
+        """
+        제너릭 제안 생성 사전 조회
+        - 이벤트, 요청자 멤버십 상태, 중복 PENDING 제안 존재 여부를 한 번의 쿼리로 조회
+        - extra_columns: 타입별 추가 검증 값 (결과 튜플 뒤에 이어서 반환)
+        - 이벤트가 없으면 None 반환
+        """
+        membership_status = (
+            select(EventMembership.membership_status)
+            .where(
+                EventMembership.event_id == event_id,
+                EventMembership.user_id == user_id
+            )
+            .scalar_subquery()
+        )
+        stmt = (
+            select(Event, membership_status, duplicate_exists, *extra_columns)
+            .where(Event.id == event_id)
+        )
+        row = self.db.execute(stmt).first()
+        if row is None:
+            return None
+        return tuple(row)
+
     def update_proposal_generic(
         self, proposal: ProposalType
     ) -> ProposalType:
@@ -46,6 +218,34 @@ class ProposalRepositoryGeneric:
         self.db.flush()
         return proposal
 
+    def mark_proposal_applied_generic(
+        self,
+        proposal: ProposalType,
+        proposal_class: Type[ProposalType],
+        applied_target_id: UUID | None = None
+    ) -> ProposalType:
+        """
+        제너릭 제안 적용 표시
+        - applied_at은 DB 시각(now())으로 기록하고 RETURNING으로 받아 객체에 반영 (Python 시계 조회 없음)
+        - applied_target_id가 있으면 같은 UPDATE에서 함께 기록
+        """
+        values = {"applied_at": sql_func.now()}
+        if applied_target_id is not None:
+            values["applied_target_id"] = applied_target_id
+        stmt = (
+            update(proposal_class)
+            .where(proposal_class.id == proposal.id)
+            .values(**values)
+            .returning(proposal_class.applied_at)
+            # 반영은 아래에서 직접 하므로 세션 동기화(fetch) 생략
+            .execution_options(synchronize_session=False)
+        )
+        applied_at = self.db.execute(stmt).scalar_one()
+        set_committed_value(proposal, "applied_at", applied_at)
+        if applied_target_id is not None:
+            set_committed_value(proposal, "applied_target_id", applied_target_id)
+        return proposal
+
     def approve_proposal_if_pending_generic(
         self,
         proposal_id: UUID,
@@ -56,7 +256,7 @@ class ProposalRepositoryGeneric:
         제너릭 조건부 승인
         - WHERE id = :id AND status = 'PENDING' 조건으로 업데이트
         - 이미 승인된 경우 None 반환 (중복 승인 방지)
-        - 성공 시 업데이트된 proposal 반환
+        - 성공 시 업데이트된 proposal 반환 (RETURNING 한 번으로 상태 전이와 조회를 처리, 후속 flush/재조회 없음)
         """
         stmt = (
             update(proposal_class)
@@ -71,7 +271,6 @@ class ProposalRepositoryGeneric:
             .returning(proposal_class)
         )
         result = self.db.execute(stmt)
-        self.db.flush()
         return result.scalar_one_or_none()
 
     def reject_proposal_if_pending_generic(
@@ -83,7 +282,7 @@ class ProposalRepositoryGeneric:
         제너릭 조건부 거절
         - WHERE id = :id AND status = 'PENDING' 조건으로 업데이트
         - 이미 거절/승인된 경우 None 반환 (중복 거절 방지)
-        - 성공 시 업데이트된 proposal 반환
+        - 성공 시 업데이트된 proposal 반환 (RETURNING 한 번으로 상태 전이와 조회를 처리, 후속 flush/재조회 없음)
         """
         stmt = (
             update(proposal_class)
@@ -97,5 +296,4 @@ class ProposalRepositoryGeneric:
             .returning(proposal_class)
         )
         result = self.db.execute(stmt)
-        self.db.flush()
         return result.scalar_one_or_none()
@@ -85,14 +85,14 @@ class CommentService(EventBaseService):
             created_by=user_id
         )
         
-        with transaction(self.db):
+        with transaction(self.db, self.outbox_repo):
             result = self.comment_repo.create_comment(comment)
             # creator 관계 로드
             self.db.refresh(result, ["creator"])
             
-            # Outbox 이벤트 추가 (트랜잭션 내부)
+            # Outbox 이벤트 버퍼링 (commit 직전 일괄 INSERT)
             if self.outbox_repo:
-                self.outbox_repo.create_outbox_event(
+                self.outbox_repo.buffer_event(
                     event_type="comment.created.v1",
                     payload={
                         "comment_id": str(result.id),
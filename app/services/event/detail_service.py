@@ -59,10 +59,13 @@ class EventDetailService(EventBaseService):
         user_votes_on_assumptions = self.repos.proposal.get_user_votes_on_assumption_proposals(
             assumption_proposal_ids, user_id
         )
+        vote_counts_on_assumption = self.repos.proposal.count_votes_on_assumption_proposals(
+            assumption_proposal_ids
+        )
         
         for proposal in assumption_proposals:
-            # 투표 정보 조회 (이미 로드된 votes 사용)
-            vote_count = len(proposal.votes)
+            # 투표 정보 조회 (일괄 집계한 투표 수 사용, votes 컬렉션 로드 없음)
+            vote_count = vote_counts_on_assumption.get(proposal.id, 0)
             has_voted = proposal.id in user_votes_on_assumptions
             
             proposal_info = AssumptionProposalInfo(
@@ -99,10 +102,13 @@ class EventDetailService(EventBaseService):
         user_votes_on_criteria = self.repos.proposal.get_user_votes_on_criteria_proposals(
             criteria_proposal_ids, user_id
         )
+        vote_counts_on_criteria = self.repos.proposal.count_votes_on_criteria_proposals(
+            criteria_proposal_ids
+        )
         
         for proposal in criteria_proposals:
-            # 투표 정보 조회 (이미 로드된 votes 사용)
-            vote_count = len(proposal.votes)
+            # 투표 정보 조회 (일괄 집계한 투표 수 사용, votes 컬렉션 로드 없음)
+            vote_count = vote_counts_on_criteria.get(proposal.id, 0)
             has_voted = proposal.id in user_votes_on_criteria
             
             proposal_info = CriteriaProposalInfo(
@@ -183,6 +189,9 @@ class EventDetailService(EventBaseService):
         user_votes_on_conclusions = self.repos.proposal.get_user_votes_on_conclusion_proposals(
             conclusion_proposal_ids, user_id
         )
+        vote_counts_on_conclusions = self.repos.proposal.count_votes_on_conclusion_proposals(
+            conclusion_proposal_ids
+        )
         
         # applied_at 정보를 미리 딕셔너리로 매핑
         criteria_applied_at_map: dict[UUID, dict[str, datetime]] = {}
@@ -206,7 +215,7 @@ class EventDetailService(EventBaseService):
             conclusion_proposals_raw = conclusion_proposals_by_criterion.get(criterion.id, [])
             conclusion_proposals = []
             for cp in conclusion_proposals_raw:
-                vote_count = len(cp.votes)
+                vote_count = vote_counts_on_conclusions.get(cp.id, 0)
                 has_voted = cp.id in user_votes_on_conclusions
                 
                 conclusion_proposals.append(
@@ -93,7 +93,7 @@ class MembershipService(EventBaseService):
         # 자동 승인 여부 확인
         is_auto_approved = event.membership_is_auto_approved
         
-        with transaction(self.db):
+        with transaction(self.db, self.outbox_repo):
             if is_auto_approved:
                 # 자동 승인: ACCEPTED 상태로 생성
                 joined_at = datetime.now(timezone.utc)
@@ -105,9 +105,9 @@ class MembershipService(EventBaseService):
                 )
                 created_membership = self.membership_repo.create_membership(membership)
                 
-                # Outbox 이벤트 추가 (자동 승인)
+                # Outbox 이벤트 버퍼링 (자동 승인, commit 직전 일괄 INSERT)
                 if self.outbox_repo:
-                    self.outbox_repo.create_outbox_event(
+                    self.outbox_repo.buffer_event(
                         event_type="membership.approved.v1",
                         payload={
                             "membership_id": str(created_membership.id),
@@ -162,7 +162,7 @@ class MembershipService(EventBaseService):
                 )
             
             # 조건부 UPDATE로 승인 처리 (원자성 보장)
-            with transaction(self.db):
+            with transaction(self.db, self.outbox_repo):
                 joined_at = datetime.now(timezone.utc)
                 updated_membership = self.membership_repo.approve_membership_if_pending(
                     membership_id, joined_at
@@ -188,9 +188,9 @@ class MembershipService(EventBaseService):
                             detail="Membership status has changed and cannot be updated"
                         )
                 
-                # Outbox 이벤트 추가 (트랜잭션 내부)
+                # Outbox 이벤트 버퍼링 (commit 직전 일괄 INSERT)
                 if self.outbox_repo:
-                    self.outbox_repo.create_outbox_event(
+                    self.outbox_repo.buffer_event(
                         event_type="membership.approved.v1",
                         payload={
                             "membership_id": str(updated_membership.id),
@@ -248,7 +248,7 @@ class MembershipService(EventBaseService):
             )
             
             # 조건부 UPDATE로 거부 처리 (원자성 보장)
-            with transaction(self.db):
+            with transaction(self.db, self.outbox_repo):
                 updated_membership = self.membership_repo.reject_membership_if_pending(
                     membership_id
                 )
@@ -273,9 +273,9 @@ class MembershipService(EventBaseService):
                             detail="Membership status has changed and cannot be updated"
                         )
                 
-                # Outbox 이벤트 추가 (트랜잭션 내부)
+                # Outbox 이벤트 버퍼링 (commit 직전 일괄 INSERT)
                 if self.outbox_repo:
-                    self.outbox_repo.create_outbox_event(
+                    self.outbox_repo.buffer_event(
                         event_type="membership.rejected.v1",
                         payload={
                             "membership_id": str(updated_membership.id),
@@ -8,15 +8,19 @@ from app.models.event import Event
 from app.models.proposal import ProposalStatusType
 from app.exceptions import ConflictError, ValidationError, NotFoundError
 from app.utils.transaction import transaction
+from app.repositories.outbox_repository import OutboxRepository
 
 TProposal = TypeVar('TProposal')
+TResponse = TypeVar('TResponse')
+_UTC = timezone.utc  # 승인 시각 생성 시 속성 조회 생략
 
 
 class ApprovalUseCase:
     """승인/거절 상태 변경 공통 로직"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, outbox_repo: OutboxRepository | None = None):
         self.db = db
+        self.outbox_repo = outbox_repo
     
     def update_status(
         self,
@@ -26,25 +30,23 @@ class ApprovalUseCase:
         user_id: UUID,
         # 타입별 의존성 주입
         verify_admin_fn: Callable[[UUID, UUID], Event],
-        get_proposal_fn: Callable[[UUID], TProposal],
-        validate_proposal_belongs_to_event_fn: Callable[[TProposal, UUID], None],
+        get_proposal_for_event_fn: Callable[[UUID, UUID], TProposal | None],
         approve_if_pending_fn: Callable[[UUID, datetime], TProposal | None],
         reject_if_pending_fn: Callable[[UUID], TProposal | None],
-        apply_proposal_fn: Callable[[TProposal, Event], None],
-        build_response_fn: Callable[[TProposal, UUID], dict],
-        create_outbox_event_fn: Callable[[TProposal, Event, ProposalStatusType], None] | None = None,
-    ) -> dict:
+        apply_proposal_fn: Callable[[TProposal, Event], None] | None,
+        build_response_fn: Callable[[TProposal, UUID], TResponse],
+        create_outbox_event_fn: Callable[[TProposal, Event, ProposalStatusType, UUID], None] | None = None,
+    ) -> TResponse:
         """
         Proposal 상태 변경 공통 로직
         
         Args:
             verify_admin_fn: 관리자 권한 확인 함수
-            get_proposal_fn: proposal 조회 함수 (타입별)
-            validate_proposal_belongs_to_event_fn: proposal이 event에 속하는지 검증
+            get_proposal_for_event_fn: event 소속 proposal 조회 함수 (타입별, 없거나 다른 event 소속이면 None)
             approve_if_pending_fn: 조건부 승인 함수 (repository 레벨)
             reject_if_pending_fn: 조건부 거절 함수 (repository 레벨)
-            apply_proposal_fn: 제안 적용 함수 (타입별)
-            create_outbox_event_fn: Outbox 이벤트 생성 함수 (선택)
+            apply_proposal_fn: 제안 적용 함수 (타입별, 거절 요청이면 None)
+            create_outbox_event_fn: Outbox 이벤트 생성 함수 (선택, 처리한 관리자 id를 함께 전달)
             build_response_fn: 응답 생성 함수 (타입별)
         """
         if status not in (ProposalStatusType.ACCEPTED, ProposalStatusType.REJECTED):
@@ -56,28 +58,26 @@ class ApprovalUseCase:
         # 1. 관리자 권한 확인
         event = verify_admin_fn(event_id, user_id)
         
-        # 2. 제안 조회 및 검증
-        proposal = get_proposal_fn(proposal_id)
+        # 2. 제안 조회 (event 소속 검증은 조회 쿼리의 WHERE 조건으로 처리)
+        proposal = get_proposal_for_event_fn(proposal_id, event_id)
         if not proposal:
             raise NotFoundError(
                 message="Proposal not found",
-                detail=f"Proposal with id {proposal_id} not found"
+                detail=f"Proposal with id {proposal_id} not found in this event"
             )
         
-        # proposal이 event에 속하는지 검증
-        validate_proposal_belongs_to_event_fn(proposal, event_id)
-        
         # 3. 조건부 UPDATE로 상태 변경 (원자성 보장)
-        with transaction(self.db):
+        with transaction(self.db, self.outbox_repo):
             if status == ProposalStatusType.ACCEPTED:
-                accepted_at = datetime.now(timezone.utc)
+                accepted_at = datetime.now(_UTC)
                 updated_proposal = approve_if_pending_fn(proposal_id, accepted_at)
             else:
                 updated_proposal = reject_if_pending_fn(proposal_id)
             
             # 조건부 UPDATE 실패 처리
             if updated_proposal is None:
-                self.db.refresh(proposal, ['votes'])
+                # 현재 상태만 확인 (votes 컬렉션은 불필요)
+                self.db.refresh(proposal, ['proposal_status'])
                 if proposal.proposal_status == ProposalStatusType.ACCEPTED:
                     raise ConflictError(
                         message="Proposal already accepted",
@@ -96,14 +96,15 @@ class ApprovalUseCase:
             
             # 조건부 UPDATE 성공한 경우에만 후속 처리
             proposal = updated_proposal
-            if status == ProposalStatusType.ACCEPTED:
+            if apply_proposal_fn is not None and status == ProposalStatusType.ACCEPTED:
                 apply_proposal_fn(proposal, event)
             
             # Outbox 이벤트 생성 (트랜잭션 내부)
             if create_outbox_event_fn:
-                create_outbox_event_fn(proposal, event, status)
+                create_outbox_event_fn(proposal, event, status, user_id)
             
-            # 응답 생성을 위해 refresh
-            self.db.refresh(proposal, ['votes'])
+            # 응답 생성 (투표 수는 build_response_fn에서 COUNT로 조회, votes 컬렉션 로드 없음)
+            # commit 후 만료된 proposal을 다시 로드하지 않도록 트랜잭션 내부에서 생성
+            response = build_response_fn(proposal, user_id)
         
-        return build_response_fn(proposal, user_id)
+        return response
@@ -1,21 +1,32 @@
 """자동 승인 로직 공통화"""
+from abc import ABC, abstractmethod
 from typing import Callable, TypeVar
 from datetime import datetime, timezone
-from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.models.event import Event
 from app.models.proposal import ProposalStatusType
 
 TProposal = TypeVar('TProposal')
+_UTC = timezone.utc  # 승인 시각 생성 시 속성 조회 생략
 
 
-class AutoApprovalChecker:
-    """자동 승인 로직 공통화"""
+class AutoApprovalChecker(ABC):
+    """
+    자동 승인 로직 공통화
+    - 타입별 서브클래스가 자동 승인 사전 체크 조건을 고정 (생성 시점에 특수화)
+    """
     
     def __init__(self, db: Session):
         self.db = db
     
+    @abstractmethod
+    def can_auto_approve(self, event: Event, vote_count: int) -> bool:
+        """
+        자동 승인 가능성 사전 체크 (DB 조회 없음)
+        - False면 임계값에 도달할 수 없으므로 check_and_auto_approve 호출 불필요
+        """
+    
     def check_and_auto_approve(
         self,
         proposal: TProposal,
@@ -23,12 +34,12 @@ class AutoApprovalChecker:
         vote_count: int,
         # 타입별 설정
         min_votes_required: int | None,  # Assumption/Criteria용
-        approval_threshold_percent: float | None,  # Conclusion용
+        approval_threshold_percent: int | None,  # Conclusion용
         total_members: int | None,  # Conclusion용
         is_auto_approved: bool,  # 자동 승인 활성화 여부
         # 타입별 함수
-        approve_if_pending_fn: Callable[[UUID, datetime], TProposal | None],
-        apply_proposal_fn: Callable[[TProposal, Event], None],
+        approve_if_pending_fn: Callable[[TProposal, Event, datetime], TProposal | None],
+        apply_proposal_fn: Callable[[TProposal, Event], None] | None,
         create_outbox_event_fn: Callable[[TProposal, Event], None] | None = None,
     ) -> None:
         """
@@ -42,8 +53,8 @@ class AutoApprovalChecker:
             approval_threshold_percent: 승인 임계값 퍼센트 (Conclusion용)
             total_members: 전체 멤버 수 (Conclusion용)
             is_auto_approved: 자동 승인 활성화 여부
-            approve_if_pending_fn: 조건부 승인 함수 (repository 레벨)
-            apply_proposal_fn: 제안 적용 함수 (타입별)
+            approve_if_pending_fn: 조건부 승인 함수 (proposal, event, accepted_at; 타입별로 한 번 바인딩된 메서드)
+            apply_proposal_fn: 제안 적용 함수 (타입별, 승인 문장에서 함께 적용하면 None)
             create_outbox_event_fn: Outbox 이벤트 생성 함수 (선택)
         """
         # PENDING 상태가 아니면 자동 승인 로직 적용하지 않음
@@ -55,38 +66,76 @@ class AutoApprovalChecker:
         
         # Assumption/Criteria: 투표 수 기반
         if min_votes_required is not None:
-            if vote_count >= min_votes_required:
-                accepted_at = datetime.now(timezone.utc)
-                approved_proposal = approve_if_pending_fn(proposal.id, accepted_at)
-                if approved_proposal:
-                    # 승인 성공 시 proposal을 다시 조회하여 관계 로드
-                    # proposal 타입에 따라 적절한 관계만 refresh
-                    refresh_attrs = ['votes']
-                    if hasattr(approved_proposal, 'assumption'):
-                        refresh_attrs.append('assumption')
-                    if hasattr(approved_proposal, 'criterion'):
-                        refresh_attrs.append('criterion')
-                    self.db.refresh(approved_proposal, refresh_attrs)
-                    # 자동 승인 시 즉시 적용
-                    apply_proposal_fn(approved_proposal, event)
-                    # Outbox 이벤트 생성 (선택)
-                    if create_outbox_event_fn:
-                        create_outbox_event_fn(approved_proposal, event)
+            if vote_count < min_votes_required:
+                return
         
         # Conclusion: 비율 기반
         elif approval_threshold_percent is not None and total_members is not None:
-            if total_members == 0:
-                return  # 멤버가 없으면 승인 불가
+            if total_members == 0 or vote_count == 0:
+                return  # 멤버나 투표가 없으면 승인 불가
             
-            vote_percent = (vote_count / total_members) * 100
-            if vote_percent >= approval_threshold_percent:
-                accepted_at = datetime.now(timezone.utc)
-                approved_proposal = approve_if_pending_fn(proposal.id, accepted_at)
-                if approved_proposal:
-                    # 승인 성공 시 proposal을 다시 조회하여 관계 로드
-                    self.db.refresh(approved_proposal, ['votes', 'criterion'])
-                    # 자동 승인 시 즉시 적용
-                    apply_proposal_fn(approved_proposal, event)
-                    # Outbox 이벤트 생성 (선택)
-                    if create_outbox_event_fn:
-                        create_outbox_event_fn(approved_proposal, event)
+            # vote_count / total_members * 100 >= threshold 를 정수 비교로 변환
+            # (부동소수점 나눗셈 제거, 경계값(예: 정확히 50%)에서도 결정적인 결과)
+            if vote_count * 100 < approval_threshold_percent * total_members:
+                return
+        
+        else:
+            return
+        
+        self._approve(proposal, event, approve_if_pending_fn, apply_proposal_fn, create_outbox_event_fn)
+    
+    def _approve(
+        self,
+        proposal: TProposal,
+        event: Event,
+        approve_if_pending_fn: Callable[[TProposal, Event, datetime], TProposal | None],
+        apply_proposal_fn: Callable[[TProposal, Event], None] | None,
+        create_outbox_event_fn: Callable[[TProposal, Event], None] | None,
+    ) -> None:
+        """임계값 도달 후 공통 처리: 조건부 승인 → 제안 적용 → Outbox 이벤트"""
+        accepted_at = datetime.now(_UTC)
+        approved_proposal = approve_if_pending_fn(proposal, event, accepted_at)
+        if approved_proposal is None:
+            return
+        # 자동 승인 시 즉시 적용
+        # (RETURNING 행으로 컬럼이 채워져 있고 적용/Outbox는 관계를 읽지 않으므로 refresh 불필요)
+        if apply_proposal_fn:
+            apply_proposal_fn(approved_proposal, event)
+        # Outbox 이벤트 생성 (선택)
+        if create_outbox_event_fn:
+            create_outbox_event_fn(approved_proposal, event)
+
+
+class AssumptionAutoApproval(AutoApprovalChecker):
+    """Assumption 제안 자동 승인 (투표 수 기반)"""
+    
+    def can_auto_approve(self, event: Event, vote_count: int) -> bool:
+        return (
+            event.assumption_is_auto_approved_by_votes
+            and event.assumption_min_votes_required is not None
+            and vote_count >= event.assumption_min_votes_required
+        )
+
+
+class CriterionAutoApproval(AutoApprovalChecker):
+    """Criteria 제안 자동 승인 (투표 수 기반)"""
+    
+    def can_auto_approve(self, event: Event, vote_count: int) -> bool:
+        return (
+            event.criteria_is_auto_approved_by_votes
+            and event.criteria_min_votes_required is not None
+            and vote_count >= event.criteria_min_votes_required
+        )
+
+
+class ConclusionAutoApproval(AutoApprovalChecker):
+    """Conclusion 제안 자동 승인 (비율 기반)"""
+    
+    def can_auto_approve(self, event: Event, vote_count: int) -> bool:
+        # 멤버 수는 Event에 비정규화되어 있으므로 비율까지 조회 없이 판정
+        return (
+            event.conclusion_is_auto_approved_by_votes
+            and event.conclusion_approval_threshold_percent is not None
+            and vote_count > 0
+            and vote_count * 100 >= event.conclusion_approval_threshold_percent * event.accepted_member_count
+        )
@@ -1,15 +1,22 @@
 """Idempotency 명시적 래핑"""
-from typing import Callable
+from datetime import timedelta
+from typing import Callable, TypeVar
 from uuid import UUID
 
+from pydantic import BaseModel
+
 from app.services.idempotency_service import IdempotencyService
 
+TResponse = TypeVar('TResponse', bound=BaseModel)
+
 
 class IdempotencyWrapper:
     """Idempotency 명시적 래핑 헬퍼"""
     
     def __init__(self, idempotency_service: IdempotencyService | None):
         self.idempotency_service = idempotency_service
+        # 서비스 유무는 생성 시점에 고정되므로 실행 함수를 미리 바인딩
+        self._run = idempotency_service.run if idempotency_service else None
     
     def wrap(
         self,
@@ -17,9 +24,11 @@ class IdempotencyWrapper:
         user_id: UUID,
         method: str,
         path: str,
-        body: dict,
-        fn: Callable[[], dict],
-    ) -> dict:
+        body: dict | BaseModel,
+        fn: Callable[[], TResponse],
+        response_model: type[TResponse],
+        ttl: timedelta | None = None,
+    ) -> TResponse:
         """
         Idempotency 래핑
         
@@ -28,17 +37,21 @@ class IdempotencyWrapper:
             user_id: 사용자 ID
             method: HTTP 메서드
             path: HTTP 경로
-            body: 요청 본문
-            fn: 실행할 함수
+            body: 요청 본문 (Pydantic 모델이면 Idempotency 적용 시에만 직렬화)
+            fn: 실행할 함수 (응답 모델 반환)
+            response_model: 응답 모델 클래스 (저장된 JSON 응답 복원용)
+            ttl: Idempotency 레코드 보관 기간 (None이면 서비스 기본값)
         """
-        if self.idempotency_service and idempotency_key:
-            return self.idempotency_service.run(
-                user_id=user_id,
-                key=idempotency_key,
-                method=method,
-                path=path,
-                body=body,
-                fn=fn
-            )
-        else:
+        if self._run is None or not idempotency_key:
+            # 래핑하지 않으면 fn의 응답 모델을 그대로 반환 (dict 직렬화/재검증 없음)
             return fn()
+        # 저장되는 응답은 JSON dict이므로(모델은 pydantic-core가 한 번에 직렬화) 응답 모델로 복원
+        return response_model.model_validate(self._run(
+            user_id=user_id,
+            key=idempotency_key,
+            method=method,
+            path=path,
+            body=body,
+            fn=fn,
+            ttl=ttl
+        ))
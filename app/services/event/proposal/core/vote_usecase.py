@@ -1,23 +1,25 @@
 """투표 생성/삭제 공통 로직"""
-from typing import Callable, TypeVar, Protocol
+from typing import Callable, TypeVar
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.models.event import Event
-from app.models.proposal import ProposalStatusType
-from app.exceptions import ValidationError
+from app.exceptions import ConflictError, NotFoundError
 from app.utils.transaction import transaction
+from app.repositories.outbox_repository import OutboxRepository
 
 # TypeVar 정의
 TProposal = TypeVar('TProposal')
 TVote = TypeVar('TVote')
+TResponse = TypeVar('TResponse')
 
 
 class VoteUseCase:
     """투표 생성/삭제 공통 로직"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, outbox_repo: OutboxRepository | None = None):
         self.db = db
+        self.outbox_repo = outbox_repo
     
     def create_vote(
         self,
@@ -25,53 +27,51 @@ class VoteUseCase:
         proposal_id: UUID,
         user_id: UUID,
         # 타입별 의존성 주입
-        validate_event_fn: Callable[[UUID, str], Event],
-        get_proposal_fn: Callable[[UUID, UUID], TProposal],
-        validate_proposal_pending_fn: Callable[[TProposal, UUID, UUID, str], None],
-        check_duplicate_fn: Callable[[UUID, UUID], None],
-        create_vote_fn: Callable[[UUID, UUID], TVote],  # (proposal_id, user_id) -> vote
-        auto_approve_fn: Callable[[TProposal, Event], None],
-        build_response_fn: Callable[[TVote, TProposal, int], dict],
-    ) -> dict:
+        load_and_validate_fn: Callable[[UUID, UUID, str], tuple[Event, TProposal]],
+        create_vote_fn: Callable[[UUID, UUID, Event], TVote | None],  # (proposal_id, user_id, event) -> vote, 중복이면 None
+        count_votes_fn: Callable[[UUID], int],
+        can_auto_approve_fn: Callable[[Event, int], bool],
+        auto_approve_fn: Callable[[TProposal, Event, int], None],
+        build_response_fn: Callable[[str, TVote, TProposal, int], TResponse],
+    ) -> TResponse:
         """
         투표 생성 공통 로직
         
         Args:
-            validate_event_fn: 이벤트 상태 검증 함수 (IN_PROGRESS)
-            get_proposal_fn: proposal 조회 함수 (타입별)
-            validate_proposal_pending_fn: proposal PENDING 상태 검증 함수
-            check_duplicate_fn: 중복 투표 체크 함수 (타입별)
-            create_vote_fn: vote 생성 함수 (repository, 타입별)
-            auto_approve_fn: 자동 승인 체크 함수 (타입별)
-            build_response_fn: 응답 생성 함수 (타입별)
+            load_and_validate_fn: 이벤트/proposal 동시 조회 및 검증 함수 (IN_PROGRESS, PENDING, 타입별)
+            create_vote_fn: vote 생성 함수 (repository, 타입별, 이미 투표했으면 None)
+            count_votes_fn: 투표 수 COUNT 조회 함수 (repository, 타입별)
+            can_auto_approve_fn: 자동 승인 가능성 사전 체크 함수 (DB 조회 없음, 타입별)
+            auto_approve_fn: 자동 승인 체크 함수 (타입별, 위에서 조회한 vote_count 전달)
+            build_response_fn: 응답 생성 함수 (타입별, 메시지는 공통 로직에서 전달)
         """
-        # 1. 이벤트 상태 검증 (IN_PROGRESS)
-        event = validate_event_fn(event_id, "create votes")
-        
-        # 2. 제안 존재 및 상태 검증
-        proposal = get_proposal_fn(proposal_id, event_id)
-        validate_proposal_pending_fn(proposal, proposal_id, event_id, "create votes")
-        
-        # 3. 중복 투표 체크
-        check_duplicate_fn(proposal_id, user_id)
-        
-        # 4. 투표 생성 및 자동 승인 체크
-        with transaction(self.db):
-            # create_vote_fn은 (proposal_id, user_id)를 받아서 vote 객체를 생성하고 저장하는 함수
-            # 타입별 서비스에서 vote 모델 클래스를 사용하여 생성
-            created_vote = create_vote_fn(proposal_id, user_id)
-            # votes 관계를 로드하기 위해 refresh
-            self.db.refresh(proposal, ['votes'])
-            vote_count = len(proposal.votes) if proposal.votes else 0
+        with transaction(self.db, self.outbox_repo):
+            # 1. 이벤트 상태(IN_PROGRESS) 및 제안 존재/상태(PENDING) 검증
+            # 검증과 변경이 같은 트랜잭션(스냅샷)에서 수행되도록 트랜잭션 내부에서 한 번에 조회
+            event, proposal = load_and_validate_fn(event_id, proposal_id, "create votes")
+            
+            # 2. 투표 생성 (중복 투표 체크 포함) 및 자동 승인 체크
+            # create_vote_fn은 (proposal_id, user_id, event)를 받아서 vote를 INSERT ... ON CONFLICT DO NOTHING으로 저장
+            # 중복 확인을 유니크 제약에 맡기므로 사전 SELECT 없음 (event는 Outbox target에 재사용, 재조회 없음)
+            created_vote = create_vote_fn(proposal_id, user_id, event)
+            if created_vote is None:
+                raise ConflictError(
+                    message="Already voted",
+                    detail="You have already voted on this proposal"
+                )
+            # votes 컬렉션 로드 대신 COUNT로 투표 수 확인
+            vote_count = count_votes_fn(proposal_id)
             
             # 자동 승인 로직 체크 (PENDING 상태인 proposal에만)
-            auto_approve_fn(proposal, event)
-        
-        # refresh 후 vote_count 다시 계산 (자동 승인 후 vote_count 변경 가능)
-        self.db.refresh(proposal, ['votes'])
-        vote_count = len(proposal.votes) if proposal.votes else 0
+            # 임계값에 도달할 수 없으면 자동 승인 체크(승인 UPDATE 등) 생략
+            if can_auto_approve_fn(event, vote_count):
+                auto_approve_fn(proposal, event, vote_count)
+            
+            # 자동 승인은 투표 수를 바꾸지 않으므로 위 COUNT 결과로 응답 생성
+            # (commit 후 만료된 객체를 다시 로드하지 않도록 트랜잭션 내부에서 생성)
+            response = build_response_fn("Vote created successfully", created_vote, proposal, vote_count)
         
-        return build_response_fn(created_vote, proposal, vote_count)
+        return response
     
     def delete_vote(
         self,
@@ -79,48 +79,35 @@ class VoteUseCase:
         proposal_id: UUID,
         user_id: UUID,
         # 타입별 의존성 주입
-        validate_event_fn: Callable[[UUID, str], Event],
-        get_proposal_fn: Callable[[UUID, UUID], TProposal],
-        validate_proposal_pending_fn: Callable[[TProposal, UUID, UUID, str], None],
-        get_vote_fn: Callable[[UUID, UUID], TVote],
-        delete_vote_fn: Callable[[TVote], None],
-        auto_approve_fn: Callable[[TProposal, Event], None],
-        build_response_fn: Callable[[TVote, TProposal, int], dict],
-    ) -> dict:
+        load_and_validate_fn: Callable[[UUID, UUID, str], tuple[Event, TProposal]],
+        delete_vote_fn: Callable[[UUID, UUID, Event], TVote | None],  # (proposal_id, user_id, event) -> 삭제된 vote, 없으면 None
+        count_votes_fn: Callable[[UUID], int],
+        build_response_fn: Callable[[str, TVote, TProposal, int], TResponse],
+    ) -> TResponse:
         """
         투표 삭제 공통 로직
+        - 투표 수가 줄어들 뿐이므로 PENDING proposal이 새로 임계값에 도달할 수 없어 자동 승인 체크 없음
         
         Args:
-            validate_event_fn: 이벤트 상태 검증 함수 (IN_PROGRESS)
-            get_proposal_fn: proposal 조회 함수 (타입별)
-            validate_proposal_pending_fn: proposal PENDING 상태 검증 함수
-            get_vote_fn: vote 조회 함수 (타입별)
-            delete_vote_fn: vote 삭제 함수 (repository, 타입별)
-            auto_approve_fn: 자동 승인 체크 함수 (타입별)
-            build_response_fn: 응답 생성 함수 (타입별)
+            load_and_validate_fn: 이벤트/proposal 동시 조회 및 검증 함수 (IN_PROGRESS, PENDING, 타입별)
+            delete_vote_fn: vote 삭제 함수 (repository, 타입별, 투표하지 않았으면 None)
+            count_votes_fn: 투표 수 COUNT 조회 함수 (repository, 타입별)
+            build_response_fn: 응답 생성 함수 (타입별, 메시지는 공통 로직에서 전달)
         """
-        # 1. 이벤트 상태 검증 (IN_PROGRESS)
-        event = validate_event_fn(event_id, "delete votes")
-        
-        # 2. 제안 존재 및 상태 검증
-        proposal = get_proposal_fn(proposal_id, event_id)
-        validate_proposal_pending_fn(proposal, proposal_id, event_id, "delete votes")
-        
-        # 3. 투표 존재 및 소유권 검증
-        vote = get_vote_fn(proposal_id, user_id)
-        
-        # 4. 투표 삭제 및 자동 승인 재체크
-        with transaction(self.db):
-            delete_vote_fn(vote)
-            # votes 관계를 로드하기 위해 refresh
-            self.db.refresh(proposal, ['votes'])
-            vote_count = len(proposal.votes) if proposal.votes else 0
+        with transaction(self.db, self.outbox_repo):
+            # 1. 이벤트 상태(IN_PROGRESS) 및 제안 존재/상태(PENDING) 검증
+            event, proposal = load_and_validate_fn(event_id, proposal_id, "delete votes")
             
-            # 자동 승인 로직 재체크 (투표 수 감소 시, PENDING 상태인 proposal에만)
-            auto_approve_fn(proposal, event)
-        
-        # refresh 후 vote_count 다시 계산
-        self.db.refresh(proposal, ['votes'])
-        vote_count = len(proposal.votes) if proposal.votes else 0
+            # 2. 투표 삭제 (본인 투표만 대상, 존재 검증은 DELETE ... RETURNING 결과로 판단해 사전 SELECT 없음)
+            # event는 Outbox target에 재사용 (proposal/criterion 경유 조회 없음)
+            vote = delete_vote_fn(proposal_id, user_id, event)
+            if vote is None:
+                raise NotFoundError(
+                    message="Vote not found",
+                    detail="You have not voted on this proposal"
+                )
+            vote_count = count_votes_fn(proposal_id)
+            
+            response = build_response_fn("Vote deleted successfully", vote, proposal, vote_count)
         
-        return build_response_fn(vote, proposal, vote_count)
+        return response
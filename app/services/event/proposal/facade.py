@@ -1,5 +1,8 @@
-from datetime import datetime, timezone
-from uuid import UUID
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable
+from uuid import UUID, uuid4
 
 from app.models.event import Event, EventStatusType, MembershipStatusType
 from app.models.proposal import (
@@ -32,16 +35,180 @@ from app.exceptions import (
     ForbiddenError,
     ValidationError,
     ConflictError,
+    translate_message,
 )
 from app.utils.transaction import transaction
 from app.services.idempotency_service import IdempotencyService
 from app.repositories.outbox_repository import OutboxRepository
 from app.services.event.proposal.core.vote_usecase import VoteUseCase
-from app.services.event.proposal.core.auto_approval import AutoApprovalChecker
+from app.services.event.proposal.core.auto_approval import (
+    AssumptionAutoApproval,
+    CriterionAutoApproval,
+    ConclusionAutoApproval,
+)
 from app.services.event.proposal.core.approval_usecase import ApprovalUseCase
 from app.services.event.proposal.core.idempotency_wrapper import IdempotencyWrapper
 
 
+# 제안 생성 Idempotency 레코드 보관 기간 (생성 재시도는 짧은 시간 안에 일어나므로 기본 24시간보다 짧게)
+_CREATE_IDEMPOTENCY_TTL = timedelta(hours=1)
+
+# Outbox 페이로드의 proposal_type 값
+_ASSUMPTION = "assumption"
+_CRITERIA = "criteria"
+_CONCLUSION = "conclusion"
+_VOTE_CREATED = "proposal.vote.created.v1"
+_VOTE_DELETED = "proposal.vote.deleted.v1"
+
+# 관리자 승인/거절 Outbox의 이벤트 타입과 처리자 키 (ACCEPTED/REJECTED 외 상태는 KeyError)
+_OUTBOX_EVENT_TYPE = {
+    ProposalStatusType.ACCEPTED: "proposal.approved.v1",
+    ProposalStatusType.REJECTED: "proposal.rejected.v1",
+}
+_OUTBOX_ACTOR_KEY = {
+    ProposalStatusType.ACCEPTED: "approved_by",
+    ProposalStatusType.REJECTED: "rejected_by",
+}
+# 상태 변경 Idempotency 요청 본문 (상태별로 고정이므로 미리 생성해 공유, 읽기 전용)
+_STATUS_IDEMPOTENCY_BODY = {status: {"status": status.value} for status in ProposalStatusType}
+
+
+def _proposal_payload(
+    proposal_id: UUID,
+    proposal_type: str,
+    event_id: UUID | None = None,
+    **actor_ids: UUID | None
+) -> dict:
+    """
+    제안 Outbox 페이로드 생성
+    - event_id, approved_by/rejected_by는 승인/거절 이벤트에만 포함
+    """
+    payload = {"proposal_id": str(proposal_id), "proposal_type": proposal_type}
+    if event_id is not None:
+        payload["event_id"] = str(event_id)
+    for key, actor_id in actor_ids.items():
+        payload[key] = str(actor_id) if actor_id is not None else None
+    return payload
+
+# proposal_category별 필드 요구사항: (proposal_content 필요 여부, 대상 id(assumption_id/criteria_id) 필요 여부)
+_CATEGORY_RULES: dict[ProposalCategoryType, tuple[bool, bool]] = {
+    ProposalCategoryType.CREATION: (True, False),
+    ProposalCategoryType.MODIFICATION: (True, True),
+    ProposalCategoryType.DELETION: (False, True),
+}
+
+
+def _check_category_fields(
+    category: ProposalCategoryType,
+    proposal_content: str | None,
+    target_id: UUID | None,
+    target_field: str
+) -> bool:
+    """
+    proposal_category에 따른 필드 검증 (assumption/criteria 공통, 규칙은 _CATEGORY_RULES 조회)
+    - 대상 id가 필요한 카테고리면 True 반환 (호출 측에서 대상 존재 확인)
+    """
+    need_content, need_target = _CATEGORY_RULES[category]
+
+    if (proposal_content is not None) != need_content:
+        if need_content:
+            raise ValidationError(
+                message="Missing proposal_content",
+                detail="proposal_content is required for CREATION/MODIFICATION proposals"
+            )
+        raise ValidationError(
+            message="Invalid proposal_content",
+            detail="proposal_content must be NULL for DELETION proposals"
+        )
+
+    if (target_id is not None) != need_target:
+        if need_target:
+            raise ValidationError(
+                message=f"Missing {target_field}",
+                detail=f"{target_field} is required for {category.value} proposals"
+            )
+        raise ValidationError(
+            message=f"Invalid {target_field}",
+            detail=f"{target_field} must be NULL for CREATION proposals"
+        )
+
+    return need_target
+
+
+def _conclusion_min_votes(threshold_percent: int, total_members: int) -> int:
+    """vote_count * 100 >= threshold * total_members 를 만족하는 최소 투표 수 (정수 올림, 최소 1표)"""
+    return max(1, -(-threshold_percent * total_members // 100))
+
+
+def _build_status_response(response_cls, fields: tuple[str, ...], proposal, user_id: UUID):
+    """
+    상태 변경 응답 생성 (타입 공통, 복사할 필드는 fields로 지정)
+    - get_proposal_for_event_fn에서 함께 로드한 votes 재사용 (상태 변경은 투표를 바꾸지 않으므로 COUNT/투표 재조회 없음)
+    - ORM에서 읽은 값이므로 검증 생략, 모델 그대로 반환 (dict 왕복 없음)
+    """
+    votes = proposal.votes
+    values = {field: getattr(proposal, field) for field in fields}
+    return response_cls.model_construct(
+        **values,
+        vote_count=len(votes),
+        has_voted=any(vote.created_by == user_id for vote in votes)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _StatusUpdateSpec:
+    """제안 타입별 상태 변경 설정 (repository/서비스 메서드는 이름으로 지정해 호출 시 바인딩)"""
+    get_fn: str
+    approve_fn: str
+    reject_fn: str
+    apply_fn: str
+    build_response_fn: Callable[[object, UUID], object]
+    response_cls: type
+    path_segment: str
+
+
+_STATUS_UPDATE_SPECS: dict[str, _StatusUpdateSpec] = {
+    _ASSUMPTION: _StatusUpdateSpec(
+        get_fn="get_assumption_proposal_for_event",
+        approve_fn="approve_assumption_proposal_if_pending",
+        reject_fn="reject_assumption_proposal_if_pending",
+        apply_fn="_apply_assumption_proposal",
+        build_response_fn=partial(
+            _build_status_response, AssumptionProposalResponse,
+            ("id", "event_id", "assumption_id", "proposal_status", "proposal_category",
+             "proposal_content", "reason", "created_at", "created_by")
+        ),
+        response_cls=AssumptionProposalResponse,
+        path_segment="assumption-proposals",
+    ),
+    _CRITERIA: _StatusUpdateSpec(
+        get_fn="get_criteria_proposal_for_event",
+        approve_fn="approve_criteria_proposal_if_pending",
+        reject_fn="reject_criteria_proposal_if_pending",
+        apply_fn="_apply_criteria_proposal",
+        build_response_fn=partial(
+            _build_status_response, CriteriaProposalResponse,
+            ("id", "event_id", "criteria_id", "proposal_status", "proposal_category",
+             "proposal_content", "reason", "created_at", "created_by")
+        ),
+        response_cls=CriteriaProposalResponse,
+        path_segment="criteria-proposals",
+    ),
+    _CONCLUSION: _StatusUpdateSpec(
+        get_fn="get_conclusion_proposal_for_event",
+        approve_fn="approve_conclusion_proposal_if_pending",
+        reject_fn="reject_conclusion_proposal_if_pending",
+        apply_fn="_apply_conclusion_proposal",
+        build_response_fn=partial(
+            _build_status_response, ConclusionProposalResponse,
+            ("id", "criterion_id", "proposal_status", "proposal_content", "created_at", "created_by")
+        ),
+        response_cls=ConclusionProposalResponse,
+        path_segment="conclusion-proposals",
+    ),
+}
+
+
 class ProposalService(EventBaseService):
     """Proposal 관련 서비스"""
 
@@ -55,10 +222,122 @@ class ProposalService(EventBaseService):
         super().__init__(db, repos)
         self.idempotency_service = idempotency_service
         self.outbox_repo = outbox_repo
-        self.vote_usecase = VoteUseCase(db)
-        self.auto_approval_checker = AutoApprovalChecker(db)
-        self.approval_usecase = ApprovalUseCase(db)
+        self.vote_usecase = VoteUseCase(db, outbox_repo)
+        self.assumption_auto_approval = AssumptionAutoApproval(db)
+        self.criterion_auto_approval = CriterionAutoApproval(db)
+        self.conclusion_auto_approval = ConclusionAutoApproval(db)
+        self.approval_usecase = ApprovalUseCase(db, outbox_repo)
         self.idempotency_wrapper = IdempotencyWrapper(idempotency_service)
+        # 자동 승인 Outbox 콜백은 생성 시점에 타입별로 바인딩
+        # (outbox_repo가 없으면 None을 넘겨 자동 승인 체커가 호출 자체를 생략)
+        if outbox_repo:
+            self._emit_assumption_auto_approved = partial(self._buffer_auto_approved_event, proposal_type=_ASSUMPTION)
+            self._emit_criteria_auto_approved = partial(self._buffer_auto_approved_event, proposal_type=_CRITERIA)
+            self._emit_conclusion_auto_approved = partial(self._buffer_auto_approved_event, proposal_type=_CONCLUSION)
+        else:
+            self._emit_assumption_auto_approved = None
+            self._emit_criteria_auto_approved = None
+            self._emit_conclusion_auto_approved = None
+        # 투표 생성/삭제 Outbox 콜백도 타입별로 한 번만 바인딩 (페이로드 키 구성이 고정)
+        if outbox_repo:
+            self._emit_assumption_vote_event = partial(self._buffer_vote_event, proposal_type=_ASSUMPTION)
+            self._emit_criteria_vote_event = partial(self._buffer_vote_event, proposal_type=_CRITERIA)
+            self._emit_conclusion_vote_event = partial(self._buffer_vote_event, proposal_type=_CONCLUSION)
+        else:
+            self._emit_assumption_vote_event = None
+            self._emit_criteria_vote_event = None
+            self._emit_conclusion_vote_event = None
+        # 관리자 상태 변경(승인/거절) Outbox 콜백도 타입별로 한 번만 바인딩
+        self._emit_status_events = {
+            kind: partial(self._buffer_status_event, proposal_type=kind) if outbox_repo else None
+            for kind in (_ASSUMPTION, _CRITERIA, _CONCLUSION)
+        }
+        # 요청 단위 이벤트 캐시 (서비스는 요청마다 생성되므로 캐시 수명 = 요청)
+        self._event_cache: dict[UUID, Event] = {}
+
+    def _verify_admin_cached(self, event_id: UUID, user_id: UUID) -> Event:
+        """
+        관리자 권한 확인 (요청 단위 이벤트 캐시 재사용)
+        - 같은 요청에서 반복 호출돼도 이벤트 SELECT는 한 번, 권한 비교는 매번 수행
+        """
+        event = self._event_cache.get(event_id)
+        if event is None:
+            event = self.verify_admin(event_id, user_id)
+            self._event_cache[event_id] = event
+            return event
+        if event.admin_id != user_id:
+            raise ForbiddenError(
+                message="Forbidden",
+                detail="Only event administrator can perform this action"
+            )
+        return event
+
+    def _validate_create_preflight(
+        self,
+        row: tuple | None,
+        event_id: UUID,
+        operation: str
+    ) -> tuple[Event, bool]:
+        """
+        제안 생성 사전 조회 결과 검증 (이벤트 IN_PROGRESS, 멤버십 ACCEPTED)
+        - 중복 PENDING 제안 여부는 필드 검증 이후에 판단하도록 그대로 반환
+        - 타입별 추가 값(row[3:])은 호출 측에서 확인
+        """
+        if row is None:
+            raise NotFoundError(
+                message="Event not found",
+                detail=f"Event with id {event_id} not found"
+            )
+        event, membership_status, has_duplicate = row[:3]
+        self._event_cache[event_id] = event
+        self._validate_event_status(event, EventStatusType.IN_PROGRESS, operation)
+        if membership_status != MembershipStatusType.ACCEPTED:
+            raise ForbiddenError(
+                message="Forbidden",
+                detail=f"Only accepted members can {operation}"
+            )
+        return event, has_duplicate
+
+    def _buffer_auto_approved_event(
+        self, proposal, event: Event, proposal_type: str
+    ) -> None:
+        """
+        자동 승인 Outbox 이벤트 추가 (트랜잭션 내부, 타입 공통)
+        - 검증 시 함께 조회한 이벤트 사용 (conclusion도 criterion 재조회 없음)
+        """
+        self.outbox_repo.buffer_event(
+            event_type="proposal.approved.v1",
+            payload=_proposal_payload(proposal.id, proposal_type, event.id, approved_by=None),
+            target_event_id=event.id
+        )
+
+    def _buffer_status_event(
+        self, proposal, event: Event, status: ProposalStatusType, user_id: UUID, proposal_type: str
+    ) -> None:
+        """
+        관리자 승인/거절 Outbox 이벤트 추가 (트랜잭션 내부, 타입 공통)
+        - 소속 검증을 통과했으므로 관리자 검증 시 조회한 이벤트 사용 (conclusion도 criterion 재조회 없음)
+        - 상태별 이벤트 타입/처리자 키는 모듈 상수에서 조회 (예상 밖 상태는 rejected로 흘리지 않고 KeyError)
+        """
+        payload = _proposal_payload(
+            proposal.id, proposal_type, event.id, **{_OUTBOX_ACTOR_KEY[status]: user_id}
+        )
+        self.outbox_repo.buffer_event(
+            event_type=_OUTBOX_EVENT_TYPE[status], payload=payload, target_event_id=event.id
+        )
+
+    def _buffer_vote_event(
+        self, event_type: str, proposal_id: UUID, event: Event, proposal_type: str
+    ) -> None:
+        """
+        투표 생성/삭제 Outbox 이벤트 추가 (트랜잭션 내부, 타입 공통)
+        - 페이로드 키가 고정이므로 범용 _proposal_payload 대신 dict 리터럴로 바로 생성
+        """
+        self.outbox_repo.buffer_event(
+            event_type=event_type,
+            payload={"proposal_id": str(proposal_id), "proposal_type": proposal_type},
+            target_event_id=event.id
+        )
 
     def create_assumption_proposal(
         self,
@@ -73,55 +352,56 @@ class ProposalService(EventBaseService):
         - ACCEPTED 멤버십 필요
         - 중복 제안 체크 (PENDING 상태만)
         """
-        def _execute_create() -> dict:
-            # 1. 이벤트 상태 검증 (IN_PROGRESS)
-            event = self._validate_event_in_progress(event_id, "create proposals")
-
-            # 2. 멤버십 검증 (ACCEPTED)
-            self._validate_membership_accepted(user_id, event_id, "create proposals")
+        def _execute_create() -> AssumptionProposalResponse:
+            # 1~2. 이벤트 상태(IN_PROGRESS), 멤버십(ACCEPTED) 검증
+            # 이벤트, 멤버십 상태, 중복 제안 여부를 한 번의 쿼리로 조회
+            event, has_duplicate = self._validate_create_preflight(
+                self.repos.proposal.get_event_with_assumption_create_preflight(
+                    event_id, request.assumption_id, user_id
+                ),
+                event_id,
+                "create proposals"
+            )
 
             # 3. proposal_category에 따른 필드 검증
             self._validate_proposal_category_fields(request, event_id)
 
-            # 4. 중복 제안 체크 (PENDING 상태만)
-            existing_proposal = self.repos.proposal.get_pending_assumption_proposal_by_user(
-                event_id, request.assumption_id, user_id
-            )
-            if existing_proposal:
+            # 4. 중복 제안 체크 (PENDING 상태만, 위에서 함께 조회)
+            if has_duplicate:
                 raise ConflictError(
                     message="Duplicate proposal",
                     detail="You already have a pending proposal for this assumption"
                 )
 
-            # 5. 제안 생성
-            proposal = AssumptionProposal(
-                event_id=event_id,
-                assumption_id=request.assumption_id,
-                proposal_category=request.proposal_category,
-                proposal_content=request.proposal_content,
-                reason=request.reason,
-                created_by=user_id,
-                proposal_status=ProposalStatusType.PENDING,
-            )
-            with transaction(self.db):
-                created_proposal = self.repos.proposal.create_assumption_proposal(proposal)
-                # votes 관계를 로드하기 위해 refresh (재조회 대신)
-                self.db.refresh(created_proposal, ['votes'])
+            # 5. 제안 생성 (INSERT ... ON CONFLICT DO NOTHING)
+            # 위 사전 조회는 빠른 실패용, 동시 요청 간 중복은 PENDING 유니크 인덱스로 최종 차단
+            with transaction(self.db, self.outbox_repo):
+                created_proposal = self.repos.proposal.create_assumption_proposal_if_no_pending(
+                    event_id=event_id,
+                    assumption_id=request.assumption_id,
+                    proposal_category=request.proposal_category,
+                    proposal_content=request.proposal_content,
+                    reason=request.reason,
+                    created_by=user_id,
+                )
+                if created_proposal is None:
+                    raise ConflictError(
+                        message="Duplicate proposal",
+                        detail="You already have a pending proposal for this assumption"
+                    )
                 
                 # Outbox 이벤트 추가 (트랜잭션 내부)
                 if self.outbox_repo:
-                    self.outbox_repo.create_outbox_event(
+                    self.outbox_repo.buffer_event(
                         event_type="proposal.created.v1",
-                        payload={
-                            "proposal_id": str(created_proposal.id),
-                            "proposal_type": "assumption"
-                        },
+                        payload=_proposal_payload(created_proposal.id, _ASSUMPTION),
                         target_event_id=event_id
                     )
-            vote_count = len(created_proposal.votes) if created_proposal.votes else 0
-            has_voted = False  # 새로 생성된 제안이므로 투표 없음
+            vote_count = 0  # 새로 생성된 제안이므로 투표 없음 (votes 조회 불필요)
+            has_voted = False
 
-            response = AssumptionProposalResponse(
+            # ORM에서 읽은 값(이미 올바른 타입)이므로 검증 생략, 모델 그대로 반환 (dict 왕복 없음)
+            response = AssumptionProposalResponse.model_construct(
                 id=created_proposal.id,
                 event_id=created_proposal.event_id,
                 assumption_id=created_proposal.assumption_id,
@@ -134,18 +414,19 @@ class ProposalService(EventBaseService):
                 vote_count=vote_count,
                 has_voted=has_voted,
             )
-            return response.model_dump()
+            return response
         
         # Idempotency 적용
-        result = self.idempotency_wrapper.wrap(
+        return self.idempotency_wrapper.wrap(
             idempotency_key=idempotency_key,
             user_id=user_id,
             method="POST",
             path=f"/events/{event_id}/assumption-proposals",
-            body=request.model_dump(exclude_none=True, mode='json'),
-            fn=_execute_create
+            body=request,  # 직렬화는 Idempotency 적용 시에만 (정규화 단계에서 1회)
+            fn=_execute_create,
+            response_model=AssumptionProposalResponse,
+            ttl=_CREATE_IDEMPOTENCY_TTL
         )
-        return AssumptionProposalResponse(**result)
 
     def create_assumption_proposal_vote(
         self,
@@ -158,85 +439,17 @@ class ProposalService(EventBaseService):
         - IN_PROGRESS 상태에서만 가능
         - PENDING 제안에만 투표 가능
         """
-        def validate_proposal_pending(proposal, pid, eid, op):
-            if not proposal or proposal.event_id != eid:
-                raise NotFoundError(
-                    message="Proposal not found",
-                    detail=f"Proposal with id {pid} not found for this event"
-                )
-            if proposal.proposal_status != ProposalStatusType.PENDING:
-                raise ValidationError(
-                    message="Proposal not pending",
-                    detail=f"{op} can only be performed for PENDING proposals"
-                )
-        
-        def create_vote(pid, uid):
-            vote = AssumptionProposalVote(
-                assumption_proposal_id=pid,
-                created_by=uid,
-            )
-            created_vote = self.repos.proposal.create_assumption_proposal_vote(vote)
-            
-            # Outbox 이벤트 추가 (트랜잭션 내부)
-            if self.outbox_repo:
-                proposal = self.repos.proposal.get_assumption_proposal_by_id(pid)
-                if proposal:
-                    self.outbox_repo.create_outbox_event(
-                        event_type="proposal.vote.created.v1",
-                        payload={
-                            "proposal_id": str(pid),
-                            "proposal_type": "assumption"
-                        },
-                        target_event_id=proposal.event_id
-                    )
-            
-            return created_vote
-        
-        def auto_approve(proposal, event):
-            vote_count = len(proposal.votes) if proposal.votes else 0
-            self.auto_approval_checker.check_and_auto_approve(
-                proposal=proposal,
-                event=event,
-                vote_count=vote_count,
-                min_votes_required=event.assumption_min_votes_required,
-                approval_threshold_percent=None,
-                total_members=None,
-                is_auto_approved=event.assumption_is_auto_approved_by_votes,
-                approve_if_pending_fn=self.repos.proposal.approve_assumption_proposal_if_pending,
-                apply_proposal_fn=self._apply_assumption_proposal,
-                create_outbox_event_fn=lambda p, e: self.outbox_repo.create_outbox_event(
-                    event_type="proposal.approved.v1",
-                    payload={
-                        "proposal_id": str(p.id),
-                        "proposal_type": "assumption",
-                        "event_id": str(p.event_id),
-                        "approved_by": None
-                    },
-                    target_event_id=p.event_id
-                ) if self.outbox_repo else None,
-            )
-        
-        def build_response(vote, proposal, vote_count):
-            return AssumptionProposalVoteResponse(
-                message="Vote created successfully",
-                vote_id=vote.id,
-                proposal_id=proposal_id,
-                vote_count=vote_count,
-            ).model_dump()
-        
-        result = self.vote_usecase.create_vote(
+        return self.vote_usecase.create_vote(
             event_id=event_id,
             proposal_id=proposal_id,
             user_id=user_id,
-            validate_event_fn=self._validate_event_in_progress,
-            get_proposal_fn=lambda pid, eid: self.repos.proposal.get_assumption_proposal_by_id(pid),
-            validate_proposal_pending_fn=validate_proposal_pending,
-            check_duplicate_fn=self._check_duplicate_vote,
-            create_vote_fn=create_vote,
-            auto_approve_fn=auto_approve,
-            build_response_fn=build_response,
+            load_and_validate_fn=self._validate_proposal_pending,
+            create_vote_fn=self._create_assumption_vote,
+            count_votes_fn=self.repos.proposal.count_assumption_proposal_votes,
+            can_auto_approve_fn=self.assumption_auto_approval.can_auto_approve,
+            auto_approve_fn=self._assumption_auto_approve,
+            build_response_fn=self._build_assumption_vote_response,
         )
-        return AssumptionProposalVoteResponse(**result)
 
     def delete_assumption_proposal_vote(
         self,
@@ -250,107 +463,86 @@ class ProposalService(EventBaseService):
         - 본인 투표만 삭제 가능
         - PENDING 제안에만 투표 삭제 가능
         """
-        def validate_proposal_pending(proposal, pid, eid, op):
-            if not proposal or proposal.event_id != eid:
-                raise NotFoundError(
-                    message="Proposal not found",
-                    detail=f"Proposal with id {pid} not found for this event"
-                )
-            if proposal.proposal_status != ProposalStatusType.PENDING:
-                raise ValidationError(
-                    message="Proposal not pending",
-                    detail=f"{op} can only be performed for PENDING proposals"
-                )
-        
-        def get_vote(pid, uid):
-            vote = self.repos.proposal.get_user_vote_on_assumption_proposal(pid, uid)
-            if not vote:
-                raise NotFoundError(
-                    message="Vote not found",
-                    detail="You have not voted on this proposal"
-                )
-            return vote
+        return self.vote_usecase.delete_vote(
+            event_id=event_id,
+            proposal_id=proposal_id,
+            user_id=user_id,
+            load_and_validate_fn=self._validate_proposal_pending,
+            delete_vote_fn=self._delete_assumption_vote,
+            count_votes_fn=self.repos.proposal.count_assumption_proposal_votes,
+            build_response_fn=self._build_assumption_vote_response,
+        )
+
+    def _create_assumption_vote(
+        self, proposal_id: UUID, user_id: UUID, event: Event
+    ) -> AssumptionProposalVote | None:
+        """투표 생성 및 Outbox 이벤트 추가 (검증 시 조회한 이벤트 재사용, 이미 투표했으면 None)"""
+        created_vote = self.repos.proposal.create_assumption_proposal_vote(proposal_id, user_id)
+        if created_vote is None:
+            return None
         
-        def delete_vote(vote):
-            # Outbox 이벤트 추가를 위해 proposal 조회 (트랜잭션 내부)
-            proposal = self.repos.proposal.get_assumption_proposal_by_id(vote.assumption_proposal_id)
-            
-            self.repos.proposal.delete_assumption_proposal_vote(vote)
-            
-            # Outbox 이벤트 추가 (트랜잭션 내부)
-            if self.outbox_repo and proposal:
-                self.outbox_repo.create_outbox_event(
-                    event_type="proposal.vote.deleted.v1",
-                    payload={
-                        "proposal_id": str(vote.assumption_proposal_id),
-                        "proposal_type": "assumption"
-                    },
-                    target_event_id=proposal.event_id
-                )
+        if self._emit_assumption_vote_event:
+            self._emit_assumption_vote_event(_VOTE_CREATED, proposal_id, event)
         
-        def auto_approve(proposal, event):
-            vote_count = len(proposal.votes) if proposal.votes else 0
-            self.auto_approval_checker.check_and_auto_approve(
-                proposal=proposal,
-                event=event,
-                vote_count=vote_count,
-                min_votes_required=event.assumption_min_votes_required,
-                approval_threshold_percent=None,
-                total_members=None,
-                is_auto_approved=event.assumption_is_auto_approved_by_votes,
-                approve_if_pending_fn=self.repos.proposal.approve_assumption_proposal_if_pending,
-                apply_proposal_fn=self._apply_assumption_proposal,
-                create_outbox_event_fn=lambda p, e: self.outbox_repo.create_outbox_event(
-                    event_type="proposal.approved.v1",
-                    payload={
-                        "proposal_id": str(p.id),
-                        "proposal_type": "assumption",
-                        "event_id": str(p.event_id),
-                        "approved_by": None
-                    },
-                    target_event_id=p.event_id
-                ) if self.outbox_repo else None,
-            )
+        return created_vote
+
+    def _delete_assumption_vote(
+        self, proposal_id: UUID, user_id: UUID, event: Event
+    ) -> AssumptionProposalVote | None:
+        """투표 삭제 및 Outbox 이벤트 추가 (검증 시 조회한 이벤트 재사용, 투표하지 않았으면 None)"""
+        deleted_vote = self.repos.proposal.delete_assumption_proposal_vote(proposal_id, user_id)
+        if deleted_vote is None:
+            return None
         
-        def build_response(vote, proposal, vote_count):
-            return AssumptionProposalVoteResponse(
-                message="Vote deleted successfully",
-                vote_id=vote.id,
-                proposal_id=proposal_id,
-                vote_count=vote_count,
-            ).model_dump()
+        if self._emit_assumption_vote_event:
+            self._emit_assumption_vote_event(_VOTE_DELETED, proposal_id, event)
         
-        result = self.vote_usecase.delete_vote(
-            event_id=event_id,
-            proposal_id=proposal_id,
-            user_id=user_id,
-            validate_event_fn=self._validate_event_in_progress,
-            get_proposal_fn=lambda pid, eid: self.repos.proposal.get_assumption_proposal_by_id(pid),
-            validate_proposal_pending_fn=validate_proposal_pending,
-            get_vote_fn=get_vote,
-            delete_vote_fn=delete_vote,
-            auto_approve_fn=auto_approve,
-            build_response_fn=build_response,
+        return deleted_vote
+
+    def _assumption_auto_approve(
+        self, proposal: AssumptionProposal, event: Event, vote_count: int
+    ) -> None:
+        """투표 생성 후 자동 승인 체크 (투표 수 기반)"""
+        self.assumption_auto_approval.check_and_auto_approve(
+            proposal=proposal,
+            event=event,
+            vote_count=vote_count,
+            min_votes_required=event.assumption_min_votes_required,
+            approval_threshold_percent=None,
+            total_members=None,
+            is_auto_approved=event.assumption_is_auto_approved_by_votes,
+            # 투표 수 확인 + 승인 + 전제 적용을 단일 문장으로 수행 (별도 적용 단계 없음)
+            approve_if_pending_fn=self._approve_and_apply_assumption_proposal,
+            apply_proposal_fn=None,
+            create_outbox_event_fn=self._emit_assumption_auto_approved,
         )
-        return AssumptionProposalVoteResponse(**result)
 
-    def _validate_proposal_pending(
-        self, proposal_id: UUID, event_id: UUID, operation: str
-    ) -> AssumptionProposal:
-        """제안 존재 및 PENDING 상태 검증"""
-        proposal = self.repos.proposal.get_assumption_proposal_by_id(proposal_id)
-        if not proposal or proposal.event_id != event_id:
-            raise NotFoundError(
-                message="Proposal not found",
-                detail=f"Proposal with id {proposal_id} not found for this event"
-            )
+    def _approve_and_apply_assumption_proposal(
+        self, proposal: AssumptionProposal, event: Event, accepted_at: datetime
+    ) -> AssumptionProposal | None:
+        """자동 승인 체커용 조건부 승인 함수 (투표 수 확인 + 승인 + 전제 적용을 단일 문장으로)"""
+        return self.repos.proposal.approve_and_apply_assumption_proposal_if_votes_reach(
+            proposal, event.assumption_min_votes_required, accepted_at, uuid4()
+        )
 
-        if proposal.proposal_status != ProposalStatusType.PENDING:
-            raise ValidationError(
-                message="Proposal not pending",
-                detail=f"{operation} can only be performed for PENDING proposals"
-            )
-        return proposal
+    def _build_assumption_vote_response(
+        self, message: str, vote: AssumptionProposalVote, proposal: AssumptionProposal, vote_count: int
+    ) -> AssumptionProposalVoteResponse:
+        """투표 생성/삭제 응답 생성 (모델 그대로 반환, dict 왕복 없음)"""
+        # 서버에서 만든 값이므로 검증 생략 (메시지 번역 model_validator도 생략되므로 여기서 번역)
+        return AssumptionProposalVoteResponse.model_construct(
+            message=translate_message(message),
+            vote_id=vote.id,
+            proposal_id=proposal.id,
+            vote_count=vote_count,
+        )
+
+    def _validate_proposal_pending(
+        self, event_id: UUID, proposal_id: UUID, operation: str
+    ) -> tuple[Event, AssumptionProposal]:
+        """이벤트 IN_PROGRESS, 제안 존재 및 PENDING 상태 검증 (이벤트/제안 동시 조회)"""
+        row = self.repos.proposal.get_assumption_proposal_with_event(proposal_id, event_id)
+        return self._validate_event_and_proposal_pending(row, event_id, proposal_id, operation)
 
     def _validate_assumption_for_proposal(
         self, assumption_id: UUID, event_id: UUID, proposal_category: ProposalCategoryType
@@ -373,114 +565,15 @@ class ProposalService(EventBaseService):
         self, request: AssumptionProposalCreateRequest, event_id: UUID
     ) -> None:
         """proposal_category에 따른 필드 검증 (proposal_content, assumption_id)"""
-        if request.proposal_category == ProposalCategoryType.DELETION:
-            if request.proposal_content is not None:
-                raise ValidationError(
-                    message="Invalid proposal_content",
-                    detail="proposal_content must be NULL for DELETION proposals"
-                )
-        else:
-            if request.proposal_content is None:
-                raise ValidationError(
-                    message="Missing proposal_content",
-                    detail="proposal_content is required for CREATION/MODIFICATION proposals"
-                )
-
-        if request.proposal_category == ProposalCategoryType.CREATION:
-            if request.assumption_id is not None:
-                raise ValidationError(
-                    message="Invalid assumption_id",
-                    detail="assumption_id must be NULL for CREATION proposals"
-                )
-        else:
-            if request.assumption_id is None:
-                raise ValidationError(
-                    message="Missing assumption_id",
-                    detail=f"assumption_id is required for {request.proposal_category.value} proposals"
-                )
+        need_target = _check_category_fields(
+            request.proposal_category, request.proposal_content, request.assumption_id, "assumption_id"
+        )
+        if need_target:
             # assumption 존재 확인
             self._validate_assumption_for_proposal(
                 request.assumption_id, event_id, request.proposal_category
             )
 
-    def _check_duplicate_vote(self, proposal_id: UUID, user_id: UUID) -> None:
-        """중복 투표 체크"""
-        existing_vote = self.repos.proposal.get_user_vote_on_assumption_proposal(
-            proposal_id, user_id
-        )
-        if existing_vote:
-            raise ConflictError(
-                message="Already voted",
-                detail="You have already voted on this proposal"
-            )
-
-    def _get_user_vote_or_raise(
-        self, proposal_id: UUID, user_id: UUID
-    ) -> AssumptionProposalVote:
-        """투표 존재 검증"""
-        vote = self.repos.proposal.get_user_vote_on_assumption_proposal(
-            proposal_id, user_id
-        )
-        if not vote:
-            raise NotFoundError(
-                message="Vote not found",
-                detail="You have not voted on this proposal"
-            )
-        return vote
-
-    def _check_and_auto_approve_assumption_proposal(
-        self, proposal: AssumptionProposal, event: Event
-    ) -> None:
-        """
-        투표 수가 일정 수준 도달 시 자동 승인
-        
-        정책:
-        - auto_approved, min_votes_required 설정은 PENDING 상태인 proposal에만 소급 적용
-        - 이미 ACCEPTED, REJECTED된 proposal에는 반영되지 않음
-        
-        동작:
-        - assumption_is_auto_approved_by_votes가 True일 때만 동작
-        - assumption_min_votes_required 이상이면 ACCEPTED로 변경
-        - 승인 시 자동으로 제안 적용 (apply_proposal 호출)
-        - PENDING 상태인 proposal에만 적용 (이미 ACCEPTED/REJECTED된 것은 무시)
-        """
-        # PENDING 상태가 아니면 자동 승인 로직 적용하지 않음
-        if proposal.proposal_status != ProposalStatusType.PENDING:
-            return
-
-        if not event.assumption_is_auto_approved_by_votes:
-            return
-
-        if event.assumption_min_votes_required is None:
-            return
-
-        vote_count = len(proposal.votes)
-        if vote_count >= event.assumption_min_votes_required:
-            # 조건부 UPDATE로 락 없이 중복 승인 방지
-            accepted_at = datetime.now(timezone.utc)
-            approved_proposal = self.repos.proposal.approve_assumption_proposal_if_pending(
-                proposal.id, accepted_at
-            )
-            if approved_proposal:
-                # 승인 성공 시 proposal을 다시 조회하여 관계 로드
-                self.db.refresh(approved_proposal, ['votes', 'assumption'])
-                # 자동 승인 시 즉시 적용
-                self._apply_assumption_proposal(approved_proposal, event)
-                
-                # Outbox 이벤트 추가 (트랜잭션 내부)
-                if self.outbox_repo:
-                    self.outbox_repo.create_outbox_event(
-                        event_type="proposal.approved.v1",
-                        payload={
-                            "proposal_id": str(approved_proposal.id),
-                            "proposal_type": "assumption",
-                            "event_id": str(approved_proposal.event_id),
-                            "approved_by": None  # 자동 승인
-                        },
-                        target_event_id=approved_proposal.event_id
-                    )
-                # commit은 외부 트랜잭션 매니저가 처리
-
     def _apply_assumption_proposal(
         self, proposal: AssumptionProposal, event: Event
     ) -> None:
@@ -490,6 +583,7 @@ class ProposalService(EventBaseService):
         - MODIFICATION: 기존 Assumption 수정 (original_content 저장, is_modified=True)
         - DELETION: 기존 Assumption 소프트 삭제 (is_deleted=True)
         """
+        applied_target_id = None
         if proposal.proposal_category == ProposalCategoryType.CREATION:
             # 새 전제 생성
             assumption = Assumption(
@@ -498,26 +592,26 @@ class ProposalService(EventBaseService):
                 created_by=proposal.created_by,
             )
             result = self.repos.assumption.create_assumptions([assumption])
-            proposal.applied_target_id = result[0].id
+            applied_target_id = result[0].id
         elif proposal.proposal_category == ProposalCategoryType.MODIFICATION:
-            # 기존 전제 수정
-            assumption = self.repos.assumption.get_by_id(proposal.assumption_id)
-            if assumption:
-                assumption.original_content = assumption.content  # 원본 저장
-                assumption.content = proposal.proposal_content
-                assumption.is_modified = True
-                self.repos.assumption.update_assumption(assumption, proposal.created_by)
-                proposal.applied_target_id = assumption.id
+            # 기존 전제 수정 (원본 보존까지 단일 UPDATE로 처리, 사전 조회 없음)
+            applied_target_id = self.repos.assumption.modify_content(
+                proposal.assumption_id, proposal.proposal_content, proposal.created_by
+            )
         elif proposal.proposal_category == ProposalCategoryType.DELETION:
-            # 소프트 삭제
-            assumption = self.repos.assumption.get_by_id(proposal.assumption_id)
-            if assumption:
-                assumption.is_deleted = True
-                self.repos.assumption.update_assumption(assumption, proposal.created_by)
-                proposal.applied_target_id = assumption.id
+            # 소프트 삭제 (단일 UPDATE, 사전 조회 없음)
+            applied_target_id = self.repos.assumption.soft_delete(
+                proposal.assumption_id, proposal.created_by
+            )
+        if applied_target_id is None:
+            # 수정/삭제 대상 전제가 없거나 이미 삭제됨 (투표 자동 승인과 같은 기준, 트랜잭션 롤백으로 PENDING 유지)
+            raise ConflictError(
+                message="Proposal target unavailable",
+                detail="The target of this proposal no longer exists or has been deleted"
+            )
 
-        proposal.applied_at = datetime.now(timezone.utc)
-        self.repos.proposal.update_assumption_proposal(proposal)
+        # applied_at은 DB 시각으로, 적용 대상 id와 함께 단일 UPDATE로 기록
+        self.repos.proposal.mark_assumption_proposal_applied(proposal, applied_target_id)
 
     # ============================================================================
     # Criteria Proposal Methods
@@ -536,55 +630,56 @@ class ProposalService(EventBaseService):
         - ACCEPTED 멤버십 필요
         - 중복 제안 체크 (PENDING 상태만)
         """
-        def _execute_create() -> dict:
-            # 1. 이벤트 상태 검증 (IN_PROGRESS)
-            event = self._validate_event_in_progress(event_id, "create proposals")
-
-            # 2. 멤버십 검증 (ACCEPTED)
-            self._validate_membership_accepted(user_id, event_id, "create proposals")
+        def _execute_create() -> CriteriaProposalResponse:
+            # 1~2. 이벤트 상태(IN_PROGRESS), 멤버십(ACCEPTED) 검증
+            # 이벤트, 멤버십 상태, 중복 제안 여부를 한 번의 쿼리로 조회
+            event, has_duplicate = self._validate_create_preflight(
+                self.repos.proposal.get_event_with_criteria_create_preflight(
+                    event_id, request.criteria_id, user_id
+                ),
+                event_id,
+                "create proposals"
+            )
 
             # 3. proposal_category에 따른 필드 검증
             self._validate_criteria_proposal_category_fields(request, event_id)
 
-            # 4. 중복 제안 체크 (PENDING 상태만)
-            existing_proposal = self.repos.proposal.get_pending_criteria_proposal_by_user(
-                event_id, request.criteria_id, user_id
-            )
-            if existing_proposal:
+            # 4. 중복 제안 체크 (PENDING 상태만, 위에서 함께 조회)
+            if has_duplicate:
                 raise ConflictError(
                     message="Duplicate proposal",
                     detail="You already have a pending proposal for this criterion"
                 )
 
-            # 5. 제안 생성
-            proposal = CriteriaProposal(
-                event_id=event_id,
-                criteria_id=request.criteria_id,
-                proposal_category=request.proposal_category,
-                proposal_content=request.proposal_content,
-                reason=request.reason,
-                created_by=user_id,
-                proposal_status=ProposalStatusType.PENDING,
-            )
-            with transaction(self.db):
-                created_proposal = self.repos.proposal.create_criteria_proposal(proposal)
-                # votes 관계를 로드하기 위해 refresh (재조회 대신)
-                self.db.refresh(created_proposal, ['votes'])
+            # 5. 제안 생성 (INSERT ... ON CONFLICT DO NOTHING)
+            # 위 사전 조회는 빠른 실패용, 동시 요청 간 중복은 PENDING 유니크 인덱스로 최종 차단
+            with transaction(self.db, self.outbox_repo):
+                created_proposal = self.repos.proposal.create_criteria_proposal_if_no_pending(
+                    event_id=event_id,
+                    criteria_id=request.criteria_id,
+                    proposal_category=request.proposal_category,
+                    proposal_content=request.proposal_content,
+                    reason=request.reason,
+                    created_by=user_id,
+                )
+                if created_proposal is None:
+                    raise ConflictError(
+                        message="Duplicate proposal",
+                        detail="You already have a pending proposal for this criterion"
+                    )
                 
                 # Outbox 이벤트 추가 (트랜잭션 내부)
                 if self.outbox_repo:
-                    self.outbox_repo.create_outbox_event(
+                    self.outbox_repo.buffer_event(
                         event_type="proposal.created.v1",
-                        payload={
-                            "proposal_id": str(created_proposal.id),
-                            "proposal_type": "criteria"
-                        },
+                        payload=_proposal_payload(created_proposal.id, _CRITERIA),
                         target_event_id=event_id
                     )
-            vote_count = len(created_proposal.votes) if created_proposal.votes else 0
-            has_voted = False  # 새로 생성된 제안이므로 투표 없음
+            vote_count = 0  # 새로 생성된 제안이므로 투표 없음 (votes 조회 불필요)
+            has_voted = False
 
-            response = CriteriaProposalResponse(
+            # ORM에서 읽은 값(이미 올바른 타입)이므로 검증 생략, 모델 그대로 반환 (dict 왕복 없음)
+            response = CriteriaProposalResponse.model_construct(
                 id=created_proposal.id,
                 event_id=created_proposal.event_id,
                 criteria_id=created_proposal.criteria_id,
@@ -597,18 +692,19 @@ class ProposalService(EventBaseService):
                 vote_count=vote_count,
                 has_voted=has_voted,
             )
-            return response.model_dump()
+            return response
         
         # Idempotency 적용
-        result = self.idempotency_wrapper.wrap(
+        return self.idempotency_wrapper.wrap(
             idempotency_key=idempotency_key,
             user_id=user_id,
             method="POST",
             path=f"/events/{event_id}/criteria-proposals",
-            body=request.model_dump(exclude_none=True, mode='json'),
-            fn=_execute_create
+            body=request,  # 직렬화는 Idempotency 적용 시에만 (정규화 단계에서 1회)
+            fn=_execute_create,
+            response_model=CriteriaProposalResponse,
+            ttl=_CREATE_IDEMPOTENCY_TTL
         )
-        return CriteriaProposalResponse(**result)
 
     def create_criteria_proposal_vote(
         self,
@@ -621,85 +717,17 @@ class ProposalService(EventBaseService):
         - IN_PROGRESS 상태에서만 가능
         - PENDING 제안에만 투표 가능
         """
-        def validate_proposal_pending(proposal, pid, eid, op):
-            if not proposal or proposal.event_id != eid:
-                raise NotFoundError(
-                    message="Proposal not found",
-                    detail=f"Proposal with id {pid} not found for this event"
-                )
-            if proposal.proposal_status != ProposalStatusType.PENDING:
-                raise ValidationError(
-                    message="Proposal not pending",
-                    detail=f"{op} can only be performed for PENDING proposals"
-                )
-        
-        def create_vote(pid, uid):
-            vote = CriterionProposalVote(
-                criterion_proposal_id=pid,
-                created_by=uid,
-            )
-            created_vote = self.repos.proposal.create_criteria_proposal_vote(vote)
-            
-            # Outbox 이벤트 추가 (트랜잭션 내부)
-            if self.outbox_repo:
-                proposal = self.repos.proposal.get_criteria_proposal_by_id(pid)
-                if proposal:
-                    self.outbox_repo.create_outbox_event(
-                        event_type="proposal.vote.created.v1",
-                        payload={
-                            "proposal_id": str(pid),
-                            "proposal_type": "criteria"
-                        },
-                        target_event_id=proposal.event_id
-                    )
-            
-            return created_vote
-        
-        def auto_approve(proposal, event):
-            vote_count = len(proposal.votes) if proposal.votes else 0
-            self.auto_approval_checker.check_and_auto_approve(
-                proposal=proposal,
-                event=event,
-                vote_count=vote_count,
-                min_votes_required=event.criteria_min_votes_required,
-                approval_threshold_percent=None,
-                total_members=None,
-                is_auto_approved=event.criteria_is_auto_approved_by_votes,
-                approve_if_pending_fn=self.repos.proposal.approve_criteria_proposal_if_pending,
-                apply_proposal_fn=self._apply_criteria_proposal,
-                create_outbox_event_fn=lambda p, e: self.outbox_repo.create_outbox_event(
-                    event_type="proposal.approved.v1",
-                    payload={
-                        "proposal_id": str(p.id),
-                        "proposal_type": "criteria",
-                        "event_id": str(p.event_id),
-                        "approved_by": None
-                    },
-                    target_event_id=p.event_id
-                ) if self.outbox_repo else None,
-            )
-        
-        def build_response(vote, proposal, vote_count):
-            return CriteriaProposalVoteResponse(
-                message="Vote created successfully",
-                vote_id=vote.id,
-                proposal_id=proposal_id,
-                vote_count=vote_count,
-            ).model_dump()
-        
-        result = self.vote_usecase.create_vote(
+        return self.vote_usecase.create_vote(
             event_id=event_id,
             proposal_id=proposal_id,
             user_id=user_id,
-            validate_event_fn=self._validate_event_in_progress,
-            get_proposal_fn=lambda pid, eid: self.repos.proposal.get_criteria_proposal_by_id(pid),
-            validate_proposal_pending_fn=validate_proposal_pending,
-            check_duplicate_fn=self._check_duplicate_criteria_vote,
-            create_vote_fn=create_vote,
-            auto_approve_fn=auto_approve,
-            build_response_fn=build_response,
+            load_and_validate_fn=self._validate_criteria_proposal_pending,
+            create_vote_fn=self._create_criteria_vote,
+            count_votes_fn=self.repos.proposal.count_criteria_proposal_votes,
+            can_auto_approve_fn=self.criterion_auto_approval.can_auto_approve,
+            auto_approve_fn=self._criteria_auto_approve,
+            build_response_fn=self._build_criteria_vote_response,
         )
-        return CriteriaProposalVoteResponse(**result)
 
     def delete_criteria_proposal_vote(
         self,
@@ -713,107 +741,86 @@ class ProposalService(EventBaseService):
         - 본인 투표만 삭제 가능
         - PENDING 제안에만 투표 삭제 가능
         """
-        def validate_proposal_pending(proposal, pid, eid, op):
-            if not proposal or proposal.event_id != eid:
-                raise NotFoundError(
-                    message="Proposal not found",
-                    detail=f"Proposal with id {pid} not found for this event"
-                )
-            if proposal.proposal_status != ProposalStatusType.PENDING:
-                raise ValidationError(
-                    message="Proposal not pending",
-                    detail=f"{op} can only be performed for PENDING proposals"
-                )
-        
-        def get_vote(pid, uid):
-            vote = self.repos.proposal.get_user_vote_on_criteria_proposal(pid, uid)
-            if not vote:
-                raise NotFoundError(
-                    message="Vote not found",
-                    detail="You have not voted on this proposal"
-                )
-            return vote
+        return self.vote_usecase.delete_vote(
+            event_id=event_id,
+            proposal_id=proposal_id,
+            user_id=user_id,
+            load_and_validate_fn=self._validate_criteria_proposal_pending,
+            delete_vote_fn=self._delete_criteria_vote,
+            count_votes_fn=self.repos.proposal.count_criteria_proposal_votes,
+            build_response_fn=self._build_criteria_vote_response,
+        )
+
+    def _create_criteria_vote(
+        self, proposal_id: UUID, user_id: UUID, event: Event
+    ) -> CriterionProposalVote | None:
+        """투표 생성 및 Outbox 이벤트 추가 (검증 시 조회한 이벤트 재사용, 이미 투표했으면 None)"""
+        created_vote = self.repos.proposal.create_criteria_proposal_vote(proposal_id, user_id)
+        if created_vote is None:
+            return None
         
-        def delete_vote(vote):
-            # Outbox 이벤트 추가를 위해 proposal 조회 (트랜잭션 내부)
-            proposal = self.repos.proposal.get_criteria_proposal_by_id(vote.criterion_proposal_id)
-            
-            self.repos.proposal.delete_criteria_proposal_vote(vote)
-            
-            # Outbox 이벤트 추가 (트랜잭션 내부)
-            if self.outbox_repo and proposal:
-                self.outbox_repo.create_outbox_event(
-                    event_type="proposal.vote.deleted.v1",
-                    payload={
-                        "proposal_id": str(vote.criterion_proposal_id),
-                        "proposal_type": "criteria"
-                    },
-                    target_event_id=proposal.event_id
-                )
+        if self._emit_criteria_vote_event:
+            self._emit_criteria_vote_event(_VOTE_CREATED, proposal_id, event)
         
-        def auto_approve(proposal, event):
-            vote_count = len(proposal.votes) if proposal.votes else 0
-            self.auto_approval_checker.check_and_auto_approve(
-                proposal=proposal,
-                event=event,
-                vote_count=vote_count,
-                min_votes_required=event.criteria_min_votes_required,
-                approval_threshold_percent=None,
-                total_members=None,
-                is_auto_approved=event.criteria_is_auto_approved_by_votes,
-                approve_if_pending_fn=self.repos.proposal.approve_criteria_proposal_if_pending,
-                apply_proposal_fn=self._apply_criteria_proposal,
-                create_outbox_event_fn=lambda p, e: self.outbox_repo.create_outbox_event(
-                    event_type="proposal.approved.v1",
-                    payload={
-                        "proposal_id": str(p.id),
-                        "proposal_type": "criteria",
-                        "event_id": str(p.event_id),
-                        "approved_by": None
-                    },
-                    target_event_id=p.event_id
-                ) if self.outbox_repo else None,
-            )
+        return created_vote
+
+    def _delete_criteria_vote(
+        self, proposal_id: UUID, user_id: UUID, event: Event
+    ) -> CriterionProposalVote | None:
+        """투표 삭제 및 Outbox 이벤트 추가 (검증 시 조회한 이벤트 재사용, 투표하지 않았으면 None)"""
+        deleted_vote = self.repos.proposal.delete_criteria_proposal_vote(proposal_id, user_id)
+        if deleted_vote is None:
+            return None
         
-        def build_response(vote, proposal, vote_count):
-            return CriteriaProposalVoteResponse(
-                message="Vote deleted successfully",
-                vote_id=vote.id,
-                proposal_id=proposal_id,
-                vote_count=vote_count,
-            ).model_dump()
+        if self._emit_criteria_vote_event:
+            self._emit_criteria_vote_event(_VOTE_DELETED, proposal_id, event)
         
-        result = self.vote_usecase.delete_vote(
-            event_id=event_id,
-            proposal_id=proposal_id,
-            user_id=user_id,
-            validate_event_fn=self._validate_event_in_progress,
-            get_proposal_fn=lambda pid, eid: self.repos.proposal.get_criteria_proposal_by_id(pid),
-            validate_proposal_pending_fn=validate_proposal_pending,
-            get_vote_fn=get_vote,
-            delete_vote_fn=delete_vote,
-            auto_approve_fn=auto_approve,
-            build_response_fn=build_response,
+        return deleted_vote
+
+    def _criteria_auto_approve(
+        self, proposal: CriteriaProposal, event: Event, vote_count: int
+    ) -> None:
+        """투표 생성 후 자동 승인 체크 (투표 수 기반)"""
+        self.criterion_auto_approval.check_and_auto_approve(
+            proposal=proposal,
+            event=event,
+            vote_count=vote_count,
+            min_votes_required=event.criteria_min_votes_required,
+            approval_threshold_percent=None,
+            total_members=None,
+            is_auto_approved=event.criteria_is_auto_approved_by_votes,
+            # 투표 수 확인 + 승인 + 기준 적용을 단일 문장으로 수행 (별도 적용 단계 없음)
+            approve_if_pending_fn=self._approve_and_apply_criteria_proposal,
+            apply_proposal_fn=None,
+            create_outbox_event_fn=self._emit_criteria_auto_approved,
         )
-        return CriteriaProposalVoteResponse(**result)
 
-    def _validate_criteria_proposal_pending(
-        self, proposal_id: UUID, event_id: UUID, operation: str
-    ) -> CriteriaProposal:
-        """기준 제안 존재 및 PENDING 상태 검증"""
-        proposal = self.repos.proposal.get_criteria_proposal_by_id(proposal_id)
-        if not proposal or proposal.event_id != event_id:
-            raise NotFoundError(
-                message="Proposal not found",
-                detail=f"Proposal with id {proposal_id} not found for this event"
-            )
+    def _approve_and_apply_criteria_proposal(
+        self, proposal: CriteriaProposal, event: Event, accepted_at: datetime
+    ) -> CriteriaProposal | None:
+        """자동 승인 체커용 조건부 승인 함수 (투표 수 확인 + 승인 + 기준 적용을 단일 문장으로)"""
+        return self.repos.proposal.approve_and_apply_criteria_proposal_if_votes_reach(
+            proposal, event.criteria_min_votes_required, accepted_at, uuid4()
+        )
 
-        if proposal.proposal_status != ProposalStatusType.PENDING:
-            raise ValidationError(
-                message="Proposal not pending",
-                detail=f"{operation} can only be performed for PENDING proposals"
-            )
-        return proposal
+    def _build_criteria_vote_response(
+        self, message: str, vote: CriterionProposalVote, proposal: CriteriaProposal, vote_count: int
+    ) -> CriteriaProposalVoteResponse:
+        """투표 생성/삭제 응답 생성 (모델 그대로 반환, dict 왕복 없음)"""
+        # 서버에서 만든 값이므로 검증 생략 (메시지 번역 model_validator도 생략되므로 여기서 번역)
+        return CriteriaProposalVoteResponse.model_construct(
+            message=translate_message(message),
+            vote_id=vote.id,
+            proposal_id=proposal.id,
+            vote_count=vote_count,
+        )
+
+    def _validate_criteria_proposal_pending(
+        self, event_id: UUID, proposal_id: UUID, operation: str
+    ) -> tuple[Event, CriteriaProposal]:
+        """이벤트 IN_PROGRESS, 기준 제안 존재 및 PENDING 상태 검증 (이벤트/제안 동시 조회)"""
+        row = self.repos.proposal.get_criteria_proposal_with_event(proposal_id, event_id)
+        return self._validate_event_and_proposal_pending(row, event_id, proposal_id, operation)
 
     def _validate_criterion_for_proposal(
         self, criteria_id: UUID, event_id: UUID, proposal_category: ProposalCategoryType
@@ -836,114 +843,15 @@ class ProposalService(EventBaseService):
         self, request: CriteriaProposalCreateRequest, event_id: UUID
     ) -> None:
         """proposal_category에 따른 필드 검증 (proposal_content, criteria_id)"""
-        if request.proposal_category == ProposalCategoryType.DELETION:
-            if request.proposal_content is not None:
-                raise ValidationError(
-                    message="Invalid proposal_content",
-                    detail="proposal_content must be NULL for DELETION proposals"
-                )
-        else:
-            if request.proposal_content is None:
-                raise ValidationError(
-                    message="Missing proposal_content",
-                    detail="proposal_content is required for CREATION/MODIFICATION proposals"
-                )
-
-        if request.proposal_category == ProposalCategoryType.CREATION:
-            if request.criteria_id is not None:
-                raise ValidationError(
-                    message="Invalid criteria_id",
-                    detail="criteria_id must be NULL for CREATION proposals"
-                )
-        else:
-            if request.criteria_id is None:
-                raise ValidationError(
-                    message="Missing criteria_id",
-                    detail=f"criteria_id is required for {request.proposal_category.value} proposals"
-                )
+        need_target = _check_category_fields(
+            request.proposal_category, request.proposal_content, request.criteria_id, "criteria_id"
+        )
+        if need_target:
             # criterion 존재 확인
             self._validate_criterion_for_proposal(
                 request.criteria_id, event_id, request.proposal_category
             )
 
-    def _check_duplicate_criteria_vote(self, proposal_id: UUID, user_id: UUID) -> None:
-        """중복 투표 체크"""
-        existing_vote = self.repos.proposal.get_user_vote_on_criteria_proposal(
-            proposal_id, user_id
-        )
-        if existing_vote:
-            raise ConflictError(
-                message="Already voted",
-                detail="You have already voted on this proposal"
-            )
-
-    def _get_user_criteria_vote_or_raise(
-        self, proposal_id: UUID, user_id: UUID
-    ) -> CriterionProposalVote:
-        """투표 존재 검증"""
-        vote = self.repos.proposal.get_user_vote_on_criteria_proposal(
-            proposal_id, user_id
-        )
-        if not vote:
-            raise NotFoundError(
-                message="Vote not found",
-                detail="You have not voted on this proposal"
-            )
-        return vote
-
-    def _check_and_auto_approve_criteria_proposal(
-        self, proposal: CriteriaProposal, event: Event
-    ) -> None:
-        """
-        투표 수가 일정 수준 도달 시 자동 승인
-        
-        정책:
-        - auto_approved, min_votes_required 설정은 PENDING 상태인 proposal에만 소급 적용
-        - 이미 ACCEPTED, REJECTED된 proposal에는 반영되지 않음
-        
-        동작:
-        - criteria_is_auto_approved_by_votes가 True일 때만 동작
-        - criteria_min_votes_required 이상이면 ACCEPTED로 변경
-        - 승인 시 자동으로 제안 적용 (apply_proposal 호출)
-        - PENDING 상태인 proposal에만 적용 (이미 ACCEPTED/REJECTED된 것은 무시)
-        """
-        # PENDING 상태가 아니면 자동 승인 로직 적용하지 않음
-        if proposal.proposal_status != ProposalStatusType.PENDING:
-            return
-
-        if not event.criteria_is_auto_approved_by_votes:
-            return
-
-        if event.criteria_min_votes_required is None:
-            return
-
-        vote_count = len(proposal.votes)
-        if vote_count >= event.criteria_min_votes_required:
-            # 조건부 UPDATE로 락 없이 중복 승인 방지
-            accepted_at = datetime.now(timezone.utc)
-            approved_proposal = self.repos.proposal.approve_criteria_proposal_if_pending(
-                proposal.id, accepted_at
-            )
-            if approved_proposal:
-                # 승인 성공 시 proposal을 다시 조회하여 관계 로드
-                self.db.refresh(approved_proposal, ['votes', 'criterion'])
-                # 자동 승인 시 즉시 적용
-                self._apply_criteria_proposal(approved_proposal, event)
-                
-                # Outbox 이벤트 추가 (트랜잭션 내부)
-                if self.outbox_repo:
-                    self.outbox_repo.create_outbox_event(
-                        event_type="proposal.approved.v1",
-                        payload={
-                            "proposal_id": str(approved_proposal.id),
-                            "proposal_type": "criteria",
-                            "event_id": str(approved_proposal.event_id),
-                            "approved_by": None  # 자동 승인
-                        },
-                        target_event_id=approved_proposal.event_id
-                    )
-                # commit은 외부 트랜잭션 매니저가 처리
-
     def _apply_criteria_proposal(
         self, proposal: CriteriaProposal, event: Event
     ) -> None:
@@ -953,6 +861,7 @@ class ProposalService(EventBaseService):
         - MODIFICATION: 기존 Criterion 수정 (original_content 저장, is_modified=True)
         - DELETION: 기존 Criterion 소프트 삭제 (is_deleted=True)
         """
+        applied_target_id = None
         if proposal.proposal_category == ProposalCategoryType.CREATION:
             # 새 기준 생성
             criterion = Criterion(
@@ -961,26 +870,26 @@ class ProposalService(EventBaseService):
                 created_by=proposal.created_by,
             )
             result = self.repos.criterion.create_criteria([criterion])
-            proposal.applied_target_id = result[0].id
+            applied_target_id = result[0].id
         elif proposal.proposal_category == ProposalCategoryType.MODIFICATION:
-            # 기존 기준 수정
-            criterion = self.repos.criterion.get_by_id(proposal.criteria_id)
-            if criterion:
-                criterion.original_content = criterion.content  # 원본 저장
-                criterion.content = proposal.proposal_content
-                criterion.is_modified = True
-                self.repos.criterion.update_criterion(criterion, proposal.created_by)
-                proposal.applied_target_id = criterion.id
+            # 기존 기준 수정 (원본 보존까지 단일 UPDATE로 처리, 사전 조회 없음)
+            applied_target_id = self.repos.criterion.modify_content(
+                proposal.criteria_id, proposal.proposal_content, proposal.created_by
+            )
         elif proposal.proposal_category == ProposalCategoryType.DELETION:
-            # 소프트 삭제
-            criterion = self.repos.criterion.get_by_id(proposal.criteria_id)
-            if criterion:
-                criterion.is_deleted = True
-                self.repos.criterion.update_criterion(criterion, proposal.created_by)
-                proposal.applied_target_id = criterion.id
+            # 소프트 삭제 (단일 UPDATE, 사전 조회 없음)
+            applied_target_id = self.repos.criterion.soft_delete(
+                proposal.criteria_id, proposal.created_by
+            )
+        if applied_target_id is None:
+            # 수정/삭제 대상 기준이 없거나 이미 삭제됨 (투표 자동 승인과 같은 기준, 트랜잭션 롤백으로 PENDING 유지)
+            raise ConflictError(
+                message="Proposal target unavailable",
+                detail="The target of this proposal no longer exists or has been deleted"
+            )
 
-        proposal.applied_at = datetime.now(timezone.utc)
-        self.repos.proposal.update_criteria_proposal(proposal)
+        # applied_at은 DB 시각으로, 적용 대상 id와 함께 단일 UPDATE로 기록
+        self.repos.proposal.mark_criteria_proposal_applied(proposal, applied_target_id)
 
     # ============================================================================
     # Conclusion Proposal Methods
@@ -1000,57 +909,54 @@ class ProposalService(EventBaseService):
         - ACCEPTED 멤버십 필요
         - 중복 제안 체크 (PENDING 상태만)
         """
-        def _execute_create() -> dict:
-            # 1. 이벤트 상태 검증 (IN_PROGRESS)
-            event = self._validate_event_in_progress(event_id, "create proposals")
-
-            # 2. 멤버십 검증 (ACCEPTED)
-            self._validate_membership_accepted(user_id, event_id, "create proposals")
+        def _execute_create() -> ConclusionProposalResponse:
+            # 1~2. 이벤트 상태(IN_PROGRESS), 멤버십(ACCEPTED) 검증
+            # 이벤트, 멤버십 상태, 중복 제안 여부, 기준 소속 여부를 한 번의 쿼리로 조회
+            row = self.repos.proposal.get_event_with_conclusion_create_preflight(
+                event_id, criterion_id, user_id
+            )
+            event, has_duplicate = self._validate_create_preflight(row, event_id, "create proposals")
 
-            # 3. Criterion 존재 및 event_id 일치 검증
-            criterion = self.repos.criterion.get_by_id(criterion_id)
-            if not criterion or criterion.event_id != event_id:
+            # 3. Criterion 존재 및 event_id 일치 검증 (위에서 함께 조회)
+            if not row[3]:
                 raise NotFoundError(
                     message="Criterion not found",
                     detail=f"Criterion with id {criterion_id} not found for this event"
                 )
 
-            # 4. 중복 제안 체크 (PENDING 상태만)
-            existing_proposal = self.repos.proposal.get_pending_conclusion_proposal_by_user(
-                criterion_id, user_id
-            )
-            if existing_proposal:
+            # 4. 중복 제안 체크 (PENDING 상태만, 위에서 함께 조회)
+            if has_duplicate:
                 raise ConflictError(
                     message="Duplicate proposal",
                     detail="You already have a pending proposal for this criterion"
                 )
 
-            # 5. 제안 생성
-            proposal = ConclusionProposal(
-                criterion_id=criterion_id,
-                proposal_content=request.proposal_content,
-                created_by=user_id,
-                proposal_status=ProposalStatusType.PENDING,
-            )
-            with transaction(self.db):
-                created_proposal = self.repos.proposal.create_conclusion_proposal(proposal)
-                # votes 관계를 로드하기 위해 refresh
-                self.db.refresh(created_proposal, ['votes'])
+            # 5. 제안 생성 (INSERT ... ON CONFLICT DO NOTHING)
+            # 위 사전 조회는 빠른 실패용, 동시 요청 간 중복은 PENDING 유니크 인덱스로 최종 차단
+            with transaction(self.db, self.outbox_repo):
+                created_proposal = self.repos.proposal.create_conclusion_proposal_if_no_pending(
+                    criterion_id=criterion_id,
+                    proposal_content=request.proposal_content,
+                    created_by=user_id,
+                )
+                if created_proposal is None:
+                    raise ConflictError(
+                        message="Duplicate proposal",
+                        detail="You already have a pending proposal for this criterion"
+                    )
                 
                 # Outbox 이벤트 추가 (트랜잭션 내부)
                 if self.outbox_repo:
-                    self.outbox_repo.create_outbox_event(
+                    self.outbox_repo.buffer_event(
                         event_type="proposal.created.v1",
-                        payload={
-                            "proposal_id": str(created_proposal.id),
-                            "proposal_type": "conclusion"
-                        },
+                        payload=_proposal_payload(created_proposal.id, _CONCLUSION),
                         target_event_id=event_id
                     )
-            vote_count = len(created_proposal.votes) if created_proposal.votes else 0
-            has_voted = False  # 새로 생성된 제안이므로 투표 없음
+            vote_count = 0  # 새로 생성된 제안이므로 투표 없음 (votes 조회 불필요)
+            has_voted = False
 
-            response = ConclusionProposalResponse(
+            # ORM에서 읽은 값(이미 올바른 타입)이므로 검증 생략, 모델 그대로 반환 (dict 왕복 없음)
+            response = ConclusionProposalResponse.model_construct(
                 id=created_proposal.id,
                 criterion_id=created_proposal.criterion_id,
                 proposal_status=created_proposal.proposal_status,
@@ -1060,18 +966,19 @@ class ProposalService(EventBaseService):
                 vote_count=vote_count,
                 has_voted=has_voted,
             )
-            return response.model_dump()
+            return response
         
         # Idempotency 적용
-        result = self.idempotency_wrapper.wrap(
+        return self.idempotency_wrapper.wrap(
             idempotency_key=idempotency_key,
             user_id=user_id,
             method="POST",
             path=f"/events/{event_id}/criteria/{criterion_id}/conclusion-proposals",
-            body=request.model_dump(exclude_none=True, mode='json'),
-            fn=_execute_create
+            body=request,  # 직렬화는 Idempotency 적용 시에만 (정규화 단계에서 1회)
+            fn=_execute_create,
+            response_model=ConclusionProposalResponse,
+            ttl=_CREATE_IDEMPOTENCY_TTL
         )
-        return ConclusionProposalResponse(**result)
 
     def create_conclusion_proposal_vote(
         self,
@@ -1084,108 +991,17 @@ class ProposalService(EventBaseService):
         - IN_PROGRESS 상태에서만 가능
         - PENDING 제안에만 투표 가능
         """
-        def validate_proposal_pending(proposal, pid, eid, op):
-            if not proposal:
-                raise NotFoundError(
-                    message="Proposal not found",
-                    detail=f"Proposal with id {pid} not found"
-                )
-            # criterion을 통해 event_id 확인
-            criterion = self.repos.criterion.get_by_id(proposal.criterion_id)
-            if not criterion or criterion.event_id != eid:
-                raise NotFoundError(
-                    message="Proposal not found",
-                    detail=f"Proposal with id {pid} not found for this event"
-                )
-            if proposal.proposal_status != ProposalStatusType.PENDING:
-                raise ValidationError(
-                    message="Proposal not pending",
-                    detail=f"{op} can only be performed for PENDING proposals"
-                )
-        
-        def create_vote(pid, uid):
-            vote = ConclusionProposalVote(
-                conclusion_proposal_id=pid,
-                created_by=uid,
-            )
-            created_vote = self.repos.proposal.create_conclusion_proposal_vote(vote)
-            
-            # Outbox 이벤트 추가 (트랜잭션 내부)
-            if self.outbox_repo:
-                proposal = self.repos.proposal.get_conclusion_proposal_by_id(pid)
-                if proposal:
-                    # conclusion proposal의 event_id는 criterion을 통해 조회
-                    criterion = self.repos.criterion.get_by_id(proposal.criterion_id)
-                    if criterion:
-                        self.outbox_repo.create_outbox_event(
-                            event_type="proposal.vote.created.v1",
-                            payload={
-                                "proposal_id": str(pid),
-                                "proposal_type": "conclusion"
-                            },
-                            target_event_id=criterion.event_id
-                        )
-            
-            return created_vote
-        
-        def auto_approve(proposal, event):
-            vote_count = len(proposal.votes) if proposal.votes else 0
-            # 전체 ACCEPTED 멤버십 수 조회
-            from app.models.event import EventMembership
-            from sqlalchemy import func as sql_func, select
-            stmt = (
-                select(sql_func.count(EventMembership.id))
-                .where(
-                    EventMembership.event_id == event.id,
-                    EventMembership.membership_status == MembershipStatusType.ACCEPTED
-                )
-            )
-            result = self.db.execute(stmt)
-            total_members = result.scalar() or 0
-            
-            self.auto_approval_checker.check_and_auto_approve(
-                proposal=proposal,
-                event=event,
-                vote_count=vote_count,
-                min_votes_required=None,
-                approval_threshold_percent=event.conclusion_approval_threshold_percent,
-                total_members=total_members,
-                is_auto_approved=event.conclusion_is_auto_approved_by_votes,
-                approve_if_pending_fn=self.repos.proposal.approve_conclusion_proposal_if_pending,
-                apply_proposal_fn=self._apply_conclusion_proposal,
-                create_outbox_event_fn=lambda p, e: self.outbox_repo.create_outbox_event(
-                    event_type="proposal.approved.v1",
-                    payload={
-                        "proposal_id": str(p.id),
-                        "proposal_type": "conclusion",
-                        "event_id": str(criterion.event_id) if (criterion := self.repos.criterion.get_by_id(p.criterion_id)) else None,
-                        "approved_by": None
-                    },
-                    target_event_id=criterion.event_id if (criterion := self.repos.criterion.get_by_id(p.criterion_id)) else None
-                ) if self.outbox_repo else None,
-            )
-        
-        def build_response(vote, proposal, vote_count):
-            return ConclusionProposalVoteResponse(
-                message="Vote created successfully",
-                vote_id=vote.id,
-                proposal_id=proposal_id,
-                vote_count=vote_count,
-            ).model_dump()
-        
-        result = self.vote_usecase.create_vote(
+        return self.vote_usecase.create_vote(
             event_id=event_id,
             proposal_id=proposal_id,
             user_id=user_id,
-            validate_event_fn=self._validate_event_in_progress,
-            get_proposal_fn=lambda pid, eid: self.repos.proposal.get_conclusion_proposal_by_id(pid),
-            validate_proposal_pending_fn=validate_proposal_pending,
-            check_duplicate_fn=self._check_duplicate_conclusion_vote,
-            create_vote_fn=create_vote,
-            auto_approve_fn=auto_approve,
-            build_response_fn=build_response,
+            load_and_validate_fn=self._validate_conclusion_proposal_pending,
+            create_vote_fn=self._create_conclusion_vote,
+            count_votes_fn=self.repos.proposal.count_conclusion_proposal_votes,
+            can_auto_approve_fn=self.conclusion_auto_approval.can_auto_approve,
+            auto_approve_fn=self._conclusion_auto_approve,
+            build_response_fn=self._build_conclusion_vote_response,
         )
-        return ConclusionProposalVoteResponse(**result)
 
     def delete_conclusion_proposal_vote(
         self,
@@ -1199,247 +1015,130 @@ class ProposalService(EventBaseService):
         - 본인 투표만 삭제 가능
         - PENDING 제안에만 투표 삭제 가능
         """
-        def validate_proposal_pending(proposal, pid, eid, op):
-            if not proposal:
-                raise NotFoundError(
-                    message="Proposal not found",
-                    detail=f"Proposal with id {pid} not found"
-                )
-            # criterion을 통해 event_id 확인
-            criterion = self.repos.criterion.get_by_id(proposal.criterion_id)
-            if not criterion or criterion.event_id != eid:
-                raise NotFoundError(
-                    message="Proposal not found",
-                    detail=f"Proposal with id {pid} not found for this event"
-                )
-            if proposal.proposal_status != ProposalStatusType.PENDING:
-                raise ValidationError(
-                    message="Proposal not pending",
-                    detail=f"{op} can only be performed for PENDING proposals"
-                )
-        
-        def get_vote(pid, uid):
-            vote = self.repos.proposal.get_user_vote_on_conclusion_proposal(pid, uid)
-            if not vote:
-                raise NotFoundError(
-                    message="Vote not found",
-                    detail="You have not voted on this proposal"
-                )
-            return vote
+        return self.vote_usecase.delete_vote(
+            event_id=event_id,
+            proposal_id=proposal_id,
+            user_id=user_id,
+            load_and_validate_fn=self._validate_conclusion_proposal_pending,
+            delete_vote_fn=self._delete_conclusion_vote,
+            count_votes_fn=self.repos.proposal.count_conclusion_proposal_votes,
+            build_response_fn=self._build_conclusion_vote_response,
+        )
+
+    def _create_conclusion_vote(
+        self, proposal_id: UUID, user_id: UUID, event: Event
+    ) -> ConclusionProposalVote | None:
+        """투표 생성 및 Outbox 이벤트 추가 (검증 시 조회한 이벤트 재사용, 이미 투표했으면 None)"""
+        created_vote = self.repos.proposal.create_conclusion_proposal_vote(proposal_id, user_id)
+        if created_vote is None:
+            return None
         
-        def delete_vote(vote):
-            # Outbox 이벤트 추가를 위해 proposal 조회 (트랜잭션 내부)
-            proposal = self.repos.proposal.get_conclusion_proposal_by_id(vote.conclusion_proposal_id)
-            
-            self.repos.proposal.delete_conclusion_proposal_vote(vote)
-            
-            # Outbox 이벤트 추가 (트랜잭션 내부)
-            if self.outbox_repo and proposal:
-                # conclusion proposal의 event_id는 criterion을 통해 조회
-                criterion = self.repos.criterion.get_by_id(proposal.criterion_id)
-                if criterion:
-                    self.outbox_repo.create_outbox_event(
-                        event_type="proposal.vote.deleted.v1",
-                        payload={
-                            "proposal_id": str(vote.conclusion_proposal_id),
-                            "proposal_type": "conclusion"
-                        },
-                        target_event_id=criterion.event_id
-                    )
+        if self._emit_conclusion_vote_event:
+            self._emit_conclusion_vote_event(_VOTE_CREATED, proposal_id, event)
         
-        def auto_approve(proposal, event):
-            vote_count = len(proposal.votes) if proposal.votes else 0
-            # 전체 ACCEPTED 멤버십 수 조회
-            from app.models.event import EventMembership
-            from sqlalchemy import func as sql_func, select
-            stmt = (
-                select(sql_func.count(EventMembership.id))
-                .where(
-                    EventMembership.event_id == event.id,
-                    EventMembership.membership_status == MembershipStatusType.ACCEPTED
-                )
-            )
-            result = self.db.execute(stmt)
-            total_members = result.scalar() or 0
-            
-            self.auto_approval_checker.check_and_auto_approve(
-                proposal=proposal,
-                event=event,
-                vote_count=vote_count,
-                min_votes_required=None,
-                approval_threshold_percent=event.conclusion_approval_threshold_percent,
-                total_members=total_members,
-                is_auto_approved=event.conclusion_is_auto_approved_by_votes,
-                approve_if_pending_fn=self.repos.proposal.approve_conclusion_proposal_if_pending,
-                apply_proposal_fn=self._apply_conclusion_proposal,
-                create_outbox_event_fn=lambda p, e: self.outbox_repo.create_outbox_event(
-                    event_type="proposal.approved.v1",
-                    payload={
-                        "proposal_id": str(p.id),
-                        "proposal_type": "conclusion",
-                        "event_id": str(criterion.event_id) if (criterion := self.repos.criterion.get_by_id(p.criterion_id)) else None,
-                        "approved_by": None
-                    },
-                    target_event_id=criterion.event_id if (criterion := self.repos.criterion.get_by_id(p.criterion_id)) else None
-                ) if self.outbox_repo else None,
-            )
+        return created_vote
+
+    def _delete_conclusion_vote(
+        self, proposal_id: UUID, user_id: UUID, event: Event
+    ) -> ConclusionProposalVote | None:
+        """투표 삭제 및 Outbox 이벤트 추가 (검증 시 조회한 이벤트 재사용, 투표하지 않았으면 None)"""
+        deleted_vote = self.repos.proposal.delete_conclusion_proposal_vote(proposal_id, user_id)
+        if deleted_vote is None:
+            return None
         
-        def build_response(vote, proposal, vote_count):
-            return ConclusionProposalVoteResponse(
-                message="Vote deleted successfully",
-                vote_id=vote.id,
-                proposal_id=proposal_id,
-                vote_count=vote_count,
-            ).model_dump()
+        if self._emit_conclusion_vote_event:
+            self._emit_conclusion_vote_event(_VOTE_DELETED, proposal_id, event)
         
-        result = self.vote_usecase.delete_vote(
-            event_id=event_id,
-            proposal_id=proposal_id,
-            user_id=user_id,
-            validate_event_fn=self._validate_event_in_progress,
-            get_proposal_fn=lambda pid, eid: self.repos.proposal.get_conclusion_proposal_by_id(pid),
-            validate_proposal_pending_fn=validate_proposal_pending,
-            get_vote_fn=get_vote,
-            delete_vote_fn=delete_vote,
-            auto_approve_fn=auto_approve,
-            build_response_fn=build_response,
+        return deleted_vote
+
+    def _conclusion_auto_approve(
+        self, proposal: ConclusionProposal, event: Event, vote_count: int
+    ) -> None:
+        """투표 생성 후 자동 승인 체크 (비율 기반)"""
+        self.conclusion_auto_approval.check_and_auto_approve(
+            proposal=proposal,
+            event=event,
+            vote_count=vote_count,
+            min_votes_required=None,
+            approval_threshold_percent=event.conclusion_approval_threshold_percent,
+            # 전체 ACCEPTED 멤버십 수 (Event 비정규화 컬럼, COUNT 쿼리 없음)
+            total_members=event.accepted_member_count,
+            is_auto_approved=event.conclusion_is_auto_approved_by_votes,
+            # 임계 투표 수 판정, 승인, 결론 적용을 단일 문장으로 수행 (별도 적용 단계 없음)
+            approve_if_pending_fn=self._approve_and_apply_conclusion_proposal,
+            apply_proposal_fn=None,
+            create_outbox_event_fn=self._emit_conclusion_auto_approved,
         )
-        return ConclusionProposalVoteResponse(**result)
 
-    def _validate_conclusion_proposal_pending(
-        self, proposal_id: UUID, event_id: UUID, operation: str
-    ) -> ConclusionProposal:
-        """결론 제안 존재 및 PENDING 상태 검증"""
-        proposal = self.repos.proposal.get_conclusion_proposal_by_id(proposal_id)
-        if not proposal:
-            raise NotFoundError(
-                message="Proposal not found",
-                detail=f"Proposal with id {proposal_id} not found"
-            )
+    def _approve_and_apply_conclusion_proposal(
+        self, proposal: ConclusionProposal, event: Event, accepted_at: datetime
+    ) -> ConclusionProposal | None:
+        """자동 승인 체커용 조건부 승인 함수 (임계 투표 수 판정 + 승인 + 결론 적용을 단일 문장으로)"""
+        return self.repos.proposal.approve_and_apply_conclusion_proposal_if_votes_reach(
+            proposal.id,
+            _conclusion_min_votes(
+                event.conclusion_approval_threshold_percent, event.accepted_member_count
+            ),
+            accepted_at
+        )
 
-        # criterion을 통해 event_id 확인
-        criterion = self.repos.criterion.get_by_id(proposal.criterion_id)
-        if not criterion or criterion.event_id != event_id:
+    def _build_conclusion_vote_response(
+        self, message: str, vote: ConclusionProposalVote, proposal: ConclusionProposal, vote_count: int
+    ) -> ConclusionProposalVoteResponse:
+        """투표 생성/삭제 응답 생성 (모델 그대로 반환, dict 왕복 없음)"""
+        # 서버에서 만든 값이므로 검증 생략 (메시지 번역 model_validator도 생략되므로 여기서 번역)
+        return ConclusionProposalVoteResponse.model_construct(
+            message=translate_message(message),
+            vote_id=vote.id,
+            proposal_id=proposal.id,
+            vote_count=vote_count,
+        )
+
+    def _validate_conclusion_proposal_pending(
+        self, event_id: UUID, proposal_id: UUID, operation: str
+    ) -> tuple[Event, ConclusionProposal]:
+        """이벤트 IN_PROGRESS, 결론 제안 존재 및 PENDING 상태 검증 (criterion 경유 동시 조회)"""
+        row = self.repos.proposal.get_conclusion_proposal_with_event(proposal_id, event_id)
+        return self._validate_event_and_proposal_pending(row, event_id, proposal_id, operation)
+
+    def _validate_event_and_proposal_pending(
+        self, row: tuple | None, event_id: UUID, proposal_id: UUID, operation: str
+    ) -> tuple:
+        """
+        이벤트/제안 동시 조회 결과 검증 (타입 공통)
+        - 조회 결과가 없으면 이벤트 오류(미존재, 상태)를 제안 미존재보다 먼저 보고
+        """
+        if row is None:
+            event = self.repos.event.get_by_id(event_id)
+            if not event:
+                raise NotFoundError(
+                    message="Event not found",
+                    detail=f"Event with id {event_id} not found"
+                )
+            self._validate_event_status(event, EventStatusType.IN_PROGRESS, operation)
             raise NotFoundError(
                 message="Proposal not found",
                 detail=f"Proposal with id {proposal_id} not found for this event"
             )
 
+        event, proposal = row
+        self._event_cache[event_id] = event
+        self._validate_event_status(event, EventStatusType.IN_PROGRESS, operation)
         if proposal.proposal_status != ProposalStatusType.PENDING:
             raise ValidationError(
                 message="Proposal not pending",
                 detail=f"{operation} can only be performed for PENDING proposals"
             )
-        return proposal
-
-    def _check_duplicate_conclusion_vote(self, proposal_id: UUID, user_id: UUID) -> None:
-        """중복 투표 체크"""
-        existing_vote = self.repos.proposal.get_user_vote_on_conclusion_proposal(
-            proposal_id, user_id
-        )
-        if existing_vote:
-            raise ConflictError(
-                message="Already voted",
-                detail="You have already voted on this proposal"
-            )
-
-    def _get_user_conclusion_vote_or_raise(
-        self, proposal_id: UUID, user_id: UUID
-    ) -> ConclusionProposalVote:
-        """투표 존재 검증"""
-        vote = self.repos.proposal.get_user_vote_on_conclusion_proposal(
-            proposal_id, user_id
-        )
-        if not vote:
-            raise NotFoundError(
-                message="Vote not found",
-                detail="You have not voted on this proposal"
-            )
-        return vote
-
-    def _check_and_auto_approve_conclusion_proposal(
-        self, proposal: ConclusionProposal, event: Event
-    ) -> None:
-        """
-        투표 비율이 일정 수준 도달 시 자동 승인
-        
-        정책:
-        - conclusion_is_auto_approved_by_votes가 True일 때만 동작
-        - conclusion_approval_threshold_percent 이상이면 ACCEPTED로 변경
-        - 승인 시 자동으로 제안 적용 (apply_proposal 호출)
-        - PENDING 상태인 proposal에만 적용
-        """
-        # PENDING 상태가 아니면 자동 승인 로직 적용하지 않음
-        if proposal.proposal_status != ProposalStatusType.PENDING:
-            return
-
-        if not event.conclusion_is_auto_approved_by_votes:
-            return
-
-        if event.conclusion_approval_threshold_percent is None:
-            return
-
-        # 전체 ACCEPTED 멤버십 수 조회
-        from app.models.event import EventMembership
-        from sqlalchemy import func as sql_func, select
-        stmt = (
-            select(sql_func.count(EventMembership.id))
-            .where(
-                EventMembership.event_id == event.id,
-                EventMembership.membership_status == MembershipStatusType.ACCEPTED
-            )
-        )
-        result = self.db.execute(stmt)
-        total_members = result.scalar() or 0
-
-        if total_members == 0:
-            return  # 멤버가 없으면 승인 불가
-
-        vote_count = len(proposal.votes)
-        vote_percent = (vote_count / total_members) * 100
-
-        if vote_percent >= event.conclusion_approval_threshold_percent:
-            # 조건부 UPDATE로 락 없이 중복 승인 방지
-            accepted_at = datetime.now(timezone.utc)
-            approved_proposal = self.repos.proposal.approve_conclusion_proposal_if_pending(
-                proposal.id, accepted_at
-            )
-            if approved_proposal:
-                # 승인 성공 시 proposal을 다시 조회하여 관계 로드
-                self.db.refresh(approved_proposal, ['votes', 'criterion'])
-                # 자동 승인 시 즉시 적용
-                self._apply_conclusion_proposal(approved_proposal, event)
-                
-                # Outbox 이벤트 추가 (트랜잭션 내부)
-                if self.outbox_repo:
-                    # event_id는 criterion을 통해 조회
-                    criterion = self.repos.criterion.get_by_id(approved_proposal.criterion_id)
-                    if criterion:
-                        self.outbox_repo.create_outbox_event(
-                            event_type="proposal.approved.v1",
-                            payload={
-                                "proposal_id": str(approved_proposal.id),
-                                "proposal_type": "conclusion",
-                                "event_id": str(criterion.event_id),
-                                "approved_by": None  # 자동 승인
-                            },
-                            target_event_id=criterion.event_id
-                        )
-                # commit은 외부 트랜잭션 매니저가 처리
+        return event, proposal
 
     def _apply_conclusion_proposal(
         self, proposal: ConclusionProposal, event: Event
     ) -> None:
         """
         제안을 실제 Criterion의 conclusion에 적용
+        - 기준 조회/refresh 없이 적용 표시(applied_at = DB 시각)와 결론 설정을 단일 문장으로 수행
         """
-        criterion = self.repos.criterion.get_by_id(proposal.criterion_id)
-        if criterion:
-            criterion.conclusion = proposal.proposal_content
-            self.repos.criterion.update_criterion(criterion, proposal.created_by)
-
-        proposal.applied_at = datetime.now(timezone.utc)
-        self.repos.proposal.update_conclusion_proposal(proposal)
+        self.repos.proposal.apply_conclusion_proposal(proposal)
 
     # ============================================================================
     # Admin Proposal Status Update Methods
@@ -1453,74 +1152,8 @@ class ProposalService(EventBaseService):
         user_id: UUID,
         idempotency_key: str | None = None
     ) -> AssumptionProposalResponse:
-        """
-        전제 제안 상태 변경 (관리자용)
-        - 관리자 권한 확인
-        - PENDING 상태만 변경 가능
-        - ACCEPTED 시 제안 적용
-        """
-        def _execute_update() -> dict:
-            def validate_proposal_belongs_to_event(proposal, eid):
-                if proposal.event_id != eid:
-                    raise NotFoundError(
-                        message="Proposal not found",
-                        detail="Proposal does not belong to this event"
-                    )
-
-            def create_outbox_event(proposal, event, st):
-                if self.outbox_repo:
-                    event_type = "proposal.approved.v1" if st == ProposalStatusType.ACCEPTED else "proposal.rejected.v1"
-                    key = "approved_by" if st == ProposalStatusType.ACCEPTED else "rejected_by"
-                    payload = {
-                        "proposal_id": str(proposal.id),
-                        "proposal_type": "assumption",
-                        "event_id": str(proposal.event_id),
-                        key: str(user_id)
-                    }
-                    self.outbox_repo.create_outbox_event(event_type=event_type, payload=payload, target_event_id=proposal.event_id)
-            
-            def build_response(proposal, uid):
-                vote_count = len(proposal.votes) if proposal.votes else 0
-                has_voted = any(vote.created_by == uid for vote in (proposal.votes or []))
-                return AssumptionProposalResponse(
-                    id=proposal.id,
-                    event_id=proposal.event_id,
-                    assumption_id=proposal.assumption_id,
-                    proposal_status=proposal.proposal_status,
-                    proposal_category=proposal.proposal_category,
-                    proposal_content=proposal.proposal_content,
-                    reason=proposal.reason,
-                    created_at=proposal.created_at,
-                    created_by=proposal.created_by,
-                    vote_count=vote_count,
-                    has_voted=has_voted
-                ).model_dump()
-            
-            return self.approval_usecase.update_status(
-                event_id=event_id,
-                proposal_id=proposal_id,
-                status=status,
-                user_id=user_id,
-                verify_admin_fn=self.verify_admin,
-                get_proposal_fn=lambda pid: self.repos.proposal.get_assumption_proposal_by_id(pid),
-                validate_proposal_belongs_to_event_fn=validate_proposal_belongs_to_event,
-                approve_if_pending_fn=self.repos.proposal.approve_assumption_proposal_if_pending,
-                reject_if_pending_fn=self.repos.proposal.reject_assumption_proposal_if_pending,
-                apply_proposal_fn=self._apply_assumption_proposal,
-                build_response_fn=build_response,
-                create_outbox_event_fn=create_outbox_event,
-            )
-        
-        # Idempotency 적용
-        result = self.idempotency_wrapper.wrap(
-            idempotency_key=idempotency_key,
-            user_id=user_id,
-            method="PATCH",
-            path=f"/events/{event_id}/assumption-proposals/{proposal_id}/status",
-            body={"status": status.value},
-            fn=_execute_update
-        )
-        return AssumptionProposalResponse(**result)
+        """전제 제안 상태 변경 (관리자용)"""
+        return self._update_proposal_status(_ASSUMPTION, event_id, proposal_id, status, user_id, idempotency_key)
 
     def update_criteria_proposal_status(
         self,
@@ -1530,74 +1163,8 @@ class ProposalService(EventBaseService):
         user_id: UUID,
         idempotency_key: str | None = None
     ) -> CriteriaProposalResponse:
-        """
-        기준 제안 상태 변경 (관리자용)
-        - 관리자 권한 확인
-        - PENDING 상태만 변경 가능
-        - ACCEPTED 시 제안 적용
-        """
-        def _execute_update() -> dict:
-            def validate_proposal_belongs_to_event(proposal, eid):
-                if proposal.event_id != eid:
-                    raise NotFoundError(
-                        message="Proposal not found",
-                        detail="Proposal does not belong to this event"
-                    )
-
-            def create_outbox_event(proposal, event, st):
-                if self.outbox_repo:
-                    event_type = "proposal.approved.v1" if st == ProposalStatusType.ACCEPTED else "proposal.rejected.v1"
-                    key = "approved_by" if st == ProposalStatusType.ACCEPTED else "rejected_by"
-                    payload = {
-                        "proposal_id": str(proposal.id),
-                        "proposal_type": "criteria",
-                        "event_id": str(proposal.event_id),
-                        key: str(user_id)
-                    }
-                    self.outbox_repo.create_outbox_event(event_type=event_type, payload=payload, target_event_id=proposal.event_id)
-            
-            def build_response(proposal, uid):
-                vote_count = len(proposal.votes) if proposal.votes else 0
-                has_voted = any(vote.created_by == uid for vote in (proposal.votes or []))
-                return CriteriaProposalResponse(
-                    id=proposal.id,
-                    event_id=proposal.event_id,
-                    criteria_id=proposal.criteria_id,
-                    proposal_status=proposal.proposal_status,
-                    proposal_category=proposal.proposal_category,
-                    proposal_content=proposal.proposal_content,
-                    reason=proposal.reason,
-                    created_at=proposal.created_at,
-                    created_by=proposal.created_by,
-                    vote_count=vote_count,
-                    has_voted=has_voted
-                ).model_dump()
-            
-            return self.approval_usecase.update_status(
-                event_id=event_id,
-                proposal_id=proposal_id,
-                status=status,
-                user_id=user_id,
-                verify_admin_fn=self.verify_admin,
-                get_proposal_fn=lambda pid: self.repos.proposal.get_criteria_proposal_by_id(pid),
-                validate_proposal_belongs_to_event_fn=validate_proposal_belongs_to_event,
-                approve_if_pending_fn=self.repos.proposal.approve_criteria_proposal_if_pending,
-                reject_if_pending_fn=self.repos.proposal.reject_criteria_proposal_if_pending,
-                apply_proposal_fn=self._apply_criteria_proposal,
-                build_response_fn=build_response,
-                create_outbox_event_fn=create_outbox_event,
-            )
-        
-        # Idempotency 적용
-        result = self.idempotency_wrapper.wrap(
-            idempotency_key=idempotency_key,
-            user_id=user_id,
-            method="PATCH",
-            path=f"/events/{event_id}/criteria-proposals/{proposal_id}/status",
-            body={"status": status.value},
-            fn=_execute_update
-        )
-        return CriteriaProposalResponse(**result)
+        """기준 제안 상태 변경 (관리자용)"""
+        return self._update_proposal_status(_CRITERIA, event_id, proposal_id, status, user_id, idempotency_key)
 
     def update_conclusion_proposal_status(
         self,
@@ -1607,71 +1174,50 @@ class ProposalService(EventBaseService):
         user_id: UUID,
         idempotency_key: str | None = None
     ) -> ConclusionProposalResponse:
+        """결론 제안 상태 변경 (관리자용)"""
+        return self._update_proposal_status(_CONCLUSION, event_id, proposal_id, status, user_id, idempotency_key)
+
+    def _update_proposal_status(
+        self,
+        kind: str,
+        event_id: UUID,
+        proposal_id: UUID,
+        status: ProposalStatusType,
+        user_id: UUID,
+        idempotency_key: str | None
+    ):
         """
-        결론 제안 상태 변경 (관리자용)
+        제안 상태 변경 공통 디스패처 (타입별 차이는 _STATUS_UPDATE_SPECS 조회)
         - 관리자 권한 확인
         - PENDING 상태만 변경 가능
         - ACCEPTED 시 제안 적용
         """
-        def _execute_update() -> dict:
-            def validate_proposal_belongs_to_event(proposal, eid):
-                # criterion을 통해 event_id 확인
-                criterion = self.repos.criterion.get_by_id(proposal.criterion_id)
-                if not criterion or criterion.event_id != eid:
-                    raise NotFoundError(
-                        message="Proposal not found",
-                        detail="Proposal does not belong to this event"
-                    )
+        spec = _STATUS_UPDATE_SPECS[kind]
+        proposal_repo = self.repos.proposal
 
-            def create_outbox_event(proposal, event, st):
-                if self.outbox_repo:
-                    event_type = "proposal.approved.v1" if st == ProposalStatusType.ACCEPTED else "proposal.rejected.v1"
-                    key = "approved_by" if st == ProposalStatusType.ACCEPTED else "rejected_by"
-                    criterion = self.repos.criterion.get_by_id(proposal.criterion_id)
-                    payload = {
-                        "proposal_id": str(proposal.id),
-                        "proposal_type": "conclusion",
-                        "event_id": str(criterion.event_id) if criterion else None,
-                        key: str(user_id)
-                    }
-                    self.outbox_repo.create_outbox_event(event_type=event_type, payload=payload, target_event_id=criterion.event_id if criterion else None)
-            
-            def build_response(proposal, uid):
-                vote_count = len(proposal.votes) if proposal.votes else 0
-                has_voted = any(vote.created_by == uid for vote in (proposal.votes or []))
-                return ConclusionProposalResponse(
-                    id=proposal.id,
-                    criterion_id=proposal.criterion_id,
-                    proposal_status=proposal.proposal_status,
-                    proposal_content=proposal.proposal_content,
-                    created_at=proposal.created_at,
-                    created_by=proposal.created_by,
-                    vote_count=vote_count,
-                    has_voted=has_voted
-                ).model_dump()
-            
+        def _execute_update():
             return self.approval_usecase.update_status(
                 event_id=event_id,
                 proposal_id=proposal_id,
                 status=status,
                 user_id=user_id,
-                verify_admin_fn=self.verify_admin,
-                get_proposal_fn=lambda pid: self.repos.proposal.get_conclusion_proposal_by_id(pid),
-                validate_proposal_belongs_to_event_fn=validate_proposal_belongs_to_event,
-                approve_if_pending_fn=self.repos.proposal.approve_conclusion_proposal_if_pending,
-                reject_if_pending_fn=self.repos.proposal.reject_conclusion_proposal_if_pending,
-                apply_proposal_fn=self._apply_conclusion_proposal,
-                build_response_fn=build_response,
-                create_outbox_event_fn=create_outbox_event,
+                verify_admin_fn=self._verify_admin_cached,
+                get_proposal_for_event_fn=getattr(proposal_repo, spec.get_fn),
+                approve_if_pending_fn=getattr(proposal_repo, spec.approve_fn),
+                reject_if_pending_fn=getattr(proposal_repo, spec.reject_fn),
+                # 거절 경로는 적용 단계가 없으므로 적용 함수 바인딩도 생략
+                apply_proposal_fn=getattr(self, spec.apply_fn) if status == ProposalStatusType.ACCEPTED else None,
+                build_response_fn=spec.build_response_fn,
+                create_outbox_event_fn=self._emit_status_events[kind],
             )
-        
+
         # Idempotency 적용
-        result = self.idempotency_wrapper.wrap(
+        return self.idempotency_wrapper.wrap(
             idempotency_key=idempotency_key,
             user_id=user_id,
             method="PATCH",
-            path=f"/events/{event_id}/conclusion-proposals/{proposal_id}/status",
-            body={"status": status.value},
-            fn=_execute_update
+            path=f"/events/{event_id}/{spec.path_segment}/{proposal_id}/status",
+            body=_STATUS_IDEMPOTENCY_BODY[status],
+            fn=_execute_update,
+            response_model=spec.response_cls
         )
-        return ConclusionProposalResponse(**result)
@@ -119,7 +119,7 @@ class VoteService(EventBaseService):
     ) -> VoteResponse:
         """투표 생성 또는 업데이트 (upsert 패턴)"""
         # 기존 로직을 내부 함수로 추출
-        def _execute_vote() -> dict:
+        def _execute_vote() -> VoteResponse:
             # 이벤트 조회 및 ACCEPTED 멤버십 확인
             event = self.get_event_with_all_relations(event_id)
             self._validate_membership_accepted(user_id, event_id, "vote")
@@ -226,14 +226,13 @@ class VoteService(EventBaseService):
                 
                 self.vote_repo.create_criterion_priorities(new_criterion_priorities)
             
-            # 응답 반환 (dict 형태로 변환)
-            response = VoteResponse(
+            # 응답 모델 그대로 반환 (Idempotency 저장 시에만 서비스가 JSON으로 직렬화)
+            return VoteResponse(
                 option_id=new_option_vote.option_id,
                 criterion_order=criterion_ids,
                 created_at=new_option_vote.created_at,
                 updated_at=now
             )
-            return response.model_dump()
         
         # Idempotency 적용
         if self.idempotency_service and idempotency_key:
@@ -251,11 +250,11 @@ class VoteService(EventBaseService):
                 body=body,
                 fn=_execute_vote
             )
-            return VoteResponse(**result)
+            # 저장된 JSON 응답을 응답 모델로 복원
+            return VoteResponse.model_validate(result)
         else:
-            # Idempotency가 없으면 기존 로직 실행
-            result = _execute_vote()
-            return VoteResponse(**result)
+            # Idempotency가 없으면 응답 모델을 그대로 반환 (dict 직렬화/재검증 없음)
+            return _execute_vote()
     
     def get_vote_result(
         self,
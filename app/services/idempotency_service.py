@@ -18,9 +18,16 @@ class IdempotencyService:
     
     DEFAULT_TTL = timedelta(hours=24)
     
-    def __init__(self, db: Session, idempotency_repo: IdempotencyRepository):
+    def __init__(
+        self,
+        db: Session,
+        idempotency_repo: IdempotencyRepository,
+        default_ttl: timedelta | None = None
+    ):
         self.db = db
         self.idempotency_repo = idempotency_repo
+        # run()에 ttl을 넘기지 않은 요청에 적용 (미지정 시 DEFAULT_TTL)
+        self.default_ttl = default_ttl or self.DEFAULT_TTL
     
     def _to_json_serializable(self, value: Any) -> Any:
         """
@@ -109,7 +116,7 @@ class IdempotencyService:
         - 최초 요청 시 실제 유스케이스 실행 후 성공 응답 저장
         """
         if ttl is None:
-            ttl = self.DEFAULT_TTL
+            ttl = self.default_ttl
         
         # 요청 시그니처 계산
         request_hash = self.compute_request_hash(method, path, body)
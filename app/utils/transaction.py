@@ -1,9 +1,13 @@
 from contextlib import contextmanager
+from typing import TYPE_CHECKING
 from sqlalchemy.orm import Session
 
+if TYPE_CHECKING:
+    from app.repositories.outbox_repository import OutboxRepository
+
 
 @contextmanager
-def transaction(db: Session):
+def transaction(db: Session, outbox_repo: "OutboxRepository | None" = None):
     """
     트랜잭션 컨텍스트 매니저
     
@@ -17,10 +21,16 @@ def transaction(db: Session):
         - 정상 종료 시 commit() 실행
         - 예외 발생 시 rollback() 후 예외 재발생
         - 서비스는 직접 commit하지 않음 (매니저가 처리)
+        - outbox_repo를 넘기면 commit 직전에 버퍼된 outbox 이벤트를 일괄 INSERT
+          (rollback 시 버퍼는 폐기)
     """
     try:
         yield db
+        if outbox_repo is not None:
+            outbox_repo.flush_buffered_events()
         db.commit()
     except Exception:
+        if outbox_repo is not None:
+            outbox_repo.clear_buffered_events()
         db.rollback()
         raise
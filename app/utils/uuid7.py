@@ -0,0 +1,41 @@
+"""시간순 정렬 가능한 UUID (UUIDv7, RFC 9562) 생성"""
+import os
+import threading
+import time
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    """
+    UUIDv7 생성
+    - 상위 48비트: Unix 밀리초 타임스탬프 → 생성 순서대로 정렬됨
+    - rand_a 12비트: 같은 밀리초 안에서 증가하는 카운터 (프로세스 내 단조 증가)
+    - rand_b 62비트: 난수
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = 0
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # 카운터가 넘치면 타임스탬프를 1ms 앞당겨 순서 유지
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms = _last_ms
+        counter = _counter
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    value = (
+        (timestamp_ms << 80)
+        | (0x7 << 76)
+        | (counter << 64)
+        | (0b10 << 62)
+        | rand_b
+    )
+    return UUID(int=value)
@@ -1,24 +1,61 @@
 import time
 import signal
 from datetime import datetime, timedelta, timezone
+from typing import Callable
+import psycopg
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session
 
-from app.db import get_db
+from app.db import DATABASE_URL, get_db
 from app.repositories.outbox_repository import OutboxRepository, get_worker_id
 from app.utils.transaction import transaction
 
 
+# outbox_events INSERT 트리거가 pg_notify하는 채널 (migrations: trg_outbox_events_notify)
+OUTBOX_NOTIFY_CHANNEL = "outbox"
+# LISTEN 연결 재시도 간격 상한 (초, 끊긴 동안은 poll_interval 폴링으로 동작)
+LISTEN_RECONNECT_MAX_BACKOFF = 60
+
+
+def open_listen_connection():
+    """
+    outbox 알림 수신용 전용 psycopg 연결 (autocommit, LISTEN 등록)
+    - DATABASE_URL이 없으면 None (폴링만 사용)
+    - 연결 실패 시 psycopg.OperationalError
+    """
+    if not DATABASE_URL:
+        return None
+    # 풀 연결은 반납 시 LISTEN이 풀리므로 엔진 풀과 별도로 연결 (SQLAlchemy URL → libpq URL)
+    conninfo = make_url(DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+    conn = psycopg.connect(conninfo, autocommit=True)
+    conn.execute(f"LISTEN {OUTBOX_NOTIFY_CHANNEL}")
+    return conn
+
+
 class OutboxWorker:
-    def __init__(self, db: Session, batch_size: int = 10, poll_interval: int = 5):
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int = 10,
+        poll_interval: int = 5,
+        listen_conn_factory: Callable[[], psycopg.Connection | None] | None = None
+    ):
         self.db = db
         self.repos = OutboxRepository(db)
         self.batch_size = batch_size
+        # 알림 대기 최대 시간 (재시도 예약(next_retry_at)·누락 알림은 이 주기로 회수)
         self.poll_interval = poll_interval
+        # LISTEN 연결 생성 함수 (None이면 poll_interval 간격 폴링만 사용)
+        self.listen_conn_factory = listen_conn_factory
+        # LISTEN 중인 psycopg 연결 (대기 시점에 열고, 끊기면 백오프 후 다시 엶)
+        self.listen_conn = None
+        self._listen_backoff = 0
+        self._listen_retry_at = 0.0
         self.worker_id = get_worker_id()
         self.running = True
     
-    def process_batch(self) -> None:
-        """한 배치 처리"""
+    def process_batch(self) -> int:
+        """한 배치 처리 (선점한 이벤트 수 반환)"""
         now = datetime.now(timezone.utc)
         
         # 1. 트랜잭션 시작
@@ -59,6 +96,60 @@ class OutboxWorker:
                     if not can_retry:
                         # 최대 시도 횟수 초과 → 로깅/알림 필요
                         print(f"Event {event.id} failed after max attempts")
+        
+        return len(events)
+    
+    def _ensure_listen_conn(self) -> bool:
+        """
+        LISTEN 연결 확보 (없으면 재시도 시각이 지났을 때만 새로 연결)
+        - 연결할 수 없으면 False (이번 대기는 폴링)
+        """
+        if self.listen_conn is not None:
+            return True
+        if self.listen_conn_factory is None or time.monotonic() < self._listen_retry_at:
+            return False
+        try:
+            self.listen_conn = self.listen_conn_factory()
+        except psycopg.OperationalError as e:
+            self._schedule_listen_reconnect(e)
+            return False
+        if self.listen_conn is None:
+            # DATABASE_URL이 없는 환경: 이후로는 폴링만 사용
+            self.listen_conn_factory = None
+            return False
+        self._listen_backoff = 0
+        return True
+    
+    def _schedule_listen_reconnect(self, error: Exception) -> None:
+        """LISTEN 연결을 닫고 지수 백오프로 다음 재연결 시각 예약"""
+        if self.listen_conn is not None:
+            self.listen_conn.close()
+            self.listen_conn = None
+        self._listen_backoff = min(
+            self._listen_backoff * 2 or self.poll_interval, LISTEN_RECONNECT_MAX_BACKOFF
+        )
+        self._listen_retry_at = time.monotonic() + self._listen_backoff
+        print(f"LISTEN connection unavailable, polling for {self._listen_backoff}s: {error}")
+    
+    def _wait_for_events(self) -> None:
+        """
+        다음 배치까지 대기
+        - LISTEN 연결이 있으면 INSERT 알림이 오는 즉시 깨어남 (최대 poll_interval 대기)
+        - 대기 중 쌓인 알림은 한 번에 비워 배치 하나로 처리
+        - 연결이 끊기면 닫고 백오프 후 재연결하며, 그동안은 poll_interval 간격 폴링
+        """
+        if not self._ensure_listen_conn():
+            time.sleep(self.poll_interval)
+            return
+        try:
+            for _ in self.listen_conn.notifies(timeout=self.poll_interval, stop_after=1):
+                pass
+            # 이미 도착해 있는 나머지 알림은 기다리지 않고 소진
+            for _ in self.listen_conn.notifies(timeout=0):
+                pass
+        except psycopg.OperationalError as e:
+            self._schedule_listen_reconnect(e)
+            time.sleep(self.poll_interval)
     
     def run(self) -> None:
         """워커 메인 루프"""
@@ -69,12 +160,17 @@ class OutboxWorker:
         
         while self.running:
             try:
-                self.process_batch()
+                claimed = self.process_batch()
             except Exception as e:
                 print(f"Error processing batch: {e}")
+                claimed = 0
             
-            time.sleep(self.poll_interval)
+            # 배치가 가득 찼으면 남은 이벤트가 있을 수 있으므로 대기 없이 바로 다음 배치
+            if claimed < self.batch_size:
+                self._wait_for_events()
         
+        if self.listen_conn is not None:
+            self.listen_conn.close()
         print("Outbox worker stopped")
     
     def _handle_shutdown(self, signum, frame):
@@ -86,5 +182,7 @@ class OutboxWorker:
 if __name__ == "__main__":
     # 별도 프로세스로 실행
     db = next(get_db())
-    worker = OutboxWorker(db, batch_size=10, poll_interval=5)
+    worker = OutboxWorker(
+        db, batch_size=10, poll_interval=5, listen_conn_factory=open_listen_connection
+    )
     worker.run()
@@ -0,0 +1,74 @@
+"""add accepted_member_count to events
+
+Revision ID: 3f9a1c7d2b64
+Revises: c686ecae9db2
+Create Date: 2026-01-22 02:41:17.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c7d2b64'
+down_revision: Union[str, Sequence[str], None] = 'c686ecae9db2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. 컬럼 추가 (기본값 0)
+    op.add_column(
+        'events',
+        sa.Column('accepted_member_count', sa.Integer(), server_default='0', nullable=False)
+    )
+
+    # 2. 트리거 생성부터 백필 커밋까지 멤버십 쓰기를 막음
+    # (그 사이 커밋된 멤버십 변경이 백필과 트리거 양쪽에서 빠지거나 이중 반영되지 않도록)
+    op.execute("LOCK TABLE event_memberships IN SHARE ROW EXCLUSIVE MODE")
+
+    # 3. 멤버십 변경 시 같은 트랜잭션에서 카운트를 갱신하는 트리거
+    # (서비스, dev 라우터 등 모든 경로의 INSERT/UPDATE/DELETE를 커버)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_event_accepted_member_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.membership_status = 'ACCEPTED' THEN
+                UPDATE events
+                SET accepted_member_count = accepted_member_count - 1
+                WHERE id = OLD.event_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.membership_status = 'ACCEPTED' THEN
+                UPDATE events
+                SET accepted_member_count = accepted_member_count + 1
+                WHERE id = NEW.event_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_event_memberships_accepted_count
+        AFTER INSERT OR DELETE OR UPDATE OF membership_status, event_id ON event_memberships
+        FOR EACH ROW EXECUTE FUNCTION sync_event_accepted_member_count()
+    """)
+
+    # 4. 기존 데이터 마이그레이션: ACCEPTED 멤버십 수로 채움 (트리거 생성 후, 잠금 안에서)
+    op.execute("""
+        UPDATE events e
+        SET accepted_member_count = (
+            SELECT COUNT(*)
+            FROM event_memberships m
+            WHERE m.event_id = e.id
+              AND m.membership_status = 'ACCEPTED'
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_event_memberships_accepted_count ON event_memberships")
+    op.execute("DROP FUNCTION IF EXISTS sync_event_accepted_member_count()")
+    op.drop_column('events', 'accepted_member_count')
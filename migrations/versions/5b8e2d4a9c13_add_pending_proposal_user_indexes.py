@@ -0,0 +1,52 @@
+"""add pending proposal user indexes
+
+Revision ID: 5b8e2d4a9c13
+Revises: 3f9a1c7d2b64
+Create Date: 2026-01-22 05:12:48.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e2d4a9c13'
+down_revision: Union[str, Sequence[str], None] = '3f9a1c7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 제안 생성 시 중복 체크(사용자별 PENDING 제안 조회)용 부분 인덱스
+    # PENDING 행만 포함하므로 승인/거절된 제안이 쌓여도 인덱스 크기가 커지지 않음
+    op.create_index(
+        'idx_assumption_proposals_pending_user',
+        'assumption_proposals',
+        ['created_by', 'event_id', 'assumption_id'],
+        unique=False,
+        postgresql_where=sa.text("proposal_status = 'PENDING'")
+    )
+    op.create_index(
+        'idx_criteria_proposals_pending_user',
+        'criteria_proposals',
+        ['created_by', 'event_id', 'criteria_id'],
+        unique=False,
+        postgresql_where=sa.text("proposal_status = 'PENDING'")
+    )
+    op.create_index(
+        'idx_conclusion_proposals_pending_user',
+        'conclusion_proposals',
+        ['created_by', 'criterion_id'],
+        unique=False,
+        postgresql_where=sa.text("proposal_status = 'PENDING'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_conclusion_proposals_pending_user', table_name='conclusion_proposals')
+    op.drop_index('idx_criteria_proposals_pending_user', table_name='criteria_proposals')
+    op.drop_index('idx_assumption_proposals_pending_user', table_name='assumption_proposals')
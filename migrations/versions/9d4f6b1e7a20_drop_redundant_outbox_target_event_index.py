@@ -0,0 +1,30 @@
+"""drop redundant outbox target_event_id index
+
+Revision ID: 9d4f6b1e7a20
+Revises: 5b8e2d4a9c13
+Create Date: 2026-01-22 06:03:11.842915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f6b1e7a20'
+down_revision: Union[str, Sequence[str], None] = '5b8e2d4a9c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # target_event_id 단일 컬럼 인덱스는 idx_outbox_target_event_id(target_event_id, id)의
+    # 선두 컬럼과 중복되므로 제거 (outbox INSERT마다 갱신되는 인덱스 하나 감소)
+    op.drop_index(op.f('ix_outbox_events_target_event_id'), table_name='outbox_events')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_outbox_events_target_event_id'), 'outbox_events', ['target_event_id'], unique=False)
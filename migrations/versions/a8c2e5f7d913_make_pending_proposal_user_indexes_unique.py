@@ -0,0 +1,87 @@
+"""make pending proposal user indexes unique
+
+Revision ID: a8c2e5f7d913
+Revises: d4f1b7e9a352
+Create Date: 2026-01-22 13:37:05.842219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c2e5f7d913'
+down_revision: Union[str, Sequence[str], None] = 'd4f1b7e9a352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (기존 일반 부분 인덱스, 새 유니크 부분 인덱스, 테이블, 컬럼, NULLS NOT DISTINCT 여부)
+# assumption_id/criteria_id는 CREATION 제안에서 NULL이므로 NULL끼리도 중복으로 취급해야 기존 중복 체크와 같아짐
+_INDEXES = [
+    ('idx_assumption_proposals_pending_user', 'uq_assumption_proposals_pending_user',
+     'assumption_proposals', ['created_by', 'event_id', 'assumption_id'], True),
+    ('idx_criteria_proposals_pending_user', 'uq_criteria_proposals_pending_user',
+     'criteria_proposals', ['created_by', 'event_id', 'criteria_id'], True),
+    ('idx_conclusion_proposals_pending_user', 'uq_conclusion_proposals_pending_user',
+     'conclusion_proposals', ['created_by', 'criterion_id'], False),
+]
+
+
+def _reject_duplicate_pending(table: str, columns: list[str]) -> None:
+    """
+    키별로 가장 오래된 PENDING 제안만 남기고 나머지를 REJECTED로 정리
+    - PARTITION BY는 NULL끼리 같은 그룹으로 묶으므로 NULLS NOT DISTINCT 인덱스와 같은 기준
+    """
+    partition = ", ".join(columns)
+    op.execute(f"""
+        UPDATE {table} p
+        SET proposal_status = 'REJECTED'
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY {partition} ORDER BY created_at, id) AS rn
+            FROM {table}
+            WHERE proposal_status = 'PENDING'
+        ) d
+        WHERE p.id = d.id
+          AND d.rn > 1
+          AND p.proposal_status = 'PENDING'
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 사용자별 PENDING 제안 중복을 DB에서 보장 (INSERT ... ON CONFLICT DO NOTHING의 중재 인덱스)
+    # 제안 테이블 쓰기 잠금을 피하기 위해 CONCURRENTLY로 생성 후 기존 인덱스 제거 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for old_name, new_name, table, columns, nulls_not_distinct in _INDEXES:
+            # 이미 중복된 PENDING 제안이 있으면 유니크 인덱스 생성이 실패하므로 먼저 정리
+            _reject_duplicate_pending(table, columns)
+            # 이전 시도에서 CONCURRENTLY 생성이 실패하면 INVALID 인덱스가 남으므로 지우고 다시 생성
+            op.drop_index(new_name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                new_name,
+                table,
+                columns,
+                unique=True,
+                postgresql_where=sa.text("proposal_status = 'PENDING'"),
+                postgresql_nulls_not_distinct=nulls_not_distinct,
+                postgresql_concurrently=True
+            )
+            op.drop_index(old_name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for old_name, new_name, table, columns, _ in _INDEXES:
+            op.create_index(
+                old_name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text("proposal_status = 'PENDING'"),
+                postgresql_concurrently=True
+            )
+            op.drop_index(new_name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""add event_memberships accepted partial index
+
+Revision ID: b6c3e8f1d427
+Revises: e2a7c9f3b518
+Create Date: 2026-01-22 09:14:31.508126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6c3e8f1d427'
+down_revision: Union[str, Sequence[str], None] = 'e2a7c9f3b518'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 멤버십 테이블 쓰기 잠금을 피하기 위해 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        # ACCEPTED 멤버 수 집계(count_accepted_members, 참가자 수 일괄 조회)용 부분 인덱스
+        op.create_index(
+            'idx_event_memberships_event_accepted',
+            'event_memberships',
+            ['event_id'],
+            unique=False,
+            postgresql_where=sa.text("membership_status = 'ACCEPTED'"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_event_memberships_event_accepted',
+            table_name='event_memberships',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,44 @@
+"""add outbox insert notify trigger
+
+Revision ID: d4f1b7e9a352
+Revises: b6c3e8f1d427
+Create Date: 2026-01-22 11:02:47.194366
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f1b7e9a352'
+down_revision: Union[str, Sequence[str], None] = 'b6c3e8f1d427'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # outbox INSERT 시 워커를 깨우는 NOTIFY (commit 시점에 전달되므로 rollback된 이벤트는 알리지 않음)
+    # 행 단위가 아닌 문장 단위 트리거: 버퍼 일괄 INSERT 한 번에 NOTIFY 한 번
+    # (워커는 알림을 받으면 배치 선점 쿼리로 대기 이벤트를 한꺼번에 가져가므로 행 id는 페이로드에 싣지 않음)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_outbox_events_inserted() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('outbox', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_outbox_events_notify
+        AFTER INSERT ON outbox_events
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_outbox_events_inserted()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_outbox_events_notify ON outbox_events")
+    op.execute("DROP FUNCTION IF EXISTS notify_outbox_events_inserted()")
@@ -0,0 +1,56 @@
+"""add outbox pending partial index
+
+Revision ID: e2a7c9f3b518
+Revises: 9d4f6b1e7a20
+Create Date: 2026-01-22 07:26:54.117302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c9f3b518'
+down_revision: Union[str, Sequence[str], None] = '9d4f6b1e7a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 운영 중인 outbox 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성/삭제 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        # 워커 선점 쿼리(status = 'PENDING' ORDER BY created_at)용 부분 인덱스
+        op.create_index(
+            'idx_outbox_pending_created_at',
+            'outbox_events',
+            ['created_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'PENDING'"),
+            postgresql_concurrently=True
+        )
+        # 전체 행을 인덱싱하던 (status, next_retry_at) 인덱스는 위 부분 인덱스로 대체
+        op.drop_index(
+            'idx_outbox_status_next_retry',
+            table_name='outbox_events',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_outbox_status_next_retry',
+            'outbox_events',
+            ['status', 'next_retry_at'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_outbox_pending_created_at',
+            table_name='outbox_events',
+            postgresql_concurrently=True
+        )
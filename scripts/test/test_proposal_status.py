@@ -200,6 +200,82 @@ class ProposalStatusAPITester(BaseAPITester):
             self.print_result(False, str(e))
             return False
     
+    def test_proposal_vote_and_status_no_lazy_load(self) -> bool:
+        """
+        투표 생성/삭제 → 상태 변경 흐름 (3종 제안)
+        - 제안 조회는 raiseload('*')로 필요한 관계만 로드하므로, 응답/적용 경로가 다른 관계에 접근하면
+          지연 로드 대신 예외가 발생해 500이 됨 (N+1 회귀 확인)
+        """
+        self.print_test("투표/상태 변경 경로 지연 로드 회귀 확인")
+        
+        # 완전히 설정된 이벤트 준비 (제안 생성은 IN_PROGRESS 상태에서만 가능)
+        self.setup_complete_event(start_event=True)
+        
+        from scripts.test.test_event_detail import EventDetailAPITester
+        detail_tester = EventDetailAPITester(
+            self.base_url,
+            self.admin_headers.get("Authorization", "").replace("Bearer ", ""),
+            self.user_headers.get("Authorization", "").replace("Bearer ", "")
+        )
+        # 상태 공유
+        detail_tester.event_id = self.event_id
+        detail_tester.entrance_code = self.entrance_code
+        detail_tester.event_status = self.event_status
+        detail_tester.option_ids = self.option_ids
+        detail_tester.criterion_ids = self.criterion_ids
+        detail_tester.assumption_ids = self.assumption_ids
+        
+        # (경로, proposal_ids 키, 제안 생성 함수)
+        cases = [
+            ("assumption-proposals", "assumption_creation", detail_tester.test_assumption_proposal_create),
+            ("criteria-proposals", "criteria_modification", detail_tester.test_criteria_proposal_create),
+            ("conclusion-proposals", "conclusion", detail_tester.test_conclusion_proposal_create),
+        ]
+        
+        try:
+            for path, key, create_proposal in cases:
+                # 새 PENDING 제안 생성 (user로)
+                detail_tester.proposal_ids.pop(key, None)
+                create_proposal()
+                proposal_id = detail_tester.proposal_ids.get(key)
+                assert proposal_id, f"{path}: 제안 ID가 없습니다"
+                base = f"{self.base_url}/v1/events/{self.event_id}/{path}/{proposal_id}"
+                
+                # 투표 생성 (제안 + 이벤트 조회, 자동 승인 판정)
+                response = requests.post(
+                    f"{base}/votes",
+                    headers={**self.user_headers, "Idempotency-Key": self.generate_idempotency_key()}
+                )
+                self.assert_response(
+                    response, 201, required_fields=["vote_id", "vote_count"],
+                    error_message=f"{path} 투표 생성 실패 (500이면 지연 로드 접근 의심)"
+                )
+                
+                # 투표 삭제
+                response = requests.delete(f"{base}/votes", headers=self.user_headers)
+                self.assert_response(
+                    response, 200, required_fields=["vote_id", "vote_count"],
+                    error_message=f"{path} 투표 삭제 실패 (500이면 지연 로드 접근 의심)"
+                )
+                
+                # 관리자 상태 변경 (거절: 제안 적용 없이 조회/응답 경로만 확인)
+                response = requests.patch(
+                    f"{base}/status",
+                    headers={**self.admin_headers, "Idempotency-Key": self.generate_idempotency_key()},
+                    json={"status": "REJECTED"}
+                )
+                data = self.assert_response(
+                    response, 200, required_fields=["id", "proposal_status"],
+                    error_message=f"{path} 상태 변경 실패 (500이면 지연 로드 접근 의심)"
+                )
+                assert data["proposal_status"] == "REJECTED", f"{path}: 제안 상태가 REJECTED여야 합니다"
+            
+            self.print_result(True, "투표 생성/삭제 및 상태 변경에서 지연 로드 오류 없음")
+            return True
+        except Exception as e:
+            self.print_result(False, str(e))
+            return False
+    
     # 에러 케이스 테스트
     def test_assumption_proposal_status_update_error_not_admin(self) -> bool:
         """PATCH /v1/events/{event_id}/assumption-proposals/{proposal_id}/status - 관리자 아님 에러"""
@@ -709,6 +785,7 @@ class ProposalStatusAPITester(BaseAPITester):
         results["assumption_status_update"] = safe_run("test_assumption_proposal_status_update", self.test_assumption_proposal_status_update)
         results["criteria_status_update"] = safe_run("test_criteria_proposal_status_update", self.test_criteria_proposal_status_update)
         results["conclusion_status_update"] = safe_run("test_conclusion_proposal_status_update", self.test_conclusion_proposal_status_update)
+        results["vote_and_status_no_lazy_load"] = safe_run("test_proposal_vote_and_status_no_lazy_load", self.test_proposal_vote_and_status_no_lazy_load)
         
         # 에러 케이스
         results["assumption_status_update_error_not_admin"] = safe_run("test_assumption_proposal_status_update_error_not_admin", self.test_assumption_proposal_status_update_error_not_admin)